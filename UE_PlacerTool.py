@@ -9,38 +9,84 @@ import unreal
 import sys
 import copy
 import random
-import math
+import time
+
+# ============================
+# Asset Placer Tool Modules
+# ============================
+import UE_PlacerTool_Planner as planner
+import UE_PlacerTool_Engine as engine
+
+# ============================
+# Tool Constants
+# ============================
+SPAWN_CHUNK_SIZE = 200   # Placements spawned per Qt timer slice during Generate
+TOOL_WINDOW_NAME = "ToolWindow"   # objectName launchWindow() finds the tool's window by
 
 # ============================
 # PySide6 (Qt for Unreal UI)
 # ============================
 from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (QApplication, QWidget, QDockWidget, 
     QMainWindow, QPushButton, QVBoxLayout, QListWidget, QLabel, 
-    QFormLayout, QSpinBox, QDoubleSpinBox, QHBoxLayout, QCheckBox
+    QFormLayout, QSpinBox, QDoubleSpinBox, QHBoxLayout, QCheckBox,
+    QProgressBar, QComboBox
     )
 
+# ============================
+# Session-backed Window State
+# ============================
+class _SessionField:
+    """Window attribute that reads and writes the same-named field of the window's PlacerSession."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj.Session, self.name)
+
+    def __set__(self, obj, value):
+        setattr(obj.Session, self.name, value)
+
 # ============================
 # Python Tool Class
 # ============================
 class AssetPlacerToolWindow(QWidget):
-    def __init__(self, parent=None):
+    # ---- State kept in the editor-wide session (survives closing the window) ----
+    Generation_Log = _SessionField()
+    Generation_Count = _SessionField()
+    Spline_Store = _SessionField()
+    Asset_File_Paths = _SessionField()
+    Asset_Parameters = _SessionField()
+    Selected_Spline = _SessionField()
+    Selected_Spline_Path = _SessionField()
+    Selected_Splines = _SessionField()
+    Selected_Spline_Paths = _SessionField()
+    Spline_Cache = _SessionField()
+    Asset_Cache = _SessionField()
+
+    def __init__(self, parent=None, session=None):
         super().__init__(parent)
 
         # ---- Data/state ----
+        self._init_session(session)
         self._init_generation_data()
-        self._init_asset_data()
 
         # ---- UI ----
+        # The parameter dock and the generation log are built on demand
+        # (_ensure_param_dock / _ensure_generation_log) so opening the
+        # tool only pays for the widgets the first screen shows.
         self._init_main_window()
-        self._init_left_dock()      # Spline + Asset List + Generation Log
-        self._init_param_dock()     # Parameters panel
+        self._init_left_dock()      # Spline + Asset List (+ Generation Log slot)
         self._init_bottom_dock()    # Generate / Apply buttons
 
         # ---- Signals & defaults ----
         self._connect_signals()
         self._init_default_states()
+        self._restore_session_ui()
 
     #------------------------------
     # Math / Vector Utility Functions
@@ -57,7 +103,7 @@ class AssetPlacerToolWindow(QWidget):
         Returns:
             float: The interpolated result between a and b.
         """
-        return a + (b - a) * t
+        return planner.lerp(a, b, t)
     
     def lerp_tuple(self, a: tuple, b: tuple, t: float) -> tuple:
         """
@@ -71,16 +117,15 @@ class AssetPlacerToolWindow(QWidget):
         Returns:
             tuple: Interpolated (x, y, z) values.
         """
-        return (self.lerp(a[0], b[0], t),
-                self.lerp(a[1], b[1], t),
-                self.lerp(a[2], b[2], t))
+        return planner.lerp_tuple(a, b, t)
 
     def sample_at_distance(self, distance: float, distances: list, positions: list, directions: list) -> tuple:
         """
         Samples a position and direction along the spline at a given distance.
 
-        Performs linear interpolation between spline points to calculate the
-        world-space location and normalized direction at the specified distance.
+        Thin wrapper over UE_PlacerTool_Planner.sample_at_distance(), which
+        finds the segment by bisection. Callers walking the spline in
+        ascending order should prefer planner.SplineCursor.
 
         Args:
             distance (float): The target distance along the spline.
@@ -91,27 +136,7 @@ class AssetPlacerToolWindow(QWidget):
         Returns:
             tuple: (position, direction) — both as 3D tuples.
         """
-        if distance <= distances[0]:
-            return positions[0], directions[0]
-        if distance >= distances[-1]:
-            return positions[-1], directions[-1]
-
-        idx = 0
-        while idx < len(distances) - 1 and not (distances[idx] <= distance <= distances[idx + 1]):
-            idx += 1
-
-        d0, d1 = distances[idx], distances[idx + 1]
-        seg_len = d1 - d0 if (d1 - d0) != 0 else 1e-6
-        t = (distance - d0) / seg_len
-
-        pos = self.lerp_tuple(positions[idx], positions[idx + 1], t)
-        dirv = self.lerp_tuple(directions[idx], directions[idx + 1], t)
-
-        mag = math.sqrt(dirv[0]**2 + dirv[1]**2 + dirv[2]**2)
-        if mag > 1e-6:
-            dirv = (dirv[0]/mag, dirv[1]/mag, dirv[2]/mag)
-
-        return pos, dirv
+        return planner.sample_at_distance(distance, distances, positions, directions)
 
     def rotator_from_direction(self, dir_vec: tuple) -> unreal.Rotator:
         """
@@ -126,17 +151,8 @@ class AssetPlacerToolWindow(QWidget):
         Returns:
             unreal.Rotator: The corresponding pitch/yaw rotation.
         """
-        x, y, z = dir_vec
-        mag_xy = math.hypot(x, y)
-
-        if mag_xy < 1e-6:
-            yaw = 0.0
-            pitch = 90.0 if z > 0 else -90.0
-        else:
-            yaw = math.degrees(math.atan2(y, x))
-            pitch = math.degrees(math.atan2(z, mag_xy))
-
-        return unreal.Rotator(pitch, yaw, 0.0)
+        pitch, yaw = planner.pitch_yaw_from_direction(dir_vec)
+        return unreal.Rotator(0.0, pitch, yaw)
 
     def to_vector(self, t: tuple) -> unreal.Vector:
         """
@@ -171,17 +187,26 @@ class AssetPlacerToolWindow(QWidget):
     # -----------------------------
     # Data/State Init
     # -----------------------------
-    def _init_generation_data(self):
-        """Initialize generation logs and counters."""
-        self.Generation_Log = {}     # { "Generation N": {...} }
-        self.Generation_Count = 0
+    def _init_session(self, session=None):
+        """
+        Attach the window to a PlacerSession.
+
+        Generation log, asset list, spline selection and caches are read
+        and written through it (see the _SessionField attributes), so they
+        outlive this window.
+
+        Args:
+            session (engine.PlacerSession): Session to use; the editor-wide one if None.
+        """
+        self.Session = session if session is not None else engine.get_session()
 
-    def _init_asset_data(self):
-        """Initialize in-memory structures for assets and parameters."""
-        self.Asset_File_Paths = {}   # { asset_name: asset_path }
-        self.Asset_Parameters = {}   # { asset_name: {param:value,...} }
-        self.Selected_Spline = None  # Level component reference
-        self.Selected_Spline_Path = {}  # Serialized spline data
+    def _init_generation_data(self):
+        """Initialize the per-window logger and Generate job state."""
+        self.Logger = planner.PlacerLogger(planner.LOG_SUMMARY, unreal.log, unreal.log_warning)
+        self._spawn_job = None       # State of the chunked spawn pass while Generate runs
+        self._spawn_queue = []       # Splines still waiting to be generated: [{"spline_path", "seed"}]
+        self._generate_setup = None  # Assets/options shared by every spline of one Generate
+        self._locked_widgets = {}    # { widget: enabled state } saved while Generate runs
 
     # -----------------------------
     # Main Window
@@ -264,7 +289,32 @@ class AssetPlacerToolWindow(QWidget):
         asset_row_layout.addLayout(button_column)
         asset_row.setLayout(asset_row_layout)
 
-        # --- Generation Log (header + list + delete) ---
+        # --- Generation Log slot (widgets built by _ensure_generation_log) ---
+        self.GenerationLogLayout = QVBoxLayout()
+
+        # --- Compose Left layout ---
+        left_layout.addWidget(spline_header)
+        left_layout.addWidget(self.SplineButton)
+        left_layout.addWidget(header_row)
+        left_layout.addWidget(asset_row)
+        left_layout.addLayout(self.GenerationLogLayout)
+        left_layout.addStretch(1)
+        left_container.setLayout(left_layout)
+
+        self.Left_Dock.setWidget(left_container)
+        self.mainwindow.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.Left_Dock)
+
+        # Hook up the random/sequence mutual exclusion (existing function you already have)
+        self.ConnectRandomSequenceToggle()
+
+    # -----------------------------
+    # Generation Log (built on demand)
+    # -----------------------------
+    def _ensure_generation_log(self):
+        """Build the Generation Log header, list and Delete button the first time they are needed."""
+        if hasattr(self, "GenerationLogList"):
+            return
+
         self.GenerationLogHeader = QLabel("Generation Log")
         self.GenerationLogHeader.setStyleSheet("font-weight: bold; font-size: 10pt; padding: 1px;")
         self.GenerationLogHeader.setVisible(False)
@@ -280,29 +330,37 @@ class AssetPlacerToolWindow(QWidget):
         self.DeleteGeneration.setToolTip("Deletes in level generation and removes from log")
         self.DeleteGeneration.setVisible(False)
 
-        self.GenerationLogLayout = QVBoxLayout()
         self.GenerationLogLayout.addWidget(self.GenerationLogHeader)
         self.GenerationLogLayout.addWidget(self.GenerationLogList)
         self.GenerationLogLayout.addWidget(self.DeleteGeneration)
 
-        # --- Compose Left layout ---
-        left_layout.addWidget(spline_header)
-        left_layout.addWidget(self.SplineButton)
-        left_layout.addWidget(header_row)
-        left_layout.addWidget(asset_row)
-        left_layout.addLayout(self.GenerationLogLayout)
-        left_layout.addStretch(1)
-        left_container.setLayout(left_layout)
+        self.GenerationLogList.itemSelectionChanged.connect(self.OnGenerationSelected)
+        self.DeleteGeneration.clicked.connect(self.Delete)
 
-        self.Left_Dock.setWidget(left_container)
-        self.mainwindow.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.Left_Dock)
+    def _refresh_generation_log(self):
+        """List the session's generations and show the log UI only while there are any."""
+        self._ensure_generation_log()
+        self.GenerationLogList.clear()
+        for gen in self.Generation_Log.keys():
+            self.GenerationLogList.addItem(gen)
 
-        # Hook up the random/sequence mutual exclusion (existing function you already have)
-        self.ConnectRandomSequenceToggle()
+        has_logs = len(self.Generation_Log) > 0
+        self.GenerationLogHeader.setVisible(has_logs)
+        self.GenerationLogList.setVisible(has_logs)
+        self.DeleteGeneration.setVisible(has_logs)
+        self.ApplyButton.setVisible(has_logs)
 
     # -----------------------------
-    # Right Dock: Parameters
+    # Right Dock: Parameters (built on demand)
     # -----------------------------
+    def _ensure_param_dock(self):
+        """Build, wire and grey out the parameter dock the first time an asset needs it."""
+        if hasattr(self, "Param_Dock"):
+            return
+        self._init_param_dock()
+        self._connect_param_signals()
+        self._init_param_default_states()
+
     def _init_param_dock(self):
         """Build the right-side parameter dock."""
         self.Param_Dock = QDockWidget("Parameters", self)
@@ -500,12 +558,44 @@ class AssetPlacerToolWindow(QWidget):
     # Bottom Dock: Buttons
     # -----------------------------
     def _init_bottom_dock(self):
-        """Build the bottom bar with Generate/Apply buttons."""
+        """Build the bottom bar with the seed, overlap/log toggles and Generate/Apply buttons."""
         self.Bottom_Widget = QWidget()
         bottom_layout = QHBoxLayout()
         bottom_layout.setContentsMargins(8, 8, 8, 8)
         bottom_layout.addStretch(1)
 
+        self.Seed_spin = QSpinBox()
+        self._setup_spinboxes([self.Seed_spin], size=(90, 20), rng=(0, 2 ** 31 - 1), value=0)
+        self.Seed_spin.setSpecialValueText("Random Seed")
+        self.Seed_spin.setToolTip("Seed for this generation's random values (Random Seed picks a new one)")
+        bottom_layout.addWidget(self.Seed_spin)
+
+        self.AvoidOverlap_Checkbox = QCheckBox("Avoid Overlap")
+        self.AvoidOverlap_Checkbox.setToolTip("Predicts each asset's bounds and moves it along the spline until it no longer overlaps")
+        self.AvoidOverlap_Checkbox.setChecked(True)
+        bottom_layout.addWidget(self.AvoidOverlap_Checkbox)
+
+        self.VerboseLog_Checkbox = QCheckBox("Verbose Log")
+        self.VerboseLog_Checkbox.setToolTip("Writes a per-placement trace to the Output Log after each run")
+        self.VerboseLog_Checkbox.stateChanged.connect(
+            lambda checked: setattr(self.Logger, "level", planner.LOG_VERBOSE if checked else planner.LOG_SUMMARY)
+        )
+        bottom_layout.addWidget(self.VerboseLog_Checkbox)
+
+        self.Profile_Checkbox = QCheckBox("Profile")
+        self.Profile_Checkbox.setToolTip("Times every engine call and planner step of Generate/Apply (slightly slower)")
+        self.Profile_Checkbox.stateChanged.connect(lambda checked: setattr(self.Logger, "profile", bool(checked)))
+        bottom_layout.addWidget(self.Profile_Checkbox)
+
+        self.Output_Combo = QComboBox()
+        self.Output_Combo.addItems(["Actors", "Instances", "Foliage"])
+        self.Output_Combo.setToolTip(
+            "Actors: one actor per asset\n"
+            "Instances: instanced mesh components on one actor per generation\n"
+            "Foliage: foliage instances through a FoliageType per asset"
+        )
+        bottom_layout.addWidget(self.Output_Combo)
+
         self.GenerateButton = QPushButton("Generate")
         self.GenerateButton.setToolTip("Generates assets in Asset List following parameters on the given Spline")
 
@@ -517,8 +607,29 @@ class AssetPlacerToolWindow(QWidget):
             b.setFixedWidth(100)
             bottom_layout.addWidget(b)
 
+        self.Generate_Progress = QProgressBar()
+        self.Generate_Progress.setFixedSize(140, 20)
+        self.Generate_Progress.setFormat("%v / %m")
+        self.Generate_Progress.setVisible(False)
+        bottom_layout.addWidget(self.Generate_Progress)
+
+        self.CancelButton = QPushButton("Cancel")
+        self.CancelButton.setToolTip("Stops the running generation and removes the assets spawned so far")
+        self.CancelButton.setFixedWidth(75)
+        self.CancelButton.setVisible(False)
+        bottom_layout.addWidget(self.CancelButton)
+
         bottom_layout.addStretch(1)
-        self.Bottom_Widget.setLayout(bottom_layout)
+
+        self.Profile_Label = QLabel("")
+        self.Profile_Label.setStyleSheet("color: gray;")
+        self.Profile_Label.setVisible(False)
+
+        bottom_column = QVBoxLayout()
+        bottom_column.setContentsMargins(0, 0, 0, 0)
+        bottom_column.addLayout(bottom_layout)
+        bottom_column.addWidget(self.Profile_Label)
+        self.Bottom_Widget.setLayout(bottom_column)
 
         bottom_dock = QDockWidget("", self)
         bottom_dock.setTitleBarWidget(QWidget())
@@ -540,10 +651,13 @@ class AssetPlacerToolWindow(QWidget):
         self.RemoveFileButton.clicked.connect(self.OnRemoveFile)
         self.AssetList_Widget.currentItemChanged.connect(self.OnAssetSelected)
 
-        # Generation log
-        self.GenerationLogList.itemSelectionChanged.connect(self.OnGenerationSelected)
-        self.DeleteGeneration.clicked.connect(self.Delete)
+        # Bottom buttons
+        self.GenerateButton.clicked.connect(self.Generate)
+        self.ApplyButton.clicked.connect(self.Apply)
+        self.CancelButton.clicked.connect(self.CancelGenerate)
 
+    def _connect_param_signals(self):
+        """Wire up the parameter dock's signal/slot connections."""
         # Parameters change storage & tooltips
         for w in (
             self.Quantity_spin, self.Quantity_spin_max,
@@ -567,14 +681,15 @@ class AssetPlacerToolWindow(QWidget):
         self.Scale_Range_Checkbox.checkStateChanged.connect(self.ParametersToolTipToggle)
         self.Rotation_Range_Checkbox.checkStateChanged.connect(self.ParametersToolTipToggle)
 
-        # Bottom buttons
-        self.GenerateButton.clicked.connect(self.Generate)
-        self.ApplyButton.clicked.connect(self.Apply)
-
     # -----------------------------
     # Default Disabled (Greyed) State
     # -----------------------------
     def _init_default_states(self):
+        """Disable Apply until a generation is selected, and apply grey styling."""
+        self.ApplyButton.setEnabled(False)
+        self.ApplyButton.setStyleSheet("color: gray; background-color: #2a2a2a;")
+
+    def _init_param_default_states(self):
         """Disable parameter widgets until an asset is selected, and apply grey styling."""
         disabled_style = "color: gray; background-color: #2a2a2a;"
         to_disable = [self.Quantity_spin, self.Quantity_Range_Checkbox, self.Quantity_spin_max,
@@ -583,12 +698,38 @@ class AssetPlacerToolWindow(QWidget):
                     self.Scale_x_max, self.Scale_y_max, self.Scale_z_max,
                     self.Rotation_x, self.Rotation_y, self.Rotation_z, self.Rotation_Range_Checkbox,
                     self.Rotation_x_max, self.Rotation_y_max, self.Rotation_z_max,
-                    self.Scatter_double, self.Scale_Range_Checkbox, self.ApplyButton
+                    self.Scatter_double, self.Scale_Range_Checkbox
                     ]
         for w in to_disable:
             w.setEnabled(False)
             w.setStyleSheet(disabled_style)
 
+    # -----------------------------
+    # Session Restore
+    # -----------------------------
+    def _restore_session_ui(self):
+        """
+        Repopulate the widgets from session state left by an earlier window.
+
+        A fresh session has nothing to show, so this costs nothing on the
+        first launch; after a rebuild the asset list, spline button and
+        Generation Log come back exactly as the previous window left them.
+        """
+        self._set_asset_list(self.Asset_File_Paths)
+
+        try:
+            if len(self.Selected_Splines) == 1:
+                self.SplineButton.setText(f"{self.Selected_Splines[0].get_name()}")
+            elif self.Selected_Splines:
+                self.SplineButton.setText(f"{len(self.Selected_Splines)} Splines")
+        except Exception:
+            # The selected actors went away with the level; keep "<none>"
+            self.Selected_Spline = None
+            self.Selected_Splines = []
+
+        if self.Generation_Log:
+            self._refresh_generation_log()
+
     # -----------------------------
     # Spline Selection
     # -----------------------------
@@ -600,6 +741,10 @@ class AssetPlacerToolWindow(QWidget):
         in the Unreal level viewport and assigns it as the active spline 
         for generation. If no spline is selected or the selected object 
         is not a spline, it displays a warning in the Unreal Output Log.
+
+        Every selected actor with a SplineComponent is kept in
+        `self.Selected_Splines`, so one Generate can dress all of them;
+        the first one stays the active spline for Apply.
         """
         # Get the editor actor subsystem
         editorActorSubsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
@@ -611,12 +756,17 @@ class AssetPlacerToolWindow(QWidget):
             return
         
         # Loop Through selected actors
-        for actor in actors:
-            # Check if Actor has SplineComponent
-            spline_components = actor.get_components_by_class(unreal.SplineComponent)
-            if spline_components:
-                self.Selected_Spline = actor
-                self.SplineButton.setText(f"{actor.get_name()}")
+        splines = [actor for actor in actors if actor.get_components_by_class(unreal.SplineComponent)]
+        if not splines:
+            unreal.log_warning("No selected actor has a SplineComponent.")
+            return
+
+        self.Selected_Splines = splines
+        self.Selected_Spline = splines[0]
+        if len(splines) == 1:
+            self.SplineButton.setText(f"{splines[0].get_name()}")
+        else:
+            self.SplineButton.setText(f"{len(splines)} Splines")
         
         unreal.log("Spline Select Button Clicked!")
 
@@ -635,74 +785,48 @@ class AssetPlacerToolWindow(QWidget):
         The data is stored in `self.Selected_Spline_Path` for use by 
         Generate() and Apply(), allowing precise placement of assets 
         along the spline's shape.
+
+        Extractions are cached per spline component and re-used while the
+        component's fingerprint (actor path, point count, length and world
+        transform) is unchanged, so re-selecting a spline is instant.
+
+        With several splines selected, each one is extracted into
+        `self.Selected_Spline_Paths`; `self.Selected_Spline_Path` holds the first.
         """
         #Ensure we have a spline actor selected
         if not self.Selected_Spline:
             unreal.log_warning("No spline actor selected")
             return
-        
-        #Get spline component (Draw Spline Tool actors use SplineComponent)
-        spline_components = self.Selected_Spline.get_components_by_class(unreal.SplineComponent)
-        if not spline_components:
-            unreal.log_warning("Selected Actor has no SplineComponent")
-            return
-        
-        spline = spline_components[0] #Use the first spline component found
-
-        num_points = spline.get_number_of_spline_points()
-        num_segments = num_points - 1
-        total_length = spline.get_spline_length()
-
-        spline_data = {
-            "Actor Name": self.Selected_Spline.get_name(),
-            "Number of Points": num_points,
-            "Number of Segments": num_segments,
-            "Total Spline Length":total_length,
-            "Point Data": [] # Will hold dictionaries per spline point
-        }
 
-        for i in range(num_points):
-            #World-space location of this spline point
-            location = spline.get_location_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
-            rotation = spline.get_rotation_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
-            tangent = spline.get_tangent_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
-
-            #Distance along spline to this point
-            distance = spline.get_distance_along_spline_at_spline_point(i)
-
-            #Direction (normalised forward vector)
-            direction = spline.get_direction_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
-
-            #Store in structured format
-            spline_data["Point Data"].append({
-                "index": i,
-                "Distance Along Spline": distance,
-                "World Location": (location.x, location.y, location.z),
-                "Rotation": (rotation.roll, rotation.pitch, rotation.yaw),
-                "Tangent": (tangent.x, tangent.y, tangent.z),
-                "Direction": (direction.x, direction.y, direction.z)
-            })
-
-        #Procedural Spacing calculations (e.g., every X units)
-        step = total_length / max(num_segments * 10, 1) #adjustable density
-        sampled_positions = []
-        sampled_rotations = []
-
-        d = 0.0
-        while d <= total_length:
-            pos = spline.get_location_at_distance_along_spline(d, unreal.SplineCoordinateSpace.WORLD)
-            rot = spline.get_rotation_at_distance_along_spline(d, unreal.SplineCoordinateSpace.WORLD)
-            sampled_positions.append((pos.x, pos.y, pos.z))
-            sampled_rotations.append((rot.roll, rot.pitch, rot.yaw))
-            d += step
-
-        spline_data["Sampled Locations"] = sampled_positions
-        spline_data["Sampled Rotations"] = sampled_rotations
+        spline_paths = []
+        for actor in (self.Selected_Splines or [self.Selected_Spline]):
+            #Get spline component (Draw Spline Tool actors use SplineComponent)
+            spline_components = actor.get_components_by_class(unreal.SplineComponent)
+            if not spline_components:
+                unreal.log_warning(f"{actor.get_name()} has no SplineComponent")
+                continue
+
+            spline = spline_components[0] #Use the first spline component found
+
+            #Re-use the cached extraction unless the spline changed since it was read
+            spline_paths.append(self.Spline_Cache.get(actor, spline))
+
+        if not spline_paths:
+            return
 
         #Store it 
-        self.Selected_Spline_Path = spline_data
-        
-        unreal.log(f"Spline Data Cached for {spline_data['Actor Name']}: {num_points} points, {num_segments} segments, length {total_length:.2f}")
+        self.Selected_Spline_Paths = spline_paths
+        self.Selected_Spline_Path = spline_paths[0]
+
+        spline_data = spline_paths[0]
+        if len(spline_paths) == 1:
+            num_points = spline_data["Number of Points"]
+            num_segments = spline_data["Number of Segments"]
+            total_length = spline_data["Total Spline Length"]
+            unreal.log(f"Spline Data Cached for {spline_data['Actor Name']}: {num_points} points, {num_segments} segments, length {total_length:.2f}")
+        else:
+            total_length = sum(sp["Total Spline Length"] for sp in spline_paths)
+            unreal.log(f"Spline Data Cached for {len(spline_paths)} splines, combined length {total_length:.2f}")
 
         return spline_data
 
@@ -792,6 +916,7 @@ class AssetPlacerToolWindow(QWidget):
 
         if not current:
             return
+        self._ensure_param_dock()
 
         boxes = [self.Quantity_spin, self.Quantity_Range_Checkbox, self.Quantity_spin_max,
                     self.Spacing_double, self.Spacing_Range_Checkbox, self.Spacing_double_max,
@@ -849,7 +974,7 @@ class AssetPlacerToolWindow(QWidget):
                 "quantity_range" :self.Quantity_Range_Checkbox.isChecked(),
                 "spacing" : self.Spacing_double.value(),
                 "spacing_max": self.Spacing_double_max.value(),
-                "spacing_range" : self.Scale_Range_Checkbox.isChecked(),
+                "spacing_range" : self.Spacing_Range_Checkbox.isChecked(),
                 "scale" : [self.Scale_x.value(), self.Scale_y.value(), self.Scale_z.value()],
                 "scale_max" : [self.Scale_x_max.value(), self.Scale_y_max.value(), self.Scale_z_max.value()],
                 "scale_range" : self.Scale_Range_Checkbox.isChecked(),
@@ -941,6 +1066,22 @@ class AssetPlacerToolWindow(QWidget):
 
         self.RemoveFileButton.setVisible(self.AssetList_Widget.count() > 0)
 
+    def _set_asset_list(self, asset_paths: dict):
+        """
+        Replace the Asset List with the given assets.
+
+        `self.Asset_File_Paths` and the list widget are rebuilt together from
+        the same mapping, so they always name the same assets in the same order.
+
+        Args:
+            asset_paths (dict): { asset_name: asset_path } in list order.
+        """
+        self.Asset_File_Paths = dict(asset_paths)
+        self.AssetList_Widget.clear()
+        for asset_name in self.Asset_File_Paths:
+            self.AssetList_Widget.addItem(asset_name)
+        self.UpdateRemoveButtonVisibility()
+
     # -----------------------------
     # Add Asset from Content Browser
     # -----------------------------
@@ -973,6 +1114,8 @@ class AssetPlacerToolWindow(QWidget):
                 self.AssetList_Widget.addItem(asset_name)
                 #Store Path in Dictionary
                 self.Asset_File_Paths[asset_name] = asset_path
+                #Re-adding an asset picks up any edits made since it was cached
+                self.Asset_Cache.invalidate(asset_path)
                 self.UpdateRemoveButtonVisibility()
 
     # -----------------------------
@@ -988,9 +1131,15 @@ class AssetPlacerToolWindow(QWidget):
 
         current = self.AssetList_Widget.currentItem()
         if current:
+            asset_name = current.text()
             self.AssetList_Widget.takeItem(self.AssetList_Widget.row(current))
+            self.Asset_File_Paths.pop(asset_name, None)
+            self.Asset_Parameters.pop(asset_name, None)
         self.UpdateRemoveButtonVisibility()
 
+        if not hasattr(self, "Param_Dock"):
+            return
+
         boxes = [self.Quantity_spin, self.Quantity_Range_Checkbox, self.Quantity_spin_max,
                     self.Spacing_double, self.Spacing_Range_Checkbox, self.Spacing_double_max,
                     self.Scale_x, self.Scale_y, self.Scale_z, self.Scale_Range_Checkbox,
@@ -1008,102 +1157,58 @@ class AssetPlacerToolWindow(QWidget):
     # -----------------------------
     # Generation Log Management
     # -----------------------------
-    def UpdateGenerationLog(self, spawned_actors, assets, asset_file_paths):
+    def _next_generation_name(self) -> str:
+        """Return the first free "Generation N" name in the Generation Log."""
+        return self.Session.next_generation_name()
+
+    def UpdateGenerationLog(self, spawned_actors, assets, asset_file_paths, spline_path=None):
         """
         Logs all data from a completed generation into self.Generation_Log.
         Stores asset parameters, file paths, spawn locations, and level references.
-        """
-        # --- Safety Cleanup ---
-        # Remove invalid or empty entries before logging a new generation
-        invalid_gens = [k for k, v in self.Generation_Log.items() if not v or "Spawned Assets" not in v]
-        for g in invalid_gens:
-            del self.Generation_Log[g]
-
-        # --- Unique Generation Naming ---
-        base_name = "Generation"
-        index = 1
-        while f"{base_name} {index}" in self.Generation_Log:
-            index += 1
-        gen_name = f"{base_name} {index}"
-
-        # --- Build Log Entry ---
-        log_entry = {
-            "Spline": None,
-            "Asset List": {},
-            "Parameters": {},
-            "Spawned Assets": {},
-            "Spawn Locations": {},
-        }
-
-        # --- Store spline data ---
-        if hasattr(self, "Selected_Spline_Path") and self.Selected_Spline_Path:
-            try:
-                log_entry["Spline"] = copy.deepcopy(self.Selected_Spline_Path)
-                unreal.log(f"[Generation Log] Stored spline data for {gen_name}.")
-            except Exception as e:
-                unreal.log_warning(f"[UpdateGenerationLog] Failed to store spline data: {e}")
-        else:
-            unreal.log_warning(f"[UpdateGenerationLog] No spline data found for {gen_name}.")
 
-        # --- Asset List ---
-        for asset in assets:
-            asset_name = asset["name"]
-            asset_path = asset_file_paths.get(asset_name, "Unknown Path")
-            log_entry["Asset List"][asset_name] = asset_path
+        The record itself is built by PlacerSession.record_generation() (the
+        batch runner records through it too); this hands over the spawn
+        pass's `_last_spawn_*` data and refreshes the log UI.
 
-        # --- Parameters ---
-        for asset in assets:
-            asset_name = asset["name"]
-            params = asset["params"].copy()
-            log_entry["Parameters"][asset_name] = dict(params)
+        Args:
+            spline_path (dict): Spline the generation was placed along
+                (defaults to `self.Selected_Spline_Path`).
 
-        # --- Spawned Actors ---
-        for actor in spawned_actors:
-            if not actor:
-                continue
-            try:
-                actor_label = actor.get_actor_label()
-                actor_path = actor.get_path_name()
-                actor_loc = actor.get_actor_location()
-                log_entry["Spawned Assets"][actor_label] = actor_path
-                log_entry["Spawn Locations"][actor_label] = [actor_loc.x, actor_loc.y, actor_loc.z]
-            except Exception as e:
-                unreal.log_warning(f"[UpdateGenerationLog] Failed to log actor: {e}")
+        Returns:
+            str: The new generation's name (e.g. "Generation 3").
+        """
+        if spline_path is None:
+            spline_path = getattr(self, "Selected_Spline_Path", None)
 
-        # --- Spawn order & distances ---
+        spawn = {}
         try:
             if hasattr(self, "_last_spawn_order"):
-                log_entry["Spawn Order"] = list(self._last_spawn_order)
-            else:
-                log_entry["Spawn Order"] = [a.get_actor_label() for a in spawned_actors if unreal.Object.is_valid(a)]
-
+                spawn["Order"] = self._last_spawn_order
             if hasattr(self, "_last_spawn_distances"):
-                log_entry["Spawn Distances"] = dict(self._last_spawn_distances)
-            else:
-                log_entry["Spawn Distances"] = {}
+                spawn["Distances"] = self._last_spawn_distances
+            if hasattr(self, "_last_spawn_placements"):
+                spawn["Placements"] = self._last_spawn_placements
+            spawn["Seed"] = getattr(self, "_last_spawn_seed", None)
+            if hasattr(self, "_last_spawn_instances"):
+                spawn["Output"] = self._last_spawn_instances
         finally:
             if hasattr(self, "_last_spawn_order"):
                 del self._last_spawn_order
             if hasattr(self, "_last_spawn_distances"):
                 del self._last_spawn_distances
+            if hasattr(self, "_last_spawn_placements"):
+                del self._last_spawn_placements
+            if hasattr(self, "_last_spawn_seed"):
+                del self._last_spawn_seed
+            if hasattr(self, "_last_spawn_instances"):
+                del self._last_spawn_instances
 
-        # --- Add to dictionary ---
-        self.Generation_Log[gen_name] = log_entry
-        self.Generation_Count = len(self.Generation_Log)
-        unreal.log(f"[Generation Log] Added {gen_name} with {len(spawned_actors)} spawned assets.")
+        gen_name = self.Session.record_generation(spawned_actors, assets, asset_file_paths, spline_path, spawn)
 
         # --- Update UI ---
-        if hasattr(self, "GenerationLogHeader") and hasattr(self, "GenerationLogList") and hasattr(self, "DeleteGeneration"):
-            self.GenerationLogList.clear()
-            for gen in self.Generation_Log.keys():
-                self.GenerationLogList.addItem(gen)
-
-            # Show or hide log UI dynamically
-            has_logs = len(self.Generation_Log) > 0
-            self.GenerationLogHeader.setVisible(has_logs)
-            self.GenerationLogList.setVisible(has_logs)
-            self.DeleteGeneration.setVisible(has_logs)
-            self.ApplyButton.setVisible(has_logs)
+        self._refresh_generation_log()
+
+        return gen_name
 
     # -----------------------------
     # Generation Selection Handling
@@ -1116,6 +1221,7 @@ class AssetPlacerToolWindow(QWidget):
         enables the Apply button so users can modify the selected generation.
         """
 
+        self._ensure_param_dock()
         disabled_style = "color: gray; background-color: #2a2a2a;"
         to_disable = [self.Quantity_spin, self.Quantity_Range_Checkbox, self.Quantity_spin_max,
                       self.Random_Checkbox, self.InSequence_Checkbox
@@ -1137,15 +1243,14 @@ class AssetPlacerToolWindow(QWidget):
             return
         
         #Restore spline (just visually or keep reference)
-        self.Selected_Spline_Path = gen_data.get("Spline", None)
+        self.Selected_Spline_Path = self.Spline_Store.get(gen_data.get("Spline Key"))
+        self.Selected_Spline_Paths = [self.Selected_Spline_Path] if self.Selected_Spline_Path else []
 
-        #Repopulate asset list Widget
-        self.AssetList_Widget.clear()
-        for asset_name in gen_data["Asset List"].keys():
-            self.AssetList_Widget.addItem(asset_name)
+        #Repopulate asset list Widget (and the paths it resolves to)
+        self._set_asset_list(gen_data["Asset List"])
 
-        #Restore Parameter dictionary
-        self.Asset_Parameters = gen_data["Parameters"]
+        #Restore Parameter dictionary (copied, so Apply can diff edits against the stored values)
+        self.Asset_Parameters = copy.deepcopy(gen_data["Parameters"])
 
         #Disable Unapplicable Parameters
         for w in to_disable:
@@ -1159,26 +1264,21 @@ class AssetPlacerToolWindow(QWidget):
     # -----------------------------
     # Actor Retrieval Utility
     # -----------------------------
-    def GetActorByPath(self, path_or_label: str):
+    def GetActorByPath(self, path_or_label: str, actor_index=None):
         """
         Finds an actor in the current level by matching its label or path name.
         Safe replacement for deprecated get_actor_reference().
-        """
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        all_actors = actor_subsystem.get_all_level_actors()
 
-        # Try to match by exact path first
-        for actor in all_actors:
-            if actor.get_path_name() == path_or_label:
-                return actor
-
-        # Fallback: match by actor label
-        for actor in all_actors:
-            if actor.get_actor_label() == path_or_label:
-                return actor
+        Pass a shared engine.ActorIndex when looking up many actors in one
+        operation so the level is scanned once rather than per lookup.
+        """
+        if actor_index is None:
+            actor_index = engine.ActorIndex()
 
-        unreal.log_warning(f"[GetActorByPath] Could not find actor for '{path_or_label}'")
-        return None
+        actor = actor_index.find(path_or_label)
+        if actor is None:
+            unreal.log_warning(f"[GetActorByPath] Could not find actor for '{path_or_label}'")
+        return actor
     
     # -----------------------------
     # Asset Placement Calculation
@@ -1232,6 +1332,12 @@ class AssetPlacerToolWindow(QWidget):
         Removes all spawned actors associated with the selected generation 
         from the level and clears their references from `self.Generation_Log`.
         Updates the Generation Log list to reflect the deletion.
+
+        All actors are destroyed with one batched call inside a single
+        undo transaction, so one Ctrl+Z restores the whole generation.
+        Foliage generations have their instances removed in one transaction
+        the same way; their FoliageType assets are kept so the undo has
+        something to restore (they stay in engine.FOLIAGE_TYPE_FOLDER).
         """
 
         if not self.Generation_Log:
@@ -1254,40 +1360,35 @@ class AssetPlacerToolWindow(QWidget):
 
         gen_data = self.Generation_Log[selected_gen]
         spawned_assets = gen_data.get("Spawned Assets", {})
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        destroyed_count = 0
 
-        # --- Destroy all actors belonging to this generation ---
-        for label, path in spawned_assets.items():
+        # --- Foliage generations own no actors: clear their foliage types instead ---
+        if gen_data.get("Output Mode") == "Foliage":
+            foliage_types = list(gen_data.get("Instance Components", {}).values())
             try:
-                all_actors = actor_subsystem.get_all_level_actors()
-                target = next((a for a in all_actors if a.get_actor_label() == label or a.get_path_name() == path), None)
+                engine.remove_foliage_types(foliage_types, f"Delete {selected_gen}")
+            except Exception as e:
+                unreal.log_warning(f"[Delete] Failed to remove foliage of {selected_gen}: {e}")
+            destroyed_count = 0
+        else:
+            # --- Destroy all actors belonging to this generation in one transaction ---
+            targets = engine.collect_generation_actors(gen_data)
+            if len(targets) < len(spawned_assets):
+                unreal.log_warning(f"[Delete] {len(spawned_assets) - len(targets)} actors of {selected_gen} not found in level.")
 
-                if target:
-                    actor_subsystem.destroy_actor(target)
-                    destroyed_count += 1
-                else:
-                    unreal.log_warning(f"[Delete] Actor '{label}' not found in level.")
+            try:
+                destroyed_count = engine.destroy_actors_bulk(targets, f"Delete {selected_gen}")
             except Exception as e:
-                unreal.log_warning(f"[Delete] Failed to destroy '{label}': {e}")
+                destroyed_count = 0
+                unreal.log_warning(f"[Delete] Failed to destroy actors of {selected_gen}: {e}")
 
         # --- Remove generation from dictionary ---
         if selected_gen in self.Generation_Log:
+            self.Spline_Store.release(gen_data.get("Spline Key"))
             del self.Generation_Log[selected_gen]
 
-        # --- Update generation count and refresh UI ---
+        # --- Update generation count and refresh UI (hidden if no generations remain) ---
         self.Generation_Count = len(self.Generation_Log)
-        self.GenerationLogList.clear()
-
-        for gen in self.Generation_Log.keys():
-            self.GenerationLogList.addItem(gen)
-
-        # --- Hide UI if no generations remain ---
-        has_logs = len(self.Generation_Log) > 0
-        self.GenerationLogHeader.setVisible(has_logs)
-        self.GenerationLogList.setVisible(has_logs)
-        self.DeleteGeneration.setVisible(has_logs)
-        self.ApplyButton.setVisible(has_logs)
+        self._refresh_generation_log()
 
         unreal.log(f"[Delete] Deleted {destroyed_count} actors from {selected_gen}. Remaining generations: {len(self.Generation_Log)}.")
 
@@ -1300,9 +1401,16 @@ class AssetPlacerToolWindow(QWidget):
 
         Updates transforms, scales, rotations, scatter, and spacing.
         Keeps actor alignment stable across multiple applies.
+
+        Only the work the change requires is done: parameters are diffed
+        per asset and per field against the generation's stored values,
+        untouched actors are skipped, and a spacing change only re-chains
+        distances from the first actor of an affected asset onwards.
+        Random values come from each placement's stored samples, so an
+        Apply never re-rolls and is fully deterministic.
         """
 
-        selected_items = self.GenerationLogList.selectedItems()
+        selected_items = self.GenerationLogList.selectedItems() if hasattr(self, "GenerationLogList") else []
         if not selected_items:
             unreal.log_warning("[Apply] No generation selected to update.")
             return
@@ -1314,140 +1422,204 @@ class AssetPlacerToolWindow(QWidget):
             return
 
         new_params = copy.deepcopy(self.Asset_Parameters)
-        gen_data["Spline"] = self.Selected_Spline_Path
-        spline_data = gen_data["Spline"]
+        spline_data = self.Selected_Spline_Path
 
         if not spline_data or not spline_data.get("Point Data"):
             unreal.log_warning("[Apply] Missing spline or point data.")
             return
 
+        log = self.Logger
+        log.begin()
+        phase_start = time.perf_counter()
+
+        # The stored spline is only swapped once the update below is committed
+        old_key = gen_data.get("Spline Key")
+        new_key = planner.spline_key(spline_data)
+        spline_changed = new_key != old_key
+
         # --- Extract spline data ---
-        point_data = spline_data["Point Data"]
-        distances = [float(p["Distance Along Spline"]) for p in point_data]
-        positions = [p["World Location"] for p in point_data]
-        directions = [p["Direction"] for p in point_data]
-        total_length = float(spline_data.get("Total Spline Length", distances[-1] if distances else 0.0))
-
-        # --- Detect spacing change robustly ---
-        old_params = gen_data.get("Parameters", {})
-        spacing_changed = False
-        for asset_name, new_p in new_params.items():
-            old_p = old_params.get(asset_name, {})
-            if abs(float(new_p.get("spacing", 0.0)) - float(old_p.get("spacing", 0.0))) > 0.001:
-                spacing_changed = True
-                break
+        distances, positions, directions, total_length = planner.spline_arrays(spline_data)
+
+        # --- Diff parameters per asset and per field ---
+        changes = planner.diff_parameters(gen_data.get("Parameters", {}), new_params)
+        spacing_assets = {name for name, groups in changes.items() if "spacing" in groups}
+        spacing_changed = bool(spacing_assets)
+
+        if not changes and not spline_changed:
+            unreal.log(f"[Apply] No parameter or spline changes for '{gen_name}'. Nothing to update.")
+            return
 
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
         spawned_assets = gen_data.get("Spawned Assets", {})
+        actor_index = engine.ActorIndex(gen_data.get("Actor References"))
         asset_list = gen_data.get("Asset List", {})
         spawn_order = gen_data.get("Spawn Order", list(spawned_assets.keys()))
         spawn_dist = gen_data.get("Spawn Distances", {})
 
+        asset_names = list(asset_list)
+        placement_info = gen_data.setdefault("Placements", {})
+
+        def asset_of(label):
+            info = placement_info.get(label)
+            if info is not None:
+                return asset_names[info["Asset Index"]]
+            # Older records: longest matching prefix, so "Rock_Large_3" is not taken for "Rock"
+            return max((n for n in asset_names if label.startswith(n)), key=len, default=None)
+
+        # --- Instanced/foliage generations edit instances instead of actors ---
+        instance_set = None
+        output_mode = gen_data.get("Output Mode", "Actors")
+        component_bounds = {
+            component: self.Asset_Cache.get(asset_list.get(asset))[1:]
+            for asset, component in gen_data.get("Instance Components", {}).items()
+        }
+        if output_mode == "Foliage":
+            instance_set = engine.FoliageSet(gen_data.get("Instances"), gen_data.setdefault("Instance Transforms", {}), component_bounds)
+        elif output_mode == "Instances":
+            owner_label = next(iter(spawned_assets), None)
+            owner = actor_index.find(spawned_assets.get(owner_label), owner_label) if owner_label else None
+            if not owner:
+                unreal.log_warning(f"[Apply] Instance actor of '{gen_name}' not found in level.")
+                return
+            instance_set = engine.InstanceSet(owner, gen_data.get("Instances"), component_bounds,
+                                              gen_data.get("Instance Transforms"))
+
+        def find_target(label):
+            if instance_set:
+                return instance_set.proxy(label)
+            path = spawned_assets.get(label)
+            return actor_index.find(path, label) if path else None
+
+        # --- Spacing only re-chains distances downstream of the first affected actor ---
+        first_dirty = len(spawn_order)
+        if spacing_changed:
+            first_dirty = next((i for i, label in enumerate(spawn_order) if asset_of(label) in spacing_assets), first_dirty)
+
         current_distance = 0.0
         previous_actor = None
+        if first_dirty < len(spawn_order) and first_dirty > 0:
+            previous_label = spawn_order[first_dirty - 1]
+            current_distance = float(spawn_dist.get(previous_label, 0.0))
+            previous_actor = find_target(previous_label)
         EPS = 0.1
-
-        for actor_label in spawn_order:
-            actor_path = spawned_assets.get(actor_label)
-            if not actor_path:
+        lookup = planner.ArcLengthTable(distances, positions, directions)
+
+        # Distances are fixed before the first re-chained actor, so sample them all in one batch
+        presampled = {}
+        fixed_labels = [label for label in spawn_order[:first_dirty]
+                        if label in spawn_dist and (spline_changed or "scatter" in changes.get(asset_of(label), ()))]
+        if fixed_labels:
+            batch_pos, batch_dir, _, _ = planner.sample_many(
+                [float(spawn_dist[label]) for label in fixed_labels], distances, positions, directions)
+            for i, label in enumerate(fixed_labels):
+                presampled[label] = (tuple(batch_pos[i]), tuple(batch_dir[i]))
+        log.add_time("prepare", time.perf_counter() - phase_start)
+
+        phase_start = time.perf_counter()
+        updated = 0
+        for i, actor_label in enumerate(spawn_order):
+            asset_name = asset_of(actor_label)
+            fields = changes.get(asset_name, set())
+            rechain = i >= first_dirty
+            move = spline_changed or rechain or "scatter" in fields
+            if not move and not fields:
                 continue
 
-            actor = self.GetActorByPath(actor_path)
+            with log.timed("find_actor"):
+                actor = find_target(actor_label)
             if not actor:
+                log.warning(f"Actor '{actor_label}' not found in level.", batch=True)
                 continue
 
-            # Determine asset type
-            asset_name = next((n for n in asset_list if actor_label.startswith(n)), None)
             params = new_params.get(asset_name, {})
-
-            # --- Base parameter fetch ---
-            spacing = float(params.get("spacing", 0.0))
-            scale = params.get("scale", [1, 1, 1])
             rotation = params.get("rotation", None)
-            scatter = float(params.get("scatter", 0.0))
-
-            # --- Handle range parameters ---
-            if hasattr(self, "Spacing_Range_Checkbox") and self.Spacing_Range_Checkbox.isChecked():
-                spacing_max = params.get("spacing_max", None)
-                if spacing_max is not None and spacing_max > spacing:
-                    spacing = random.uniform(spacing, float(spacing_max))
-
-            if hasattr(self, "Scale_Range_Checkbox") and self.Scale_Range_Checkbox.isChecked():
-                scale_max = params.get("scale_max", None)
-                if scale_max:
-                    sx = random.uniform(float(scale[0]), float(scale_max[0]))
-                    sy = random.uniform(float(scale[1]), float(scale_max[1]))
-                    sz = random.uniform(float(scale[2]), float(scale_max[2]))
-                    scale = [sx, sy, sz]
-
-            if hasattr(self, "Rotation_Range_Checkbox") and self.Rotation_Range_Checkbox.isChecked():
-                rot_max = params.get("rotation_max", None)
-                if rotation and rot_max:
-                    rx = random.uniform(float(rotation[0]), float(rot_max[0]))
-                    ry = random.uniform(float(rotation[1]), float(rot_max[1]))
-                    rz = random.uniform(float(rotation[2]), float(rot_max[2]))
-                    rotation = [rx, ry, rz]
+            # Cached unit samples: unchanged parameters reproduce the same values
+            info = placement_info.setdefault(actor_label, {})
+            if "Samples" not in info:
+                info["Samples"] = planner.placement_random(gen_data.get("Seed"), actor_label).draw_samples()
+            samples = info["Samples"]
 
             # --- Compute distance ---
-            if not spacing_changed and actor_label in spawn_dist:
-                distance = float(spawn_dist[actor_label])
-            else:
+            if rechain:
+                spacing = planner.sample_spacing(params, samples["spacing"])
                 if previous_actor:
-                    prev_origin, prev_extent = previous_actor.get_actor_bounds(True)
+                    with log.timed("get_actor_bounds"):
+                        prev_origin, prev_extent = previous_actor.get_actor_bounds(True)
                     prev_half = max(prev_extent.x, prev_extent.y, prev_extent.z)
                 else:
                     prev_half = 0.0
 
-                asset_obj = unreal.load_asset(asset_list.get(asset_name))
-                curr_half = 0.0
-                if asset_obj and hasattr(asset_obj, "get_bounds"):
-                    try:
-                        bounds = asset_obj.get_bounds()
-                        curr_half = max(bounds.box_extent.x, bounds.box_extent.y, bounds.box_extent.z)
-                    except Exception:
-                        pass
+                curr_half = self.Asset_Cache.get_half_size(asset_list.get(asset_name))
 
                 advance = prev_half + curr_half + spacing + EPS
                 current_distance += advance
                 current_distance = max(0.0, min(total_length, current_distance))
                 distance = round(current_distance, 4)
+                spawn_dist[actor_label] = distance
+            else:
+                distance = float(spawn_dist.get(actor_label, 0.0))
 
-            pos_tuple, dir_vec = self.sample_at_distance(distance, distances, positions, directions)
-            new_loc = self.to_vector(pos_tuple)
-
-            # --- Scatter offset (XY only, no Z) ---
-            if scatter != 0.0:
-                right = (-dir_vec[1], dir_vec[0], 0.0)
-                rmag = math.sqrt(sum(c * c for c in right))
-                if rmag > 1e-6:
-                    right = tuple(c / rmag for c in right)
+            # --- Location (re-sampled only when distance, spline or scatter changed) ---
+            dir_vec = None
+            if move:
+                if actor_label in presampled:
+                    pos_tuple, dir_vec = presampled[actor_label]
+                else:
+                    with log.timed("sample_at_distance"):
+                        pos_tuple, dir_vec = lookup.sample(distance)
+                new_loc = self.to_vector(pos_tuple)
+
+                # --- Scatter offset (XY only, no Z) ---
+                off_r = planner.sample_scatter(params, samples["scatter"])
+                if off_r != 0.0:
+                    right = planner.right_vector(dir_vec)
+                    new_loc.x += right[0] * off_r
+                    new_loc.y += right[1] * off_r
+
+                with log.timed("set_actor_location"):
+                    actor.set_actor_location(new_loc, False, False)
+
+            # --- Rotation (spline-following rotations move with the actor) ---
+            if "rotation" in fields or (move and not rotation):
+                rot = planner.sample_vector_param(params, "rotation", None, samples["rotation"])
+                if rot:
+                    new_rot = unreal.Rotator(*rot)
                 else:
-                    right = (1, 0, 0)
+                    if dir_vec is None:
+                        dir_vec = lookup.sample(distance)[1]
+                    new_rot = self.rotator_from_direction(dir_vec)
+                with log.timed("set_actor_rotation"):
+                    actor.set_actor_rotation(new_rot, False)
 
-                off_r = random.uniform(-scatter, scatter)
-                new_loc.x += right[0] * off_r
-                new_loc.y += right[1] * off_r
+            # --- Scale ---
+            if "scale" in fields:
+                with log.timed("set_actor_scale3d"):
+                    actor.set_actor_scale3d(self.to_vector(planner.sample_vector_param(params, "scale", (1.0, 1.0, 1.0), samples["scale"])))
 
-            # --- Rotation and scale ---
-            if rotation:
-                try:
-                    new_rot = unreal.Rotator(float(rotation[0]), float(rotation[1]), float(rotation[2]))
-                except Exception:
-                    new_rot = self.rotator_from_direction(dir_vec)
-            else:
-                new_rot = self.rotator_from_direction(dir_vec)
+            # Only re-chained actors feed the next one's bounds; earlier actors keep the predecessor fetched above
+            if rechain:
+                previous_actor = actor
+            updated += 1
 
-            new_scale = unreal.Vector(float(scale[0]), float(scale[1]), float(scale[2]))
-            actor.set_actor_transform(unreal.Transform(new_loc, new_rot, new_scale), False, False)
-            previous_actor = actor
+        log.add_time("update", time.perf_counter() - phase_start)
 
-            spawn_dist[actor_label] = distance
+        if instance_set:
+            phase_start = time.perf_counter()
+            instance_set.flush()
+            log.add_time("flush", time.perf_counter() - phase_start)
 
+        if spline_changed:
+            gen_data["Spline Key"] = self.Spline_Store.intern(spline_data)
+            self.Spline_Store.release(old_key)
         gen_data["Parameters"] = copy.deepcopy(new_params)
         gen_data["Spawn Distances"] = spawn_dist
+        gen_data["Placements"] = placement_info
         self.Generation_Log[gen_name] = gen_data
 
-        unreal.log(f"[Apply] Completed Apply for '{gen_name}'. Spacing changed: {spacing_changed}")
+        log.count("updated", updated)
+        log.count("actors", len(spawn_order))
+        log.summary(f"[Apply] Completed Apply for '{gen_name}' (spacing changed: {spacing_changed})")
+        gen_data.setdefault("Profile", {})["Apply"] = log.last_report
+        self._show_profile(f"Apply {gen_name}", log.last_report)
 
     # ------------------------------
     # Primary Generation Routine
@@ -1465,6 +1637,15 @@ class AssetPlacerToolWindow(QWidget):
             - Handles scatter offsets, scaling, rotation, and range values.
             - Logs each generation in `self.Generation_Log` for later reuse.
 
+        All placement math runs in UE_PlacerTool_Planner.plan_placements()
+        first; the level is only touched by a single spawn pass afterwards.
+        With several splines selected, assets and their bounds are loaded
+        once and each spline is planned and spawned in turn, producing one
+        generation record per spline.
+        Large runs spawn SPAWN_CHUNK_SIZE actors per Qt timer slice so the
+        editor stays responsive, with progress shown in the bottom dock and
+        a Cancel button that rolls back the actors spawned so far.
+
         Output:
             - Spawns actors directly into the Unreal level.
             - Updates the Generation Log and enables Apply/Delete controls.
@@ -1472,6 +1653,10 @@ class AssetPlacerToolWindow(QWidget):
         # -------------------------
         # Section 1: Validation / Safety
         # -------------------------
+        if self._spawn_job or self._spawn_queue:
+            unreal.log_warning("[Generate] A generation is already running.")
+            return
+
         if not hasattr(self, "Asset_Parameters") or not self.Asset_Parameters:
             unreal.log_warning("[Generate] No Asset_Parameters found.")
             return
@@ -1500,303 +1685,463 @@ class AssetPlacerToolWindow(QWidget):
             if not params:
                 unreal.log_warning(f"[Generate] Missing parameters for '{name}', skipping.")
                 continue
-
-            qty = int(params.get("quantity", 0))
-
-            if hasattr(self, "Quantity_Range_Checkbox") and self.Quantity_Range_Checkbox.isChecked():
-                qty_min = int(params.get("quantity", 0))
-                qty_max = int(params.get("quantity_max", qty_min))
-                if qty_max > qty_min:
-                    qty = random.randint(qty_min, qty_max)
-
-            if qty <= 0:
-                continue
-
-            assets.append({"name": name, "qty": qty, "params": params})
+            # Copied: every spline of this Generate is planned and recorded from
+            # these values even if the UI changes them between spawn slices
+            assets.append({"name": name, "params": copy.deepcopy(params)})
 
         if not assets:
-            unreal.log_warning("[Generate] No spawnable assets (quantity <= 0).")
+            unreal.log_warning("[Generate] No asset parameters found for the Asset List.")
             return
 
-        random_mode = getattr(self, "Random_Checkbox", None) and self.Random_Checkbox.isChecked()
-        in_sequence = getattr(self, "InSequence_Checkbox", None) and self.InSequence_Checkbox.isChecked()
+        random_mode = bool(getattr(self, "Random_Checkbox", None) and self.Random_Checkbox.isChecked())
+        in_sequence = bool(getattr(self, "InSequence_Checkbox", None) and self.InSequence_Checkbox.isChecked())
 
+        log = self.Logger
+        log.begin()
         if in_sequence:
-            spawn_sequence = [a["name"] for a in assets]
-            max_quantity = max(a["qty"] for a in assets)
-            new_sequence = []
-            for i in range(max_quantity):
-                for asset_name in spawn_sequence:
-                    asset_data = next((a for a in assets if a["name"] == asset_name), None)
-                    if asset_data and asset_data["qty"] > i:
-                        new_sequence.append(asset_data)
-            sequence_index = 0
-            total_sequence = len(new_sequence)
-            unreal.log("InSequence mode active — alternating assets in sequence along spline.")
+            log.info("InSequence mode active — alternating assets in sequence along spline.")
         else:
-            unreal.log("Standard mode — spawning one asset type at a time.")
+            log.info("Standard mode — spawning one asset type at a time.")
+
+        # -------------------------
+        # Section 3: Fetch assets and their extents from the asset cache
+        # -------------------------
+        phase_start = time.perf_counter()
+        asset_objects = {}
+        asset_extents = {}
+        asset_origins = {}
+        for asset in assets:
+            name = asset["name"]
+            asset_path = self.Asset_File_Paths.get(name)
+            if not asset_path:
+                unreal.log_warning(f"[Generate] Missing path for asset '{name}'. Skipping this asset.")
+                continue
+
+            asset_obj, origin, extent = self.Asset_Cache.get(asset_path)
+            if not asset_obj:
+                unreal.log_warning(f"[Generate] Failed to load asset at '{asset_path}'. Skipping.")
+                continue
+
+            asset_objects[name] = asset_obj
+            if extent:
+                asset_extents[name] = extent
+                asset_origins[name] = origin
+        load_seconds = time.perf_counter() - phase_start
 
         # -------------------------
-        # Section 3: Spline helpers
+        # Section 4: Queue one job per selected spline
         # -------------------------
-        spline = self.Selected_Spline_Path
-        point_data = spline.get("Point Data", [])
-        if not point_data:
+        spline_paths = [sp for sp in (self.Selected_Spline_Paths or [self.Selected_Spline_Path]) if sp.get("Point Data")]
+        if not spline_paths:
             unreal.log_warning("[Generate] Selected_Spline_Path contains no 'Point Data'.")
             return
 
-        distances = [float(p["Distance Along Spline"]) for p in point_data]
-        positions = [p["World Location"] for p in point_data]
-        directions = [p["Direction"] for p in point_data]
-        total_length = float(spline.get("Total Spline Length", distances[-1] if distances else 0.0))
+        base_seed = self.Seed_spin.value() or random.randrange(1, 2 ** 31)
+        self._generate_setup = {
+            "asset_order": asset_order,
+            "assets": assets,
+            "asset_parameters": {asset["name"]: asset["params"] for asset in assets},
+            "asset_objects": asset_objects,
+            "asset_extents": asset_extents,
+            "asset_origins": asset_origins,
+            "asset_paths": {name: path for name, path in self.Asset_File_Paths.items() if name in asset_objects},
+            "random_mode": random_mode,
+            "in_sequence": in_sequence,
+            "avoid_overlap": self.AvoidOverlap_Checkbox.isChecked(),
+            "output_mode": self.Output_Combo.currentText(),
+            "actor_subsystem": actor_subsystem,
+            "spline_count": len(spline_paths),
+            "load_assets": load_seconds,   # Reported with the first spline's profile
+        }
+        # Consecutive seeds keep every spline of a batch reproducible on its own
+        self._spawn_queue = [{"spline_path": sp, "seed": base_seed + i} for i, sp in enumerate(spline_paths)]
+        self._start_next_job()
+
+    def _start_next_job(self):
+        """
+        Plans and spawns the queued splines of the running Generate in turn.
+
+        Jobs that finish synchronously (small or instanced runs) are processed
+        in a loop; a chunked job returns here from _spawn_chunk() when done.
+        """
+        while self._spawn_queue:
+            entry = self._spawn_queue.pop(0)
+            self._begin_spawn_job(entry["spline_path"], entry["seed"])
+            if self._spawn_job:
+                return  # Chunked spawn in progress
+
+        self._generate_setup = None
+        self._set_generate_running(False)
+
+    def _begin_spawn_job(self, spline_path: dict, seed: int):
+        """
+        Plans one spline's placements and starts its spawn pass.
+
+        Args:
+            spline_path (dict): Serialized spline data to place along.
+            seed (int): Seed for this spline's generation.
+        """
+        setup = self._generate_setup
+        log = self.Logger
+        log.begin()
+        if "load_assets" in setup:
+            log.add_time("load_assets", setup.pop("load_assets"))
 
         # -------------------------
-        # Section 4: Main generation loop
+        # Plan placements (no engine calls)
         # -------------------------
-        total_to_spawn = sum(a["qty"] for a in assets)
-        total_remaining = total_to_spawn
-        if total_remaining <= 0:
-            unreal.log_warning("[Generate] Total quantity is 0. Nothing to do.")
+        phase_start = time.perf_counter()
+        placements = planner.plan_placements(
+            spline_path,
+            setup["asset_parameters"],
+            setup["asset_paths"],
+            asset_order=setup["asset_order"],
+            asset_extents=setup["asset_extents"],
+            asset_origins=setup["asset_origins"],
+            random_mode=setup["random_mode"],
+            in_sequence=setup["in_sequence"],
+            avoid_overlap=setup["avoid_overlap"],
+            seed=seed,
+            logger=log,
+        )
+        log.add_time("plan", time.perf_counter() - phase_start)
+
+        if not placements:
+            unreal.log_warning(f"[Generate] No spawnable assets along '{spline_path.get('Actor Name')}' (quantity <= 0). Nothing to do.")
             return
 
-        spawned_actors = []
-        teleport = False
-        current_distance = 0.0
-        previous_actor = None
-        spawn_attempts = 0
-        MAX_ATTEMPTS = total_remaining * 20 + 1000
-
-        while total_remaining > 0 and spawn_attempts < MAX_ATTEMPTS:
-            spawn_attempts += 1
-
-            # Choose asset
-            if in_sequence:
-                if sequence_index >= total_sequence:
-                    unreal.log("[Generate] Completed all sequence assets.")
-                    break
-                chosen = new_sequence[sequence_index]
-                sequence_index += 1
-            elif random_mode:
-                choices = [a for a in assets if a["qty"] > 0]
-                if not choices:
-                    break
-                chosen = random.choice(choices)
-            else:
-                chosen = next((a for a in assets if a["qty"] > 0), None)
-                if not chosen:
-                    break
-
-            name = chosen["name"]
-            params = chosen["params"]
-
-            # --- Parameter sampling ---
-            spacing = float(params.get("spacing", 0.0))
-            if self.Spacing_Range_Checkbox.isChecked():
-                if params.get("spacing_max") is not None and params.get("spacing_max") > spacing:
-                    spacing = random.uniform(spacing, float(params["spacing_max"]))
-
-            default_scale = params.get("scale", [1.0, 1.0, 1.0])
-            scale_max = params.get("scale_max")
-            if self.Scale_Range_Checkbox.isChecked() and scale_max:
-                sx = random.uniform(float(default_scale[0]), float(scale_max[0]))
-                sy = random.uniform(float(default_scale[1]), float(scale_max[1]))
-                sz = random.uniform(float(default_scale[2]), float(scale_max[2]))
-            else:
-                sx, sy, sz = float(default_scale[0]), float(default_scale[1]), float(default_scale[2])
-
-            rot_default = params.get("rotation", None)
-            rot_max = params.get("rotation_max", None)
-            use_user_rotation = bool(rot_default is not None)
-            if self.Rotation_Range_Checkbox.isChecked() and rot_max:
-                rx = random.uniform(float(rot_default[0]), float(rot_max[0]))
-                ry = random.uniform(float(rot_default[1]), float(rot_max[1]))
-                rz = random.uniform(float(rot_default[2]), float(rot_max[2]))
-                user_rotator = unreal.Rotator(rx, ry, rz)
-                use_user_rotation = True
-            elif rot_default:
-                user_rotator = unreal.Rotator(float(rot_default[0]), float(rot_default[1]), float(rot_default[2]))
-                use_user_rotation = True
+        placed_names = {p["asset"] for p in placements}
+        assets = [a for a in setup["assets"] if a["name"] in placed_names]
+        asset_indices = {a["name"]: i for i, a in enumerate(assets)}  # Matches the log's "Asset List" order
+
+        # -------------------------
+        # Spawn pass (chunked, see _spawn_chunk())
+        # -------------------------
+        self._spawn_job = {
+            "placements": placements,
+            "next": 0,
+            "actors": [],
+            "order": [],
+            "distances": {},
+            "samples": {},
+            "asset_objects": setup["asset_objects"],
+            "asset_indices": asset_indices,
+            "assets": assets,
+            "asset_paths": setup["asset_paths"],
+            "seed": seed,
+            "spline_path": spline_path,
+            "actor_subsystem": setup["actor_subsystem"],
+            "chunked": False,
+        }
+
+        output_mode = setup["output_mode"]
+        if output_mode != "Actors":
+            # Instances are added in bulk per component/foliage type; no chunking needed
+            spawn = self._spawn_foliage if output_mode == "Foliage" else self._spawn_instances
+            phase_start = time.perf_counter()
+            spawned = spawn()
+            log.add_time("spawn", time.perf_counter() - phase_start)
+            if spawned:
+                self._finish_generate()
             else:
-                user_rotator = None
-                use_user_rotation = False
+                self._spawn_job = None
+            return
 
-            scatter = float(params.get("scatter", 0.0))
+        if len(placements) <= SPAWN_CHUNK_SIZE:
+            # Small runs finish in one slice; no need to show progress
+            self._spawn_chunk()
+            return
 
-            # --- Unified advance (edge-to-edge when spacing==0) ---
-            EPS = 0.1
-            try:
-                if previous_actor:
-                    prev_origin, prev_extent = previous_actor.get_actor_bounds(True)
-                    prev_half = max(prev_extent.x, prev_extent.y, prev_extent.z)
-                else:
-                    prev_half = 0.0
+        self._spawn_job["chunked"] = True
+        done = setup["spline_count"] - len(self._spawn_queue)
+        self._set_generate_running(True, len(placements))
+        if setup["spline_count"] > 1:
+            self.Generate_Progress.setFormat(f"{done}/{setup['spline_count']}: %v / %m")
+        QTimer.singleShot(0, self._spawn_chunk)
 
-                est_curr_half = 0.0
-                asset_path = self.Asset_File_Paths.get(name)
-                if asset_path:
-                    asset_obj = unreal.load_asset(asset_path)
-                    if asset_obj and hasattr(asset_obj, "get_bounds"):
-                        try:
-                            bounds = asset_obj.get_bounds()
-                            box_extent = bounds.box_extent
-                            est_curr_half = max(box_extent.x, box_extent.y, box_extent.z)
-                        except Exception:
-                            pass
-
-                user_spacing = float(params.get("spacing", 0.0))
-                advance = prev_half + est_curr_half + user_spacing + EPS
-                current_distance += advance
+    def _set_generate_running(self, running: bool, total: int = 0):
+        """
+        Show the progress bar/Cancel button while a chunked Generate runs and lock the other actions.
+
+        Besides Generate/Apply/Delete, everything that edits the asset list,
+        its parameters, the spline selection or the selected generation is
+        disabled until the run ends, so the UI cannot drift from the
+        snapshot the run is planned and recorded from.
+        """
+        self._ensure_generation_log()
+        self.Generate_Progress.setVisible(running)
+        self.CancelButton.setVisible(running)
+        if running:
+            self.Generate_Progress.setRange(0, total)
+            self.Generate_Progress.setValue(0)
+            if not self._locked_widgets:
+                widgets = [self.GenerateButton, self.ApplyButton, self.DeleteGeneration,
+                           self.GenerationLogList, self.AssetList_Widget, self.AddFileButton,
+                           self.RemoveFileButton, self.SplineButton]
+                if hasattr(self, "Param_Dock"):
+                    widgets.append(self.Param_Dock)
+                self._locked_widgets = {w: w.isEnabled() for w in widgets}
+                for w in self._locked_widgets:
+                    w.setEnabled(False)
+        else:
+            self.Generate_Progress.setFormat("%v / %m")
+            for w, enabled in self._locked_widgets.items():
+                w.setEnabled(enabled)
+            self._locked_widgets = {}
+
+    def _spawn_chunk(self):
+        """
+        Spawns the next SPAWN_CHUNK_SIZE planned placements of the running Generate.
+
+        Re-schedules itself on a zero-delay Qt timer until every placement is
+        spawned, then hands over to _finish_generate().
+        """
+        job = self._spawn_job
+        if not job:
+            return  # Cancelled between slices
+
+        log = self.Logger
+        placements = job["placements"]
+        actor_subsystem = job["actor_subsystem"]
+        spawned_actors = job["actors"]
+        end = min(job["next"] + SPAWN_CHUNK_SIZE, len(placements))
+        chunk_start = time.perf_counter()
+
+        for placement in placements[job["next"]:end]:
+            name = placement["asset"]
+            location = self.to_vector(placement["location"])
+            rotation = unreal.Rotator(*placement["rotation"])
 
-                unreal.log(f"[Advance] +{advance:.1f} (prev_half={prev_half:.1f}, curr_half≈{est_curr_half:.1f}, spacing={user_spacing:.1f})")
+            try:
+                with log.timed("spawn_actor_from_object"):
+                    actor = actor_subsystem.spawn_actor_from_object(job["asset_objects"][name], location, rotation)
             except Exception as e:
-                unreal.log_warning(f"[Advance] Failed: {e}")
-
-            # --- Spawn transform ---
-            pos_tuple, dir_vec = self.sample_at_distance(current_distance, distances, positions, directions)
-            candidate_loc = self.to_vector(pos_tuple)
-            base_rot = user_rotator if use_user_rotation else self.rotator_from_direction(dir_vec)
-            spawn_transform = unreal.Transform(candidate_loc, base_rot, unreal.Vector(sx, sy, sz))
-
-            # --- Overlap avoidance ---
-            trial_attempts = 0
-            MAX_TRIALS = 25
-            spawned_success = False
-            asset_path = self.Asset_File_Paths.get(name)
-            unreal.log_warning(asset_path)
-            if not asset_path:
-                unreal.log_warning(f"[Generate] Missing path for asset '{name}'. Skipping this asset.")
+                log.warning(f"spawn_actor_from_object failed for '{name}': {e}", batch=True)
+                continue
+            if not actor:
+                log.count("spawn_failures")
                 continue
 
-            asset_obj = unreal.load_asset(asset_path)
-            if not asset_obj:
-                unreal.log_warning(f"[Generate] Failed to load asset at '{asset_path}'. Skipping.")
+            with log.timed("set_actor_scale3d"):
+                actor.set_actor_scale3d(self.to_vector(placement["scale"]))
+            spawned_actors.append(actor)
+
+            try:
+                with log.timed("get_actor_label"):
+                    actor_label = actor.get_actor_label()
+            except Exception:
+                actor_label = f"{name}_{len(spawned_actors)}"
+
+            job["order"].append(actor_label)
+            job["distances"][actor_label] = placement["distance"]
+            job["samples"][actor_label] = {
+                "Asset Index": job["asset_indices"][name],
+                "Samples": placement["samples"],
+            }
+            if log.verbose:
+                log.trace(f"[Spawn] {actor_label} at {placement['distance']:.1f}")
+
+        log.add_time("spawn", time.perf_counter() - chunk_start)
+        job["next"] = end
+        if end < len(placements):
+            self.Generate_Progress.setValue(end)
+            QTimer.singleShot(0, self._spawn_chunk)
+            return
+
+        self._finish_generate()
+        if job["chunked"]:
+            QTimer.singleShot(0, self._start_next_job)
+
+    def _spawn_instances(self):
+        """
+        Writes the running Generate's placements as instances on one new actor.
+
+        One Hierarchical Instanced Static Mesh component is created per asset,
+        and each receives all of its placements in a single add_instances() call.
+
+        Returns:
+            bool: False if the instance actor could not be spawned.
+        """
+        job = self._spawn_job
+        log = self.Logger
+        gen_label = self._next_generation_name().replace(" ", "_")
+        grouped = self._group_placements(job)
+
+        actor, components = engine.spawn_instance_actor(gen_label, {name: job["asset_objects"][name] for name in grouped})
+        if not actor:
+            log.warning("[Generate] Failed to spawn the instance actor.")
+            return False
+
+        job["actors"].append(actor)
+        instances = {}
+        locations = {}
+        stored = {}          # { component name: [[location, rotation, scale], ...] } by instance index
+        for name, group in grouped.items():
+            component = components.get(name)
+            if component is None:
+                log.count("spawn_failures", len(group))
                 continue
 
-            while trial_attempts < MAX_TRIALS:
-                trial_attempts += 1
-                scattered_loc = unreal.Vector(candidate_loc.x, candidate_loc.y, candidate_loc.z)
-                if scatter != 0.0:
-                    right = (-dir_vec[1], dir_vec[0], 0.0)
-                    rmag = math.sqrt(right[0] ** 2 + right[1] ** 2 + right[2] ** 2)
-                    if rmag > 1e-6:
-                        right = (right[0] / rmag, right[1] / rmag, right[2] / rmag)
-                    else:
-                        right = (1.0, 0.0, 0.0)
-                    up = (0.0, 0.0, 1.0)
-                    off_r = random.uniform(-scatter, scatter)
-                    off_u = random.uniform(-scatter, scatter)
-                    scattered_loc.x += right[0] * off_r + up[0] * off_u
-                    scattered_loc.y += right[1] * off_r + up[1] * off_u
+            transforms = [engine.to_transform(p["location"], p["rotation"], p["scale"]) for p in group]
+            indices = component.add_instances(transforms, True, True)
+            component_name = component.get_name()
+            labels, label_locations, stored[component_name] = engine.label_instances(name, group, component_name, indices)
+            instances.update(labels)
+            locations.update(label_locations)
+
+        self._record_instance_order(job, instances)
+        self._last_spawn_instances = {
+            "Output Mode": "Instances",
+            "Instances": instances,
+            "Components": {name: c.get_name() for name, c in components.items()},
+            "Locations": locations,
+            "Transforms": stored,
+        }
+        log.count("instances", len(instances))
+        return True
 
-                try:
-                    trial_actor = actor_subsystem.spawn_actor_from_object(asset_obj, scattered_loc)
-                except Exception as e:
-                    unreal.log_warning(f"[Generate] spawn_actor_from_object failed for '{name}': {e}")
-                    break
+    def _spawn_foliage(self):
+        """
+        Writes the running Generate's placements as foliage instances.
 
-                try:
-                    trial_transform = unreal.Transform(scattered_loc, base_rot, unreal.Vector(sx, sy, sz))
-                    trial_actor.set_actor_transform(trial_transform, False, teleport)
-                except Exception:
-                    try:
-                        trial_actor.set_actor_location_and_rotation(scattered_loc, base_rot, False, unreal.TeleportType.NONE)
-                        trial_actor.set_actor_scale3d(unreal.Vector(sx, sy, sz))
-                    except Exception:
-                        try:
-                            actor_subsystem.destroy_actor(trial_actor)
-                        except Exception:
-                            pass
-                        break
+        A FoliageType is created per asset for this generation, and each
+        receives all of its placements in a single add_instances() call.
+        The transforms are kept in the record so Apply can rewrite them.
 
-                try:
-                    bbox = trial_actor.get_components_bounding_box(True)
-                    center = bbox.get_center()
-                    extent = bbox.get_extent()
-                    trial_radius = max(extent.x, extent.y, extent.z)
-                except Exception:
-                    center = trial_actor.get_actor_location()
-                    trial_radius = 50.0
-
-                overlap = False
-                for other in spawned_actors:
-                    if not other or not hasattr(other, "get_actor_location"):
-                        continue
-                    try:
-                        obox = other.get_components_bounding_box(True)
-                        ocenter = obox.get_center()
-                        oextent = obox.get_extent()
-                        other_radius = max(oextent.x, oextent.y, oextent.z)
-                    except Exception:
-                        ocenter = other.get_actor_location()
-                        other_radius = 50.0
-                    dvec = center - ocenter
-                    dist = math.sqrt(dvec.x ** 2 + dvec.y ** 2 + dvec.z ** 2)
-                    if dist < (trial_radius + other_radius + 2.0):
-                        overlap = True
-                        break
-
-                if not overlap:
-                    spawned_actors.append(trial_actor)
-                    spawned_success = True
-                    break
+        Returns:
+            bool: False if no foliage type could be created.
+        """
+        job = self._spawn_job
+        log = self.Logger
+        gen_label = self._next_generation_name().replace(" ", "_")
+        grouped = self._group_placements(job)
+
+        instances = {}
+        locations = {}
+        foliage_types = {}   # { asset_name: foliage type path }
+        stored = {}          # { foliage type path: [[location, rotation, scale], ...] }
+        for name, group in grouped.items():
+            foliage_type = engine.create_foliage_type(name, job["asset_objects"][name], gen_label)
+            if not foliage_type:
+                log.count("spawn_failures", len(group))
+                continue
 
-                try:
-                    actor_subsystem.destroy_actor(trial_actor)
-                except Exception:
-                    pass
-                step_forward = max(spacing * 0.5, 10.0)
-                current_distance += step_forward
-                if current_distance > total_length:
-                    break
-                pos_tuple, dir_vec = self.sample_at_distance(current_distance, distances, positions, directions)
-                candidate_loc = self.to_vector(pos_tuple)
-                if not use_user_rotation:
-                    base_rot = self.rotator_from_direction(dir_vec)
-
-            if spawned_success:
-                previous_actor = trial_actor
-            else:
-                unreal.log_warning(f"[Generate] Could not find non-overlapping spot for '{name}' after {trial_attempts} trials. Skipping this spawn.")
+            type_path = foliage_type.get_path_name()
+            engine.add_foliage_instances(
+                foliage_type, [engine.to_transform(p["location"], p["rotation"], p["scale"]) for p in group]
+            )
+            foliage_types[name] = type_path
+            labels, label_locations, stored[type_path] = engine.label_instances(name, group, type_path)
+            instances.update(labels)
+            locations.update(label_locations)
+
+        if not foliage_types:
+            log.warning("[Generate] No foliage types could be created.")
+            return False
+
+        self._record_instance_order(job, instances)
+        self._last_spawn_instances = {
+            "Output Mode": "Foliage",
+            "Instances": instances,
+            "Components": foliage_types,
+            "Locations": locations,
+            "Transforms": stored,
+        }
+        log.count("instances", len(instances))
+        return True
 
-            chosen["qty"] -= 1
-            total_remaining -= 1
-            if current_distance > total_length:
-                unreal.log("[Generate] Reached end of spline - stopping generation.")
-                break
+    def _group_placements(self, job) -> dict:
+        """Group the running Generate's placements by asset, keeping spawn order within each asset."""
+        grouped = {}   # { asset_name: [placement] }
+        for placement in job["placements"]:
+            grouped.setdefault(placement["asset"], []).append(placement)
+        return grouped
 
-            try:
-                actor_label = trial_actor.get_actor_label()
-            except Exception:
-                actor_label = f"{name}_{len(spawned_actors)}"
+    def _record_instance_order(self, job, instances: dict):
+        """
+        Record spawn order, distances and samples for instance labels ("<asset>_<n>").
 
-            if not hasattr(self, "_last_spawn_order"):
-                self._last_spawn_order = []
-            if not hasattr(self, "_last_spawn_distances"):
-                self._last_spawn_distances = {}
+        Spawn order follows the plan, so Apply re-chains distances the same way
+        it does for actors.
+        """
+        counters = {}
+        for placement in job["placements"]:
+            name = placement["asset"]
+            counters[name] = counters.get(name, 0) + 1
+            label = f"{name}_{counters[name]}"
+            if label not in instances:
+                continue
+            job["order"].append(label)
+            job["distances"][label] = placement["distance"]
+            job["samples"][label] = {
+                "Asset Index": job["asset_indices"][name],
+                "Samples": placement["samples"],
+            }
 
-            self._last_spawn_order.append(actor_label)
-            self._last_spawn_distances[actor_label] = float(current_distance)
+    def _finish_generate(self):
+        """Records the finished spawn pass in the Generation Log and groups its actors in a folder."""
+        job = self._spawn_job
+        self._spawn_job = None
+
+        log = self.Logger
+        spawned_actors = job["actors"]
+        seed = job["seed"]
+        self._last_spawn_order = job["order"]
+        self._last_spawn_distances = job["distances"]
+        self._last_spawn_placements = job["samples"]
+        self._last_spawn_seed = seed
+        log.count("spawned", len(spawned_actors))
 
         # -------------------------
-        # Folder Grouping
+        # Generation Log + Folder Grouping
         # -------------------------
+        phase_start = time.perf_counter()
+        gen_name = self.UpdateGenerationLog(spawned_actors, job["assets"], job["asset_paths"], job["spline_path"])
+        log.add_time("record", time.perf_counter() - phase_start)
+
+        phase_start = time.perf_counter()
         try:
             # Create a folder in the World Outliner matching the generation log name
-            generation_name = f"Generation_{len(self.Generation_Log) + 1}"
+            generation_name = gen_name.replace(" ", "_")
             for actor in spawned_actors:
                 try:
                     actor.set_folder_path(generation_name)
                 except Exception:
                     pass
+            self.Generation_Log[gen_name]["FolderName"] = generation_name
+        except Exception as e:
+            log.warning(f"[Generate] Folder assignment failed: {e}")
+        log.add_time("folders", time.perf_counter() - phase_start)
 
-            # Update Generation Log with folder name
-            self.UpdateGenerationLog(spawned_actors, assets, self.Asset_File_Paths)
-            if generation_name in self.Generation_Log:
-                self.Generation_Log[generation_name]["FolderName"] = generation_name
+        log.summary(f"[Generate] Completed '{gen_name}' (seed {seed})")
+        self.Generation_Log[gen_name]["Profile"] = {"Generate": log.last_report}
+        self._show_profile(f"Generate {gen_name}", log.last_report)
 
-            unreal.log(f"[Generate] Completed generation '{generation_name}' with {len(spawned_actors)} actors.")
-        except Exception as e:
-            unreal.log_warning(f"[Generate] Folder assignment failed: {e}")
+    def _show_profile(self, title: str, report: dict):
+        """Shows an operation's slowest phases under the bottom bar."""
+        self.Profile_Label.setText(planner.format_report(title, report))
+        self.Profile_Label.setVisible(bool(report))
+
+    def CancelGenerate(self):
+        """
+        Stops a running chunked Generate and removes the actors it spawned so far.
+
+        The rollback is one batched destroy inside one undo transaction, and
+        nothing is written to the Generation Log for the interrupted spline.
+        In a multi-spline batch the remaining splines are dropped; splines
+        already completed keep their generations.
+        """
+        job = self._spawn_job
+        if not job:
+            return
+
+        skipped = len(self._spawn_queue)
+        self._spawn_job = None
+        self._spawn_queue = []
+        self._generate_setup = None
+        self._set_generate_running(False)
+        removed = engine.destroy_actors_bulk(job["actors"], "Cancel Generation")
+        self.Logger.summary(f"[Generate] Cancelled after {job['next']} of {len(job['placements'])} placements; removed {removed} actors, skipped {skipped} splines")
 
 
 # ============================
@@ -1857,21 +2202,63 @@ def apply_unreal_stylesheet(app):
 # ============================
 # Launch Python Tool Function
 # ============================
-def launchWindow():
+def _window_alive(window) -> bool:
+    """True while the Qt object behind a Python window wrapper still exists."""
+    try:
+        window.objectName()
+    except RuntimeError:  # Internal C++ object already deleted
+        return False
+    return True
+
+def launchWindow(reset: bool = False):
+    """
+    Shows the Asset Placer window, reusing the one already open.
+
+    The window is built once per editor session and only hidden when it
+    is closed, so reopening it is instant. Its data and caches live in
+    the PlacerSession held by UE_PlacerTool_Engine, so a window rebuilt
+    after reloading this module comes back with the same Generation Log,
+    assets and caches. Reloading UE_PlacerTool_Engine itself starts a
+    new, empty session.
+
+    Args:
+        reset (bool): Start over: clear the session and build a new window.
+
+    Returns:
+        AssetPlacerToolWindow: The visible tool window.
+    """
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
-    else:
-        # Id any current instances of tool and destroy
-        for win in (QApplication.allWindows()):
-            if 'toolWindow' in win.objectName(): # update this name to match name below
-                win.destroy()
-    
+
+    window = getattr(AssetPlacerToolWindow, "window", None)
+    if window is not None and _window_alive(window):
+        if reset and window._spawn_job is not None:
+            unreal.log_warning("[Asset Placer] Generate is running; not resetting the session.")
+            reset = False
+        if not reset:
+            window.show()
+            window.raise_()
+            window.activateWindow()
+            return window
+
+    if reset:
+        engine.get_session().reset()
+
+    # Close windows left by a reset or an earlier import of this module so the tool is never duplicated
+    for win in app.topLevelWidgets():
+        if win.objectName() == TOOL_WINDOW_NAME:
+            win.close()
+            win.deleteLater()
+
     apply_unreal_palette(app)
     apply_unreal_stylesheet(app)
- 
-    AssetPlacerToolWindow.window = AssetPlacerToolWindow()
-    AssetPlacerToolWindow.window.show()
-    AssetPlacerToolWindow.window.setWindowTitle("Procedural Asset Placer Tool")
-    AssetPlacerToolWindow.window.setObjectName("ToolWindow")
-    unreal.parent_external_window_to_slate(AssetPlacerToolWindow.window.winId())
\ No newline at end of file
+
+    window = AssetPlacerToolWindow()
+    AssetPlacerToolWindow.window = window
+    window.show()
+    window.setWindowTitle("Procedural Asset Placer Tool")
+    window.setObjectName(TOOL_WINDOW_NAME)
+    # Parent to the editor's Slate window (as before); a reopened window keeps its parenting
+    unreal.parent_external_window_to_slate(window.winId())
+    return window
@@ -0,0 +1,405 @@
+# ============================
+# Standard Library Imports
+# ============================
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# ============================
+# Asset Placer Tool Modules
+# ============================
+import UE_PlacerTool_Planner as planner
+
+# ============================
+# Recipe Format
+# ============================
+# A recipe is a JSON file describing one or more generations without the window:
+#
+# {
+#     "seed": 1234,                       # 0/omitted: random seed per run
+#     "random_mode": false,
+#     "in_sequence": false,
+#     "avoid_overlap": true,
+#     "output_mode": "Actors",            # "Actors", "Instances" or "Foliage" (editor only)
+#     "folder": "Dressing",               # Optional outliner folder prefix (editor only)
+#     "save_level": false,                # Save the current level afterwards (editor only)
+#     "assets": {
+#         "Rock": {
+#             "path": "/Game/Props/SM_Rock.SM_Rock",
+#             "parameters": {"quantity": 20, "spacing": 50.0, ...},
+#             "extent": [50, 50, 40],     # Optional bounds for planning outside the editor
+#             "origin": [0, 0, 40]
+#         }
+#     },
+#     "splines": [
+#         "/Game/Maps/Road.Road:PersistentLevel.Spline_1",   # Actor path (editor only)
+#         "exported_spline.json",                            # Spline data file, relative to the recipe
+#         {"Point Data": [...], "Total Spline Length": ...}  # Inline spline data
+#     ]
+# }
+#
+# "parameters" use the same keys as AssetPlacerToolWindow.Asset_Parameters;
+# missing keys fall back to DEFAULT_PARAMETERS.
+DEFAULT_PARAMETERS = {
+    "quantity": 1,
+    "quantity_max": 1,
+    "quantity_range": False,
+    "spacing": 0.0,
+    "spacing_max": 0.0,
+    "spacing_range": False,
+    "scale": [1.0, 1.0, 1.0],
+    "scale_max": [1.0, 1.0, 1.0],
+    "scale_range": False,
+    "rotation": [0.0, 0.0, 0.0],
+    "rotation_max": [0.0, 0.0, 0.0],
+    "rotation_range": False,
+    "scatter": 0.0,
+}
+
+OUTPUT_MODES = ("Actors", "Instances", "Foliage")
+
+class RecipeError(ValueError):
+    """Raised when a recipe file is missing required data or is malformed."""
+
+def load_recipe(recipe_path: str) -> dict:
+    """
+    Reads and validates a recipe file.
+
+    Spline entries that name a .json file are loaded here, relative to the
+    recipe's folder; actor paths are left as strings for the editor runner.
+
+    Args:
+        recipe_path (str): Path to the recipe JSON file.
+
+    Returns:
+        dict: The recipe, with asset parameters merged over DEFAULT_PARAMETERS.
+
+    Raises:
+        RecipeError: If the recipe has no assets/splines or an unknown output mode.
+    """
+    with open(recipe_path, "r", encoding="utf-8") as f:
+        recipe = json.load(f)
+
+    assets = recipe.get("assets")
+    if not assets:
+        raise RecipeError(f"{recipe_path}: recipe has no 'assets'.")
+    for name, asset in assets.items():
+        if not asset.get("path"):
+            raise RecipeError(f"{recipe_path}: asset '{name}' has no 'path'.")
+        asset["parameters"] = {**DEFAULT_PARAMETERS, **asset.get("parameters", {})}
+
+    if not recipe.get("splines"):
+        raise RecipeError(f"{recipe_path}: recipe has no 'splines'.")
+
+    output_mode = recipe.setdefault("output_mode", "Actors")
+    if output_mode not in OUTPUT_MODES:
+        raise RecipeError(f"{recipe_path}: unknown output_mode '{output_mode}' (expected one of {OUTPUT_MODES}).")
+
+    base_dir = os.path.dirname(os.path.abspath(recipe_path))
+    splines = []
+    for entry in recipe["splines"]:
+        if isinstance(entry, str) and entry.lower().endswith(".json"):
+            with open(os.path.join(base_dir, entry), "r", encoding="utf-8") as f:
+                splines.append(json.load(f))
+        else:
+            splines.append(entry)
+    recipe["splines"] = splines
+    return recipe
+
+# ============================
+# Planning Stage (no engine)
+# ============================
+def plan_recipe(recipe: dict, spline_paths: list, asset_extents: dict = None, asset_origins: dict = None,
+                logger: planner.PlacerLogger = None) -> list:
+    """
+    Plans every spline of a recipe with UE_PlacerTool_Planner.plan_placements().
+
+    Spline i is planned with seed + i, matching a multi-spline Generate.
+
+    Args:
+        recipe (dict): A recipe from load_recipe().
+        spline_paths (list[dict]): Serialized spline data, one per spline.
+        asset_extents (dict): { asset_name: extent } overriding the recipe's "extent" values.
+        asset_origins (dict): { asset_name: origin } overriding the recipe's "origin" values.
+        logger (PlacerLogger): Receives the planner's counters.
+
+    Returns:
+        list[tuple]: (seed, placements) per spline.
+    """
+    assets = recipe["assets"]
+    extents = {name: tuple(a["extent"]) for name, a in assets.items() if a.get("extent")}
+    origins = {name: tuple(a["origin"]) for name, a in assets.items() if a.get("origin")}
+    extents.update(asset_extents or {})
+    origins.update(asset_origins or {})
+
+    parameters = {name: a["parameters"] for name, a in assets.items()}
+    file_paths = {name: a["path"] for name, a in assets.items()}
+    base_seed = recipe.get("seed") or random.randrange(1, 2 ** 31)
+
+    results = []
+    for i, spline_path in enumerate(spline_paths):
+        seed = base_seed + i
+        placements = planner.plan_placements(
+            spline_path,
+            parameters,
+            file_paths,
+            asset_order=list(assets),
+            asset_extents=extents,
+            asset_origins=origins,
+            random_mode=bool(recipe.get("random_mode")),
+            in_sequence=bool(recipe.get("in_sequence")),
+            avoid_overlap=recipe.get("avoid_overlap", True),
+            seed=seed,
+            logger=logger,
+        )
+        results.append((seed, placements))
+    return results
+
+def placements_to_json(results: list) -> list:
+    """Converts plan_recipe() results into JSON-serializable data."""
+    return [
+        {
+            "Seed": seed,
+            "Placements": [
+                {
+                    "Asset": p["asset"],
+                    "Asset Path": p["asset_path"],
+                    "Location": list(p["location"]),
+                    "Rotation": list(p["rotation"]),
+                    "Scale": list(p["scale"]),
+                    "Distance": p["distance"],
+                }
+                for p in placements
+            ],
+        }
+        for seed, placements in results
+    ]
+
+# ============================
+# Editor Runner
+# ============================
+def run_in_editor(recipe: dict, logger: planner.PlacerLogger = None) -> list:
+    """
+    Runs a recipe inside the editor (interactive or commandlet) without the window.
+
+    Assets/bounds and actor-path splines come from the editor session's
+    AssetCache and SplineCache, so they stay warm across batch runs and
+    the tool window. Each spline's placements are written in the recipe's
+    output mode inside one undo transaction per spline and recorded in the
+    session's Generation_Log through PlacerSession.record_generation(), so
+    the tool window can select, apply to and delete them like its own.
+
+    Args:
+        recipe (dict): A recipe from load_recipe().
+        logger (PlacerLogger): Receives counters and timings; one is created if None.
+
+    Returns:
+        list[dict]: Per-spline summaries ("Spline", "Seed", "Placed",
+        "Generation" name or None, and the planned "Placements").
+    """
+    import unreal
+    import UE_PlacerTool_Engine as engine
+
+    log = logger or planner.PlacerLogger(planner.LOG_SUMMARY, unreal.log, unreal.log_warning)
+    log.begin()
+    session = engine.get_session()
+
+    # --- Splines: actor paths are extracted, serialized data is used as-is ---
+    actor_index = engine.ActorIndex()
+    spline_paths = []
+    for entry in recipe["splines"]:
+        if isinstance(entry, dict):
+            spline_paths.append(entry)
+            continue
+        actor = actor_index.find(entry)
+        components = actor.get_components_by_class(unreal.SplineComponent) if actor else []
+        if not components:
+            log.warning(f"[Batch] Spline actor '{entry}' not found or has no SplineComponent.")
+            continue
+        spline_paths.append(session.Spline_Cache.get(actor, components[0]))
+
+    # --- Assets: loaded once and shared by every spline ---
+    asset_cache = session.Asset_Cache
+    asset_objects = {}
+    extents = {}
+    origins = {}
+    for name, asset in recipe["assets"].items():
+        asset_obj, origin, extent = asset_cache.get(asset["path"])
+        if not asset_obj:
+            log.warning(f"[Batch] Failed to load asset at '{asset['path']}'.")
+            continue
+        asset_objects[name] = asset_obj
+        if extent:
+            extents[name] = extent
+            origins[name] = origin
+
+    loaded = {name: a for name, a in recipe["assets"].items() if name in asset_objects}
+    phase_start = time.perf_counter()
+    results = plan_recipe({**recipe, "assets": loaded}, spline_paths, extents, origins, logger=log)
+    log.add_time("plan", time.perf_counter() - phase_start)
+
+    # --- Write each spline's placements ---
+    phase_start = time.perf_counter()
+    output_mode = recipe["output_mode"]
+    folder_prefix = recipe.get("folder", "PlacerBatch")
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    file_paths = {name: a["path"] for name, a in loaded.items()}
+    summaries = []
+
+    for i, (spline_path, (seed, placements)) in enumerate(zip(spline_paths, results)):
+        label = f"{folder_prefix}_{spline_path.get('Actor Name', i + 1)}"
+        grouped = {}
+        for p in placements:
+            grouped.setdefault(p["asset"], []).append(p)
+
+        # Same record layout as the tool's Generate: "Asset List" order and indices
+        record_assets = [{"name": name, "params": a["parameters"]} for name, a in loaded.items() if name in grouped]
+        asset_indices = {a["name"]: k for k, a in enumerate(record_assets)}
+
+        placed = 0
+        spawned = []
+        folder = label
+        output = None
+        labels = {}   # { id(placement): actor or instance label }
+        with unreal.ScopedEditorTransaction(f"Batch Generate {label}"):
+            if output_mode == "Actors":
+                for p in placements:
+                    actor = actor_subsystem.spawn_actor_from_object(
+                        asset_objects[p["asset"]], unreal.Vector(*p["location"]), unreal.Rotator(*p["rotation"]))
+                    if not actor:
+                        log.count("spawn_failures")
+                        continue
+                    actor.set_actor_scale3d(unreal.Vector(*p["scale"]))
+                    actor.set_folder_path(label)
+                    spawned.append(actor)
+                    labels[id(p)] = actor.get_actor_label()
+                    placed += 1
+
+            elif output_mode == "Instances":
+                folder = folder_prefix
+                actor, components = engine.spawn_instance_actor(label, {name: asset_objects[name] for name in grouped})
+                if actor:
+                    actor.set_folder_path(folder_prefix)
+                    spawned.append(actor)
+                output = {"Output Mode": "Instances", "Instances": {}, "Components": {}, "Locations": {}, "Transforms": {}}
+                for name, component in components.items():
+                    indices = component.add_instances(
+                        [engine.to_transform(p["location"], p["rotation"], p["scale"]) for p in grouped[name]], True, True)
+                    component_name = component.get_name()
+                    instances, locations, output["Transforms"][component_name] = engine.label_instances(
+                        name, grouped[name], component_name, indices)
+                    output["Instances"].update(instances)
+                    output["Locations"].update(locations)
+                    output["Components"][name] = component_name
+                    labels.update((id(p), f"{name}_{k + 1}") for k, p in enumerate(grouped[name]))
+                    placed += len(grouped[name])
+
+            else:
+                output = {"Output Mode": "Foliage", "Instances": {}, "Components": {}, "Locations": {}, "Transforms": {}}
+                for name, group in grouped.items():
+                    foliage_type = engine.create_foliage_type(name, asset_objects[name], label)
+                    if not foliage_type:
+                        continue
+                    engine.add_foliage_instances(
+                        foliage_type, [engine.to_transform(p["location"], p["rotation"], p["scale"]) for p in group])
+                    type_path = foliage_type.get_path_name()
+                    instances, locations, output["Transforms"][type_path] = engine.label_instances(name, group, type_path)
+                    output["Instances"].update(instances)
+                    output["Locations"].update(locations)
+                    output["Components"][name] = type_path
+                    labels.update((id(p), f"{name}_{k + 1}") for k, p in enumerate(group))
+                    placed += len(group)
+
+        # --- Record in the session's Generation Log, as Generate does ---
+        recorded = [p for p in placements if id(p) in labels]
+        gen_name = None
+        if recorded:
+            gen_name = session.record_generation(spawned, record_assets, file_paths, spline_path, {
+                "Order": [labels[id(p)] for p in recorded],
+                "Distances": {labels[id(p)]: p["distance"] for p in recorded},
+                "Placements": {
+                    labels[id(p)]: {"Asset Index": asset_indices[p["asset"]], "Samples": p["samples"]}
+                    for p in recorded
+                },
+                "Seed": seed,
+                "Output": output,
+            })
+            session.Generation_Log[gen_name]["FolderName"] = folder
+
+        log.count("placed", placed)
+        summaries.append({"Spline": spline_path.get("Actor Name"), "Seed": seed, "Placed": placed,
+                          "Generation": gen_name, "Placements": placements})
+
+    log.add_time("spawn", time.perf_counter() - phase_start)
+
+    if recipe.get("save_level"):
+        unreal.get_editor_subsystem(unreal.LevelEditorSubsystem).save_current_level()
+
+    log.summary(f"[Batch] Completed {len(summaries)} splines ({output_mode})")
+    return summaries
+
+# ============================
+# Command Line Entry Point
+# ============================
+def main(argv: list = None) -> int:
+    """
+    Runs a recipe from the command line.
+
+    Outside Unreal only the planning stage runs (splines must be spline
+    data, not actor paths); inside the editor or a commandlet, e.g.
+
+        UnrealEditor-Cmd <Project>.uproject -run=pythonscript
+            -script="UE_PlacerTool_Batch.py recipe.json"
+
+    the placements are written to the level unless --plan-only is given.
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Run Asset Placer generations from a JSON recipe.")
+    parser.add_argument("recipe", help="Path to the recipe JSON file")
+    parser.add_argument("--plan-only", action="store_true", help="Plan placements without touching the level")
+    parser.add_argument("--output", help="Write the planned placements to this JSON file (also after an editor run)")
+    parser.add_argument("--verbose", action="store_true", help="Print the per-placement trace")
+    args = parser.parse_args(argv)
+
+    try:
+        recipe = load_recipe(args.recipe)
+    except (OSError, ValueError) as e:
+        print(f"[Batch] {e}", file=sys.stderr)
+        return 2
+
+    level = planner.LOG_VERBOSE if args.verbose else planner.LOG_SUMMARY
+    try:
+        import unreal
+    except ImportError:
+        unreal = None
+
+    if unreal is not None and not args.plan_only:
+        summaries = run_in_editor(recipe, planner.PlacerLogger(level, unreal.log, unreal.log_warning))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(placements_to_json([(s["Seed"], s["Placements"]) for s in summaries]), f, indent=2)
+        return 0
+
+    spline_paths = [s for s in recipe["splines"] if isinstance(s, dict)]
+    if len(spline_paths) < len(recipe["splines"]):
+        print(f"[Batch] Skipping {len(recipe['splines']) - len(spline_paths)} actor-path splines (editor only).", file=sys.stderr)
+
+    log = planner.PlacerLogger(level)
+    log.begin()
+    phase_start = time.perf_counter()
+    results = plan_recipe(recipe, spline_paths, logger=log)
+    log.add_time("plan", time.perf_counter() - phase_start)
+    log.summary(f"[Batch] Planned {len(results)} splines")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(placements_to_json(results), f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
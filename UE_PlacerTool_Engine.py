@@ -0,0 +1,878 @@
+# ============================
+# Unreal Engine Python Imports
+# ============================
+import unreal
+
+# ============================
+# Asset Placer Tool Modules
+# ============================
+import UE_PlacerTool_Planner as planner
+
+# ============================
+# Asset Object / Bounds Cache
+# ============================
+class AssetCache:
+    """
+    Caches loaded assets and their local bounds, keyed by asset path.
+
+    Generate() and Apply() need the same few assets thousands of times;
+    this keeps one unreal.load_asset() and one get_bounds() per asset.
+    Entries are evicted least-recently-used past `max_entries`, dropped
+    when the asset is reimported, and re-loaded if the cached object has
+    been garbage collected.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self._entries = planner.LRUCache(max_entries)   # { asset_path: (asset_obj, origin, extent) }
+        self._import_subsystem = None
+
+    def get(self, asset_path: str) -> tuple:
+        """
+        Returns the cached (asset_obj, origin, extent) for an asset path.
+
+        Loads the asset and reads its bounds on a miss. origin/extent are
+        None when the asset has no bounds (e.g. non-mesh assets).
+
+        Args:
+            asset_path (str): Full object path of the asset.
+
+        Returns:
+            tuple: (asset_obj, origin, extent), or (None, None, None) if the asset failed to load.
+        """
+        if not asset_path:
+            return None, None, None
+
+        entry = self._entries.get(asset_path)
+        if entry and unreal.Object.is_valid(entry[0]):
+            return entry
+
+        asset_obj = unreal.load_asset(asset_path)
+        if not asset_obj:
+            self._entries.pop(asset_path)
+            return None, None, None
+
+        origin = extent = None
+        if hasattr(asset_obj, "get_bounds"):
+            try:
+                bounds = asset_obj.get_bounds()
+                origin = (bounds.origin.x, bounds.origin.y, bounds.origin.z)
+                extent = (bounds.box_extent.x, bounds.box_extent.y, bounds.box_extent.z)
+            except Exception:
+                pass
+
+        entry = (asset_obj, origin, extent)
+        self._entries.put(asset_path, entry)
+        return entry
+
+    def get_asset(self, asset_path: str):
+        """Returns the cached asset object for a path (or None)."""
+        return self.get(asset_path)[0]
+
+    def get_half_size(self, asset_path: str) -> float:
+        """Returns the largest half extent of an asset's bounds (0.0 if unknown)."""
+        extent = self.get(asset_path)[2]
+        return max(extent) if extent else 0.0
+
+    def invalidate(self, asset_path: str = None):
+        """
+        Drops one cached asset, or every cached asset when no path is given.
+
+        Args:
+            asset_path (str): Asset to drop. None clears the whole cache.
+        """
+        if asset_path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(asset_path)
+
+    def bind_editor_events(self):
+        """
+        Invalidates entries automatically whenever an asset is (re)imported.
+
+        Python has no package-saved delegate, so edits saved without a
+        reimport are picked up through invalidate() instead.
+        """
+        if self._import_subsystem is not None:
+            return
+        try:
+            self._import_subsystem = unreal.get_editor_subsystem(unreal.ImportSubsystem)
+            self._import_subsystem.on_asset_reimport.add_callable(self._on_asset_reimport)
+            self._import_subsystem.on_asset_post_import.add_callable(self._on_asset_post_import)
+        except Exception as e:
+            self._import_subsystem = None
+            unreal.log_warning(f"[AssetCache] Could not bind import events: {e}")
+
+    def _on_asset_reimport(self, asset):
+        self.invalidate(asset.get_path_name())
+
+    def _on_asset_post_import(self, factory, created_object):
+        if created_object:
+            self.invalidate(created_object.get_path_name())
+
+# ============================
+# Spline Extraction / Cache
+# ============================
+def extract_spline_data(actor, spline) -> dict:
+    """
+    Reads point data from a spline component and derives curvature-adaptive samples.
+
+    Only the per-point reads touch the engine; the samples come from the
+    Hermite curve of the captured tangents (see planner.adaptive_arrays()).
+
+    Args:
+        actor (unreal.Actor): The actor owning the spline.
+        spline (unreal.SplineComponent): The spline to read.
+
+    Returns:
+        dict: Serialized spline data ("Point Data", "Total Spline Length",
+        "Sampled Distances", "Sampled Locations", "Sampled Directions", ...)
+        as used by Generate() and Apply().
+    """
+    num_points = spline.get_number_of_spline_points()
+    num_segments = num_points - 1
+    total_length = spline.get_spline_length()
+
+    spline_data = {
+        "Actor Name": actor.get_name(),
+        "Number of Points": num_points,
+        "Number of Segments": num_segments,
+        "Total Spline Length":total_length,
+        "Point Data": [] # Will hold dictionaries per spline point
+    }
+
+    for i in range(num_points):
+        #World-space location of this spline point
+        location = spline.get_location_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
+        rotation = spline.get_rotation_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
+        tangent = spline.get_tangent_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
+
+        #Distance along spline to this point
+        distance = spline.get_distance_along_spline_at_spline_point(i)
+
+        #Direction (normalised forward vector)
+        direction = spline.get_direction_at_spline_point(i, unreal.SplineCoordinateSpace.WORLD)
+
+        #Store in structured format
+        spline_data["Point Data"].append({
+            "index": i,
+            "Distance Along Spline": distance,
+            "World Location": (location.x, location.y, location.z),
+            "Rotation": (rotation.roll, rotation.pitch, rotation.yaw),
+            "Tangent": (tangent.x, tangent.y, tangent.z),
+            "Direction": (direction.x, direction.y, direction.z)
+        })
+
+    #Curvature-adaptive samples rebuilt from the captured tangents: dense on
+    #bends, endpoints only on straights, and no per-sample engine calls
+    sample_distances, sampled_positions, sampled_directions = planner.adaptive_arrays(spline_data["Point Data"])
+
+    spline_data["Sampled Distances"] = sample_distances
+    spline_data["Sampled Directions"] = sampled_directions
+    spline_data["Sampled Locations"] = sampled_positions
+
+    return spline_data
+
+def spline_fingerprint(actor, spline) -> tuple:
+    """
+    Builds a cheap fingerprint that changes whenever a spline is edited or moved.
+
+    Args:
+        actor (unreal.Actor): The actor owning the spline.
+        spline (unreal.SplineComponent): The spline component.
+
+    Returns:
+        tuple: (actor path, point count, rounded length, world transform values).
+    """
+    transform = spline.get_world_transform()
+    t, r, s = transform.translation, transform.rotation, transform.scale3d
+    return (
+        actor.get_path_name(),
+        spline.get_number_of_spline_points(),
+        round(spline.get_spline_length(), 3),
+        tuple(round(v, 4) for v in (t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)),
+    )
+
+class SplineCache:
+    """
+    Caches extract_spline_data() results per spline component.
+
+    Each lookup costs one fingerprint (a handful of engine calls); the full
+    per-point and per-sample extraction only runs when the fingerprint
+    differs from the cached one.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self._entries = planner.LRUCache(max_entries)   # { (actor path, component name): (fingerprint, spline data) }
+
+    def get(self, actor, spline) -> dict:
+        """
+        Returns spline data for a component, extracting it only if it changed.
+
+        Args:
+            actor (unreal.Actor): The actor owning the spline.
+            spline (unreal.SplineComponent): The spline component.
+
+        Returns:
+            dict: Serialized spline data.
+        """
+        fingerprint = spline_fingerprint(actor, spline)
+        key = (fingerprint[0], spline.get_name())
+        cached = self._entries.get(key)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        spline_data = extract_spline_data(actor, spline)
+        self._entries.put(key, (fingerprint, spline_data))
+        return spline_data
+
+    def invalidate(self, actor_path: str = None):
+        """Drops cached splines of one actor, or every cached spline when no path is given."""
+        if actor_path is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries.keys() if k[0] == actor_path]:
+            self._entries.pop(key)
+
+# ============================
+# Level Actor Lookup
+# ============================
+class ActorIndex:
+    """
+    O(1) actor lookup by path name or label for one editor operation.
+
+    Live actor references held by a generation record are tried first.
+    Only when one of them is missing or stale is the level scanned, and
+    then only once: a single get_all_level_actors() call feeds the path
+    map, and the label map on the first path miss, for every later lookup.
+    """
+
+    def __init__(self, actor_refs: dict = None):
+        self.actor_refs = actor_refs or {}   # { actor_label: unreal.Actor }
+        self.level_actors = None   # Filled by the first cache miss
+        self.by_path = None
+        self.by_label = None
+
+    def _level_actors(self) -> list:
+        if self.level_actors is None:
+            actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+            self.level_actors = actor_subsystem.get_all_level_actors()
+        return self.level_actors
+
+    def find(self, path: str, label: str = None):
+        """
+        Finds an actor by its path name, falling back to its label.
+
+        Args:
+            path (str): Actor path name (or label, for GetActorByPath compatibility).
+            label (str): Actor label recorded alongside the path.
+
+        Returns:
+            unreal.Actor: The matching actor, or None.
+        """
+        ref = self.actor_refs.get(label) if label else None
+        if ref is not None and unreal.Object.is_valid(ref):
+            return ref
+
+        if self.by_path is None:
+            self.by_path = {a.get_path_name(): a for a in self._level_actors()}
+        actor = self.by_path.get(path)
+        if actor is not None:
+            return actor
+
+        if self.by_label is None:
+            self.by_label = {}
+            for a in self._level_actors():
+                self.by_label.setdefault(a.get_actor_label(), a)
+        return self.by_label.get(label or path)
+
+# ============================
+# Bulk Generation Deletion
+# ============================
+def collect_generation_actors(gen_data: dict) -> list:
+    """
+    Collects every live actor belonging to a generation in one pass.
+
+    Held actor references are used when they are all still valid. Otherwise
+    the level is scanned once for actors in the generation's outliner
+    folder whose label was recorded in "Spawned Assets"; generations
+    without a folder fall back to an ActorIndex lookup per label.
+
+    Args:
+        gen_data (dict): A Generation_Log entry.
+
+    Returns:
+        list[unreal.Actor]: The generation's actors that still exist.
+    """
+    spawned_assets = gen_data.get("Spawned Assets", {})
+    actor_refs = gen_data.get("Actor References") or {}
+
+    found = {label: a for label, a in actor_refs.items() if a is not None and unreal.Object.is_valid(a)}
+    missing = [label for label in spawned_assets if label not in found]
+    if not missing:
+        return list(found.values())
+
+    folder = gen_data.get("FolderName")
+    if folder:
+        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        wanted = set(missing)
+        for actor in actor_subsystem.get_all_level_actors():
+            if str(actor.get_folder_path()) != folder:
+                continue
+            label = actor.get_actor_label()
+            if label in wanted:
+                found[label] = actor
+                wanted.discard(label)
+    else:
+        actor_index = ActorIndex()
+        for label in missing:
+            actor = actor_index.find(spawned_assets[label], label)
+            if actor is not None:
+                found[label] = actor
+
+    return list(found.values())
+
+def destroy_actors_bulk(actors: list, description: str = "Delete Generation") -> int:
+    """
+    Destroys many actors with one batched call inside one undo transaction.
+
+    Args:
+        actors (list[unreal.Actor]): Actors to destroy.
+        description (str): Undo history label.
+
+    Returns:
+        int: Number of actors destroyed.
+    """
+    if not actors:
+        return 0
+
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    with unreal.ScopedEditorTransaction(description):
+        if not actor_subsystem.destroy_actors(actors):
+            unreal.log_warning(f"[{description}] destroy_actors reported a failure.")
+    return sum(1 for a in actors if not unreal.Object.is_valid(a))
+
+# ============================
+# Instanced Static Mesh Output
+# ============================
+def to_transform(location: tuple, rotation: tuple, scale: tuple) -> unreal.Transform:
+    """
+    Builds an unreal.Transform from planner tuples.
+
+    Args:
+        location (tuple): World location (x, y, z).
+        rotation (tuple): (roll, pitch, yaw) in degrees, unreal.Rotator order.
+        scale (tuple): Scale (x, y, z).
+
+    Returns:
+        unreal.Transform: The combined transform.
+    """
+    return unreal.Transform(unreal.Vector(*location), unreal.Rotator(*rotation), unreal.Vector(*scale))
+
+def transform_record(transform: unreal.Transform) -> list:
+    """
+    Flattens an unreal.Transform into the [location, rotation, scale] record to_transform() reads.
+
+    Args:
+        transform (unreal.Transform): The transform to store.
+
+    Returns:
+        list: [(x, y, z), (roll, pitch, yaw), (sx, sy, sz)].
+    """
+    t = transform
+    r = t.rotation.rotator()
+    return [
+        (t.translation.x, t.translation.y, t.translation.z),
+        (r.roll, r.pitch, r.yaw),
+        (t.scale3d.x, t.scale3d.y, t.scale3d.z),
+    ]
+
+def label_instances(asset_name: str, group: list, key: str, indices: list = None) -> tuple:
+    """
+    Names one asset's instances "<asset>_<n>" and builds their record entries.
+
+    Args:
+        asset_name (str): Asset List name the placements belong to.
+        group (list[dict]): The asset's planner placements, in spawn order.
+        key (str): Component name or foliage type path holding the instances.
+        indices (list[int]): Instance indices returned by add_instances();
+            positions in `group` are used when missing.
+
+    Returns:
+        tuple: ({label: [key, index]}, {label: [x, y, z]},
+        [[location, rotation, scale], ...] by instance index).
+    """
+    indices = indices or []
+    instances = {}
+    locations = {}
+    records = [None] * len(group)
+    for k, placement in enumerate(group):
+        label = f"{asset_name}_{k + 1}"
+        index = indices[k] if k < len(indices) else k
+        instances[label] = [key, index]
+        locations[label] = list(placement["location"])
+        if index >= len(records):
+            records.extend([None] * (index + 1 - len(records)))
+        records[index] = [tuple(placement["location"]), tuple(placement["rotation"]), tuple(placement["scale"])]
+    return instances, locations, records
+
+def spawn_instance_actor(label: str, meshes: dict) -> tuple:
+    """
+    Spawns one empty actor holding a Hierarchical Instanced Static Mesh component per mesh.
+
+    Components are added through the SubobjectDataSubsystem so they are
+    real, saved components of the actor, named after their asset.
+
+    Args:
+        label (str): Outliner label for the new actor.
+        meshes (dict): { asset_name: unreal.StaticMesh }
+
+    Returns:
+        tuple: (actor, { asset_name: component }). actor is None if spawning failed.
+    """
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    actor = actor_subsystem.spawn_actor_from_class(unreal.Actor, unreal.Vector(0.0, 0.0, 0.0))
+    if not actor:
+        return None, {}
+    actor.set_actor_label(label)
+
+    subobjects = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    root_handle = subobjects.k2_gather_subobject_data_for_instance(actor)[0]
+
+    components = {}
+    for name, mesh in meshes.items():
+        handle, _ = subobjects.add_new_subobject(unreal.AddNewSubobjectParams(
+            parent_handle=root_handle,
+            new_class=unreal.HierarchicalInstancedStaticMeshComponent,
+        ))
+        data = unreal.SubobjectDataBlueprintFunctionLibrary.get_data(handle)
+        component = unreal.SubobjectDataBlueprintFunctionLibrary.get_object(data)
+        if not component:
+            unreal.log_warning(f"[Instances] Failed to add an instanced component for '{name}'.")
+            continue
+
+        subobjects.rename_subobject(handle, unreal.Text(name))
+        component.set_static_mesh(mesh)
+        components[name] = component
+
+    return actor, components
+
+class InstanceProxy:
+    """
+    Stands in for an actor when Apply() edits one instance of an instanced generation.
+
+    Mirrors the few actor methods Apply() calls; writes go into the owning
+    InstanceSet's transform snapshot and reach the engine on flush().
+    """
+
+    def __init__(self, instance_set, component_name: str, index: int):
+        self.instance_set = instance_set
+        self.component_name = component_name
+        self.index = index
+
+    def _transform(self) -> unreal.Transform:
+        return self.instance_set.transforms_of(self.component_name)[self.index]
+
+    def _set(self, transform: unreal.Transform):
+        self.instance_set.transforms_of(self.component_name)[self.index] = transform
+        self.instance_set.dirty.setdefault(self.component_name, set()).add(self.index)
+
+    def set_actor_location(self, location, sweep=False, teleport=False):
+        t = self._transform()
+        self._set(unreal.Transform(location, t.rotation.rotator(), t.scale3d))
+
+    def set_actor_rotation(self, rotation, teleport_physics=False):
+        t = self._transform()
+        self._set(unreal.Transform(t.translation, rotation, t.scale3d))
+
+    def set_actor_scale3d(self, scale):
+        t = self._transform()
+        self._set(unreal.Transform(t.translation, t.rotation.rotator(), scale))
+
+    def get_actor_bounds(self, only_colliding_components=False) -> tuple:
+        t = self._transform()
+        origin, extent = self.instance_set.bounds.get(self.component_name) or (None, None)
+        if not extent:
+            return t.translation, unreal.Vector(0.0, 0.0, 0.0)
+        r = t.rotation.rotator()
+        center, world_extent = planner.predict_bounds(
+            (t.translation.x, t.translation.y, t.translation.z),
+            (r.roll, r.pitch, r.yaw),
+            (t.scale3d.x, t.scale3d.y, t.scale3d.z),
+            extent, origin,
+        )
+        return unreal.Vector(*center), unreal.Vector(*world_extent)
+
+class InstanceSet:
+    """
+    The instances of one instanced generation, for bulk edits.
+
+    Each component's transforms come from the generation record's
+    "Instance Transforms" (read from the component, one engine call per
+    instance, only for records that predate it), are edited in memory
+    through InstanceProxy objects, and are written back by flush() with one
+    batch_update_instances_transforms() call per component and into the
+    record.
+    """
+
+    def __init__(self, actor, instances: dict, bounds: dict = None, records: dict = None):
+        self.actor = actor
+        self.instances = instances or {}   # { instance label: [component name, instance index] }
+        self.bounds = bounds or {}         # { component name: (origin, extent) }
+        self.records = records             # { component name: [[location, rotation, scale], ...] } or None
+        self.components = {c.get_name(): c for c in actor.get_components_by_class(unreal.InstancedStaticMeshComponent)}
+        self.transforms = {}               # { component name: [unreal.Transform] } snapshot
+        self.dirty = {}                    # { component name: set of edited indices }
+
+    def transforms_of(self, component_name: str) -> list:
+        if component_name not in self.transforms:
+            if self.records and component_name in self.records:
+                self.transforms[component_name] = [to_transform(*t) for t in self.records[component_name]]
+            else:
+                component = self.components[component_name]
+                self.transforms[component_name] = [
+                    component.get_instance_transform(i, True) for i in range(component.get_instance_count())
+                ]
+        return self.transforms[component_name]
+
+    def proxy(self, label: str):
+        """
+        Returns an InstanceProxy for a recorded instance label, or None if it no longer exists.
+        """
+        entry = self.instances.get(label)
+        if not entry:
+            return None
+        component_name, index = entry
+        component = self.components.get(component_name)
+        if component is None:
+            return None
+        if self.records and component_name in self.records:
+            count = len(self.records[component_name])
+        else:
+            count = component.get_instance_count()
+        if index >= count:
+            return None
+        return InstanceProxy(self, component_name, index)
+
+    def flush(self) -> int:
+        """
+        Writes every edited instance back to its component.
+
+        Returns:
+            int: Number of instances written.
+        """
+        written = 0
+        for component_name, indices in self.dirty.items():
+            if not indices:
+                continue
+            lo, hi = min(indices), max(indices)
+            transforms = self.transforms[component_name][lo:hi + 1]
+            self.components[component_name].batch_update_instances_transforms(lo, transforms, True, True, True)
+            if self.records and component_name in self.records:
+                stored = self.records[component_name]
+                for i in indices:
+                    stored[i] = transform_record(self.transforms[component_name][i])
+            written += len(indices)
+        self.dirty = {}
+        return written
+
+# ============================
+# Foliage Output
+# ============================
+FOLIAGE_TYPE_FOLDER = "/Game/AssetPlacer/FoliageTypes"   # Generated FoliageType assets live here
+
+def _editor_world():
+    return unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+
+def create_foliage_type(asset_name: str, mesh, gen_label: str):
+    """
+    Creates a FoliageType_InstancedStaticMesh asset for one asset of one generation.
+
+    Each generation gets its own foliage types, so its instances can be
+    replaced or removed without touching other generations'. Generation
+    numbering restarts every editor session, so the name is made unique
+    against the types already saved in FOLIAGE_TYPE_FOLDER; callers keep
+    the returned asset's real path.
+
+    Args:
+        asset_name (str): Asset List name of the mesh.
+        mesh (unreal.StaticMesh): The mesh to instance.
+        gen_label (str): Underscored generation name (e.g. "Generation_3").
+
+    Returns:
+        unreal.FoliageType_InstancedStaticMesh: The new asset, or None on failure.
+    """
+    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    _, unique_name = asset_tools.create_unique_asset_name(f"{FOLIAGE_TYPE_FOLDER}/FT_{gen_label}_{asset_name}", "")
+    foliage_type = asset_tools.create_asset(
+        unique_name, FOLIAGE_TYPE_FOLDER, unreal.FoliageType_InstancedStaticMesh, None
+    )
+    if not foliage_type:
+        unreal.log_warning(f"[Foliage] Failed to create a foliage type for '{asset_name}'.")
+        return None
+    foliage_type.set_editor_property("mesh", mesh)
+    return foliage_type
+
+def add_foliage_instances(foliage_type, transforms: list):
+    """Adds world-space transforms as instances of a foliage type in one call."""
+    unreal.InstancedFoliageActor.add_instances(_editor_world(), foliage_type, transforms)
+
+def remove_foliage_types(foliage_type_paths: list, description: str = "Remove Foliage",
+                         delete_assets: bool = False) -> int:
+    """
+    Removes every instance of the given foliage types from the level.
+
+    The instances are removed inside one undo transaction, so one Ctrl+Z
+    restores them. Deleting the FoliageType assets cannot be undone, which
+    is why it is opt-in and runs only after the transaction has closed.
+
+    Args:
+        foliage_type_paths (list[str]): Object paths of the foliage types.
+        description (str): Label of the transaction in the Undo History.
+        delete_assets (bool): Also delete the FoliageType assets themselves (not undoable).
+
+    Returns:
+        int: Number of foliage types cleared.
+    """
+    world = _editor_world()
+    cleared = []
+    with unreal.ScopedEditorTransaction(description):
+        for path in foliage_type_paths:
+            foliage_type = unreal.load_asset(path)
+            if not foliage_type:
+                continue
+            unreal.InstancedFoliageActor.remove_all_instances(world, foliage_type)
+            cleared.append(path)
+    if delete_assets:
+        for path in cleared:
+            unreal.EditorAssetLibrary.delete_asset(path)
+    return len(cleared)
+
+class FoliageSet(InstanceSet):
+    """
+    The foliage instances of one foliage generation, for bulk edits.
+
+    Foliage instances cannot be addressed individually from Python, so the
+    generation record keeps every transform under "Instance Transforms".
+    Edits go through InstanceProxy like an InstanceSet; flush() replaces a
+    dirty foliage type's instances with one remove_all_instances() and one
+    add_instances() call and writes the new transforms back to the record.
+    """
+
+    def __init__(self, instances: dict, records: dict, bounds: dict = None):
+        self.actor = None
+        self.instances = instances or {}   # { instance label: [foliage type path, instance index] }
+        self.records = records             # { foliage type path: [[location, rotation, scale], ...] }
+        self.bounds = bounds or {}         # { foliage type path: (origin, extent) }
+        self.components = {}
+        self.transforms = {}
+        self.dirty = {}
+
+    def transforms_of(self, component_name: str) -> list:
+        if component_name not in self.transforms:
+            self.transforms[component_name] = [to_transform(*t) for t in self.records.get(component_name, [])]
+        return self.transforms[component_name]
+
+    def proxy(self, label: str):
+        entry = self.instances.get(label)
+        if not entry:
+            return None
+        foliage_type_path, index = entry
+        if index >= len(self.records.get(foliage_type_path, ())):
+            return None
+        return InstanceProxy(self, foliage_type_path, index)
+
+    def flush(self) -> int:
+        world = _editor_world()
+        written = 0
+        for foliage_type_path, indices in self.dirty.items():
+            if not indices:
+                continue
+            foliage_type = unreal.load_asset(foliage_type_path)
+            if not foliage_type:
+                unreal.log_warning(f"[Foliage] Foliage type '{foliage_type_path}' not found.")
+                continue
+
+            transforms = self.transforms[foliage_type_path]
+            unreal.InstancedFoliageActor.remove_all_instances(world, foliage_type)
+            unreal.InstancedFoliageActor.add_instances(world, foliage_type, transforms)
+
+            self.records[foliage_type_path] = [transform_record(t) for t in transforms]
+            written += len(indices)
+        self.dirty = {}
+        return written
+
+# ============================
+# Editor Session State
+# ============================
+class PlacerSession:
+    """
+    Everything the Asset Placer keeps for the lifetime of the editor.
+
+    The generation log, the asset list with its parameters, the selected
+    splines and the spline/asset caches live here rather than on the
+    window, so closing and reopening the tool (or rebuilding its window
+    after reloading UE_PlacerTool) keeps them warm; reloading this module
+    starts a new session. One instance is shared
+    through get_session(); invalidate() drops only cached engine data,
+    reset() starts the session over. Generations from the tool window and
+    from batch runs are both written by record_generation().
+    """
+
+    def __init__(self):
+        self.Generation_Log = {}     # { "Generation N": {...} }
+        self.Generation_Count = 0
+        self.Spline_Store = planner.SplineStore()  # { spline key: spline data } shared by generations
+        self.Asset_File_Paths = {}   # { asset_name: asset_path }
+        self.Asset_Parameters = {}   # { asset_name: {param:value,...} }
+        self.Selected_Spline = None  # Level component reference
+        self.Selected_Spline_Path = {}  # Serialized spline data
+        self.Selected_Splines = []   # Every selected spline actor (batch Generate)
+        self.Selected_Spline_Paths = []  # Serialized spline data per selected spline
+        self.Spline_Cache = SplineCache(max_entries=512)  # { actor path: (fingerprint, spline data) }
+        self.Asset_Cache = AssetCache()  # { asset_path: (asset_obj, origin, extent) }
+        self.Asset_Cache.bind_editor_events()
+
+    def invalidate(self, splines: bool = True, assets: bool = True):
+        """
+        Drops cached engine data so the next Generate re-reads it from the level.
+
+        The generation log, asset list and selections are kept.
+
+        Args:
+            splines (bool): Clear the spline extraction cache.
+            assets (bool): Clear the loaded asset/bounds cache.
+        """
+        if splines:
+            self.Spline_Cache.invalidate()
+        if assets:
+            self.Asset_Cache.invalidate()
+
+    def reset(self):
+        """Forgets the generation log, asset list and selections and clears every cache."""
+        self.Generation_Log = {}
+        self.Generation_Count = 0
+        self.Spline_Store = planner.SplineStore()
+        self.Asset_File_Paths = {}
+        self.Asset_Parameters = {}
+        self.Selected_Spline = None
+        self.Selected_Spline_Path = {}
+        self.Selected_Splines = []
+        self.Selected_Spline_Paths = []
+        self.invalidate()
+
+    def next_generation_name(self) -> str:
+        """Return the first free "Generation N" name in the Generation Log."""
+        base_name = "Generation"
+        index = 1
+        while f"{base_name} {index}" in self.Generation_Log:
+            index += 1
+        return f"{base_name} {index}"
+
+    def record_generation(self, spawned_actors: list, assets: list, asset_file_paths: dict,
+                          spline_path: dict, spawn: dict = None) -> str:
+        """
+        Logs all data from a completed generation into Generation_Log.
+
+        Stores asset parameters, file paths, spawn locations, level
+        references and the spawn pass's order/distances/samples, so the
+        generation can later be selected, applied to and deleted.
+
+        Args:
+            spawned_actors (list[unreal.Actor]): Actors the generation spawned
+                (the instance actor for instanced output, none for foliage).
+            assets (list[dict]): {"name", "params"} per placed asset, in "Asset List" order.
+            asset_file_paths (dict): { asset_name: asset_path }
+            spline_path (dict): Spline the generation was placed along.
+            spawn (dict): Optional spawn pass data: "Order" (labels), "Distances"
+                and "Placements" ({label: ...}), "Seed", and "Output" for
+                instanced/foliage output ("Output Mode", "Instances",
+                "Components", "Locations", "Transforms").
+
+        Returns:
+            str: The new generation's name (e.g. "Generation 3").
+        """
+        spawn = spawn or {}
+
+        # --- Safety Cleanup ---
+        # Remove invalid or empty entries before logging a new generation
+        invalid_gens = [k for k, v in self.Generation_Log.items() if not v or "Spawned Assets" not in v]
+        for g in invalid_gens:
+            if self.Generation_Log[g]:
+                self.Spline_Store.release(self.Generation_Log[g].get("Spline Key"))
+            del self.Generation_Log[g]
+
+        # --- Unique Generation Naming ---
+        gen_name = self.next_generation_name()
+
+        # --- Build Log Entry ---
+        log_entry = {
+            "Spline Key": None,
+            "Asset List": {},
+            "Parameters": {},
+            "Spawned Assets": {},
+            "Spawn Locations": {},
+            "Actor References": {},
+        }
+
+        # --- Store spline data (shared by key, one copy per unique spline) ---
+        if spline_path:
+            try:
+                log_entry["Spline Key"] = self.Spline_Store.intern(spline_path)
+                unreal.log(f"[Generation Log] Stored spline data for {gen_name}.")
+            except Exception as e:
+                unreal.log_warning(f"[Generation Log] Failed to store spline data: {e}")
+        else:
+            unreal.log_warning(f"[Generation Log] No spline data found for {gen_name}.")
+
+        # --- Asset List & Parameters ---
+        for asset in assets:
+            asset_name = asset["name"]
+            log_entry["Asset List"][asset_name] = asset_file_paths.get(asset_name, "Unknown Path")
+            log_entry["Parameters"][asset_name] = dict(asset["params"])
+
+        # --- Spawned Actors ---
+        for actor in spawned_actors:
+            if not actor:
+                continue
+            try:
+                actor_label = actor.get_actor_label()
+                actor_loc = actor.get_actor_location()
+                log_entry["Spawned Assets"][actor_label] = actor.get_path_name()
+                log_entry["Actor References"][actor_label] = actor
+                log_entry["Spawn Locations"][actor_label] = [actor_loc.x, actor_loc.y, actor_loc.z]
+            except Exception as e:
+                unreal.log_warning(f"[Generation Log] Failed to log actor: {e}")
+
+        # --- Spawn order, distances and per-placement samples ---
+        if "Order" in spawn:
+            log_entry["Spawn Order"] = list(spawn["Order"])
+        else:
+            log_entry["Spawn Order"] = [a.get_actor_label() for a in spawned_actors if unreal.Object.is_valid(a)]
+        log_entry["Spawn Distances"] = dict(spawn.get("Distances", {}))
+        log_entry["Placements"] = dict(spawn.get("Placements", {}))
+        log_entry["Seed"] = spawn.get("Seed")
+
+        # --- Instanced/foliage output: placements live as instances, not actors ---
+        output = spawn.get("Output")
+        if output:
+            log_entry["Output Mode"] = output["Output Mode"]
+            log_entry["Instances"] = dict(output["Instances"])
+            log_entry["Instance Components"] = dict(output["Components"])
+            log_entry["Spawn Locations"] = dict(output["Locations"])
+            if "Transforms" in output:
+                log_entry["Instance Transforms"] = dict(output["Transforms"])
+
+        # --- Add to dictionary ---
+        self.Generation_Log[gen_name] = log_entry
+        self.Generation_Count = len(self.Generation_Log)
+        unreal.log(f"[Generation Log] Added {gen_name} with {len(spawned_actors)} spawned assets.")
+        return gen_name
+
+_SESSION = None   # The PlacerSession shared by every window and batch run
+
+def get_session() -> PlacerSession:
+    """Returns the editor-wide PlacerSession, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = PlacerSession()
+    return _SESSION
@@ -0,0 +1,1389 @@
+# ============================
+# Standard Library Imports
+# ============================
+import bisect
+import hashlib
+import math
+import random
+import time
+from collections import OrderedDict
+
+# ============================
+# Optional Imports
+# ============================
+_NUMPY = False  # Not probed yet; set to the module or None on first use
+
+def _numpy():
+    """
+    Imports NumPy on first use and caches the result.
+
+    Importing NumPy costs a noticeable fraction of a second, so it is
+    deferred until a vectorized path actually runs instead of being paid
+    every time the tool window opens.
+
+    Returns:
+        module | None: The numpy module, or None when it is not installed.
+    """
+    global _NUMPY
+    if _NUMPY is False:
+        try:
+            import numpy
+        except ImportError:  # Unreal's bundled Python does not ship NumPy
+            numpy = None
+        _NUMPY = numpy
+    return _NUMPY
+
+# ============================
+# Planner Constants
+# ============================
+EPS = 0.1                 # Gap added to every edge-to-edge advance
+MAX_TRIALS = 25           # Overlap retries per placement
+OVERLAP_PADDING = 2.0     # Extra clearance between two placements
+FALLBACK_RADIUS = 50.0    # Overlap radius used when an asset has no known extent
+HERMITE_STEPS = 16        # Curve samples per spline segment when rebuilding from tangents
+ADAPTIVE_MAX_ANGLE = 5.0  # Max direction change (degrees) between neighbouring adaptive samples
+ADAPTIVE_MAX_DEPTH = 6    # Max bisection depth per segment (64 sub-samples)
+
+# ============================
+# Math / Vector Utility Functions
+# ============================
+def lerp(a: float, b: float, t: float) -> float:
+    """
+    Linearly interpolates between two scalar values.
+
+    Args:
+        a (float): Starting value.
+        b (float): Target value.
+        t (float): Interpolation factor between 0.0 and 1.0.
+
+    Returns:
+        float: The interpolated result between a and b.
+    """
+    return a + (b - a) * t
+
+def lerp_tuple(a: tuple, b: tuple, t: float) -> tuple:
+    """
+    Linearly interpolates between two 3D tuples.
+
+    Args:
+        a (tuple): Starting (x, y, z) values.
+        b (tuple): Target (x, y, z) values.
+        t (float): Interpolation factor between 0.0 and 1.0.
+
+    Returns:
+        tuple: Interpolated (x, y, z) values.
+    """
+    return (lerp(a[0], b[0], t),
+            lerp(a[1], b[1], t),
+            lerp(a[2], b[2], t))
+
+def find_segment(distance: float, distances: list) -> int:
+    """
+    Finds the spline segment containing a distance by bisection.
+
+    Args:
+        distance (float): The target distance along the spline.
+        distances (list[float]): Cumulative (ascending) distances of spline points.
+
+    Returns:
+        int: Index i such that distances[i] <= distance <= distances[i + 1].
+    """
+    idx = bisect.bisect_right(distances, distance) - 1
+    return max(0, min(idx, len(distances) - 2))
+
+def interpolate_segment(idx: int, distance: float, distances: list, positions: list, directions: list) -> tuple:
+    """
+    Interpolates position and normalized direction inside one spline segment.
+
+    Args:
+        idx (int): Segment start index.
+        distance (float): The target distance along the spline.
+        distances (list[float]): Cumulative distances of spline points.
+        positions (list[tuple]): World positions of spline points.
+        directions (list[tuple]): Tangent directions of spline segments.
+
+    Returns:
+        tuple: (position, direction) — both as 3D tuples.
+    """
+    d0, d1 = distances[idx], distances[idx + 1]
+    seg_len = d1 - d0 if (d1 - d0) != 0 else 1e-6
+    t = (distance - d0) / seg_len
+
+    pos = lerp_tuple(positions[idx], positions[idx + 1], t)
+    dirv = lerp_tuple(directions[idx], directions[idx + 1], t)
+
+    mag = math.sqrt(dirv[0]**2 + dirv[1]**2 + dirv[2]**2)
+    if mag > 1e-6:
+        dirv = (dirv[0]/mag, dirv[1]/mag, dirv[2]/mag)
+
+    return pos, dirv
+
+def sample_at_distance(distance: float, distances: list, positions: list, directions: list) -> tuple:
+    """
+    Samples a position and direction along the spline at a given distance.
+
+    Performs linear interpolation between spline points to calculate the
+    world-space location and normalized direction at the specified distance.
+    The segment is found by bisection, so each call is O(log points).
+
+    Args:
+        distance (float): The target distance along the spline.
+        distances (list[float]): Cumulative distances of spline points.
+        positions (list[tuple]): World positions of spline points.
+        directions (list[tuple]): Tangent directions of spline segments.
+
+    Returns:
+        tuple: (position, direction) — both as 3D tuples.
+    """
+    if distance <= distances[0]:
+        return positions[0], directions[0]
+    if distance >= distances[-1]:
+        return positions[-1], directions[-1]
+
+    idx = find_segment(distance, distances)
+    return interpolate_segment(idx, distance, distances, positions, directions)
+
+class SplineCursor:
+    """
+    Stateful sampler for callers that walk a spline in ascending distance.
+
+    Remembers the last segment and steps forward from it, so a full pass
+    over the spline costs O(points + samples) in total. Requests that move
+    backwards fall back to bisection.
+    """
+
+    def __init__(self, distances: list, positions: list, directions: list):
+        self.distances = distances
+        self.positions = positions
+        self.directions = directions
+        self.idx = 0
+
+    def sample(self, distance: float) -> tuple:
+        """
+        Samples a position and direction at a distance (see sample_at_distance()).
+
+        Args:
+            distance (float): The target distance along the spline.
+
+        Returns:
+            tuple: (position, direction) — both as 3D tuples.
+        """
+        distances = self.distances
+        if distance <= distances[0]:
+            return self.positions[0], self.directions[0]
+        if distance >= distances[-1]:
+            return self.positions[-1], self.directions[-1]
+
+        idx = self.idx
+        if distance < distances[idx]:
+            idx = find_segment(distance, distances)
+        else:
+            last = len(distances) - 2
+            while idx < last and distance > distances[idx + 1]:
+                idx += 1
+        self.idx = idx
+        return interpolate_segment(idx, distance, distances, self.positions, self.directions)
+
+class ArcLengthTable:
+    """
+    Arc-length lookup table over dense spline samples with O(1) lookups.
+
+    The distance range is split into equal buckets, each remembering the
+    first sample segment it overlaps; a lookup jumps to its bucket and
+    scans at most the few segments inside it. Combined with adaptive
+    samples (dense on bends) this follows the curve without uniformly
+    over-sampling straight stretches.
+    """
+
+    def __init__(self, distances: list, positions: list, directions: list):
+        self.distances = distances
+        self.positions = positions
+        self.directions = directions
+
+        self.start = distances[0] if distances else 0.0
+        span = (distances[-1] - self.start) if distances else 0.0
+        self.bucket_count = max(1, len(distances))
+        self.bucket_size = span / self.bucket_count if span > 0 else 1.0
+        self.bucket_segment = []
+        segment = 0
+        for b in range(self.bucket_count):
+            bucket_start = self.start + b * self.bucket_size
+            while segment < len(distances) - 2 and distances[segment + 1] <= bucket_start:
+                segment += 1
+            self.bucket_segment.append(segment)
+
+    def sample(self, distance: float) -> tuple:
+        """
+        Samples a position and direction at a distance (see sample_at_distance()).
+
+        Args:
+            distance (float): The target distance along the spline.
+
+        Returns:
+            tuple: (position, direction) — both as 3D tuples.
+        """
+        distances = self.distances
+        if distance <= distances[0]:
+            return self.positions[0], self.directions[0]
+        if distance >= distances[-1]:
+            return self.positions[-1], self.directions[-1]
+
+        bucket = min(int((distance - self.start) / self.bucket_size), self.bucket_count - 1)
+        idx = self.bucket_segment[bucket]
+        last = len(distances) - 2
+        while idx < last and distance > distances[idx + 1]:
+            idx += 1
+        return interpolate_segment(idx, distance, distances, self.positions, self.directions)
+
+def sample_many(sample_distances, distances: list, positions: list, directions: list) -> tuple:
+    """
+    Samples many distances along the spline in one call.
+
+    Uses NumPy (searchsorted + vectorized lerp) when it is installed and
+    falls back to per-sample bisection otherwise. Results match
+    sample_at_distance() and pitch_yaw_from_direction() sample for sample.
+
+    Args:
+        sample_distances (list[float] | numpy.ndarray): Distances to sample, in any order.
+        distances (list[float]): Cumulative distances of spline points.
+        positions (list[tuple]): World positions of spline points.
+        directions (list[tuple]): Tangent directions of spline segments.
+
+    Returns:
+        tuple: (positions, directions, yaws, pitches). With NumPy these are
+        (N, 3), (N, 3), (N,) and (N,) float arrays; without it they are
+        lists of 3D tuples and floats.
+    """
+    np = _numpy()
+    if np is None:
+        out_pos, out_dir, out_yaw, out_pitch = [], [], [], []
+        for d in sample_distances:
+            pos, dirv = sample_at_distance(float(d), distances, positions, directions)
+            pitch, yaw = pitch_yaw_from_direction(dirv)
+            out_pos.append(pos)
+            out_dir.append(dirv)
+            out_yaw.append(yaw)
+            out_pitch.append(pitch)
+        return out_pos, out_dir, out_yaw, out_pitch
+
+    d = np.asarray(sample_distances, dtype=float)
+    knots = np.asarray(distances, dtype=float)
+    pts = np.asarray(positions, dtype=float)
+    dirs = np.asarray(directions, dtype=float)
+
+    if len(knots) < 2:
+        pos = np.repeat(pts[:1], len(d), axis=0)
+        dirv = np.repeat(dirs[:1], len(d), axis=0)
+    else:
+        clamped = np.clip(d, knots[0], knots[-1])
+        idx = np.clip(np.searchsorted(knots, clamped, side="right") - 1, 0, len(knots) - 2)
+        seg_len = knots[idx + 1] - knots[idx]
+        seg_len = np.where(seg_len != 0, seg_len, 1e-6)
+        t = ((clamped - knots[idx]) / seg_len)[:, None]
+
+        pos = pts[idx] + (pts[idx + 1] - pts[idx]) * t
+        dirv = dirs[idx] + (dirs[idx + 1] - dirs[idx]) * t
+
+        # Outside the spline the end points are returned unchanged
+        before = d <= knots[0]
+        after = d >= knots[-1]
+        pos[before], dirv[before] = pts[0], dirs[0]
+        pos[after], dirv[after] = pts[-1], dirs[-1]
+
+        mag = np.linalg.norm(dirv, axis=1)
+        inside = ~(before | after) & (mag > 1e-6)
+        dirv[inside] = dirv[inside] / mag[inside, None]
+
+    mag_xy = np.hypot(dirv[:, 0], dirv[:, 1])
+    vertical = mag_xy < 1e-6
+    yaw = np.where(vertical, 0.0, np.degrees(np.arctan2(dirv[:, 1], dirv[:, 0])))
+    pitch = np.where(vertical, np.where(dirv[:, 2] > 0, 90.0, -90.0), np.degrees(np.arctan2(dirv[:, 2], mag_xy)))
+    return pos, dirv, yaw, pitch
+
+def pitch_yaw_from_direction(dir_vec: tuple) -> tuple:
+    """
+    Converts a 3D direction vector into pitch and yaw angles in degrees.
+
+    Args:
+        dir_vec (tuple): Normalized direction vector (x, y, z).
+
+    Returns:
+        tuple: (pitch, yaw) in degrees.
+    """
+    x, y, z = dir_vec
+    mag_xy = math.hypot(x, y)
+
+    if mag_xy < 1e-6:
+        yaw = 0.0
+        pitch = 90.0 if z > 0 else -90.0
+    else:
+        yaw = math.degrees(math.atan2(y, x))
+        pitch = math.degrees(math.atan2(z, mag_xy))
+
+    return pitch, yaw
+
+def angle_between(a: tuple, b: tuple) -> float:
+    """
+    Returns the angle in degrees between two direction vectors.
+
+    Args:
+        a (tuple): First direction (x, y, z).
+        b (tuple): Second direction (x, y, z).
+
+    Returns:
+        float: Angle in degrees (0.0 when either vector is zero-length).
+    """
+    mag = math.sqrt(a[0]**2 + a[1]**2 + a[2]**2) * math.sqrt(b[0]**2 + b[1]**2 + b[2]**2)
+    if mag < 1e-12:
+        return 0.0
+    cos_angle = (a[0]*b[0] + a[1]*b[1] + a[2]*b[2]) / mag
+    return math.degrees(math.acos(max(-1.0, min(1.0, cos_angle))))
+
+def right_vector(dir_vec: tuple) -> tuple:
+    """
+    Returns the horizontal (XY) unit vector perpendicular to a direction.
+
+    Used for scatter offsets, which push assets sideways off the spline
+    without changing their height.
+
+    Args:
+        dir_vec (tuple): Direction vector (x, y, z).
+
+    Returns:
+        tuple: Normalized right vector (x, y, 0.0).
+    """
+    right = (-dir_vec[1], dir_vec[0], 0.0)
+    rmag = math.hypot(right[0], right[1])
+    if rmag > 1e-6:
+        return (right[0] / rmag, right[1] / rmag, 0.0)
+    return (1.0, 0.0, 0.0)
+
+def rotation_axes(rotation: tuple) -> tuple:
+    """
+    Builds the local X/Y/Z axes of a rotation, matching UE's FRotationMatrix.
+
+    Args:
+        rotation (tuple): (roll, pitch, yaw) in degrees.
+
+    Returns:
+        tuple: (x_axis, y_axis, z_axis) as 3D tuples in world space.
+    """
+    roll, pitch, yaw = (math.radians(float(a)) for a in rotation)
+    sr, cr = math.sin(roll), math.cos(roll)
+    sp, cp = math.sin(pitch), math.cos(pitch)
+    sy, cy = math.sin(yaw), math.cos(yaw)
+
+    x_axis = (cp * cy, cp * sy, sp)
+    y_axis = (sr * sp * cy - cr * sy, sr * sp * sy + cr * cy, -sr * cp)
+    z_axis = (-(cr * sp * cy + sr * sy), cy * sr - cr * sp * sy, cr * cp)
+    return x_axis, y_axis, z_axis
+
+def predict_bounds(location: tuple, rotation: tuple, scale: tuple, extent: tuple, origin: tuple = None) -> tuple:
+    """
+    Predicts the world-space bounding box of an asset before it is spawned.
+
+    Scales the asset's local bounds, rotates them, and returns the
+    axis-aligned box that encloses the result — the same box
+    get_components_bounding_box() would report after spawning.
+
+    Args:
+        location (tuple): Actor location (x, y, z).
+        rotation (tuple): (roll, pitch, yaw) in degrees, or None for no rotation.
+        scale (tuple): Actor scale (x, y, z).
+        extent (tuple): Asset bounds half extent in local space.
+        origin (tuple): Asset bounds origin relative to its pivot. Defaults to the pivot.
+
+    Returns:
+        tuple: (center, world_extent) as 3D tuples.
+    """
+    origin = origin or (0.0, 0.0, 0.0)
+    local_extent = [abs(extent[i] * scale[i]) for i in range(3)]
+    local_origin = [origin[i] * scale[i] for i in range(3)]
+
+    if rotation is None or not any(rotation):
+        center = tuple(location[i] + local_origin[i] for i in range(3))
+        return center, tuple(local_extent)
+
+    axes = rotation_axes(rotation)
+    center = tuple(location[j] + sum(axes[i][j] * local_origin[i] for i in range(3)) for j in range(3))
+    world_extent = tuple(sum(abs(axes[i][j]) * local_extent[i] for i in range(3)) for j in range(3))
+    return center, world_extent
+
+# ============================
+# Spatial Hash (Overlap Queries)
+# ============================
+class SpatialHash:
+    """
+    Uniform grid of bounding spheres keyed by integer cell coordinates.
+
+    Each accepted sphere is stored in every cell its padded bounds cover,
+    so a query only looks at the cells under its own bounds. Cells are
+    kept at least one stored sphere across: when a larger sphere arrives
+    the grid is rebuilt with (at least) twice the cell size, so scaled-up
+    assets never make a query walk a cube of mostly empty cells. With
+    `planar` set cells are 2D columns, which suits placements that run
+    along a spline; z is still part of the distance test.
+    """
+
+    def __init__(self, cell_size: float, padding: float = 0.0, planar: bool = False):
+        self.cell_size = max(float(cell_size), 1e-3)
+        self.padding = float(padding)
+        self.planar = planar
+        self.cells = {}          # { (ix, iy[, iz]): [(center, radius), ...] }
+        self.spheres = []        # Every stored (center, radius), for rebuilds
+        self.count = 0
+
+    def _cells(self, center: tuple, reach: float):
+        """Yields the keys of every cell the box center ± reach touches."""
+        size = self.cell_size
+        x0, x1 = math.floor((center[0] - reach) / size), math.floor((center[0] + reach) / size)
+        y0, y1 = math.floor((center[1] - reach) / size), math.floor((center[1] + reach) / size)
+        if self.planar:
+            for ix in range(x0, x1 + 1):
+                for iy in range(y0, y1 + 1):
+                    yield (ix, iy)
+            return
+        z0, z1 = math.floor((center[2] - reach) / size), math.floor((center[2] + reach) / size)
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                for iz in range(z0, z1 + 1):
+                    yield (ix, iy, iz)
+
+    def _store(self, center: tuple, radius: float):
+        for key in self._cells(center, radius + self.padding):
+            self.cells.setdefault(key, []).append((center, radius))
+
+    def insert(self, center: tuple, radius: float):
+        """
+        Stores a bounding sphere.
+
+        Args:
+            center (tuple): Sphere center (x, y, z).
+            radius (float): Sphere radius.
+        """
+        self.spheres.append((center, radius))
+        self.count += 1
+
+        needed = 2.0 * (radius + self.padding)
+        if needed > self.cell_size:
+            self.cell_size = max(needed, self.cell_size * 2.0)
+            self.cells = {}
+            for c, r in self.spheres:
+                self._store(c, r)
+        else:
+            self._store(center, radius)
+
+    def overlaps(self, center: tuple, radius: float, padding: float = None) -> bool:
+        """
+        Checks whether a sphere overlaps any stored sphere.
+
+        Args:
+            center (tuple): Sphere center (x, y, z).
+            radius (float): Sphere radius.
+            padding (float): Extra clearance required between spheres; at most
+                the grid's own padding, which defaults it.
+
+        Returns:
+            bool: True if any stored sphere is closer than the combined radii plus padding.
+        """
+        if not self.count:
+            return False
+
+        padding = self.padding if padding is None else min(padding, self.padding)
+        x, y, z = center
+        for key in self._cells(center, radius):
+            bucket = self.cells.get(key)
+            if not bucket:
+                continue
+            for (ox, oy, oz), other_radius in bucket:
+                limit = radius + other_radius + padding
+                if (x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2 < limit * limit:
+                    return True
+        return False
+
+# ============================
+# LRU Cache
+# ============================
+class LRUCache:
+    """
+    Small least-recently-used mapping with a fixed entry cap.
+
+    Lookups move the entry to the most-recent end; inserting past the cap
+    evicts the least recently used entry.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max(1, int(max_entries))
+        self._data = OrderedDict()
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self) -> list:
+        """Returns the cached keys, least recently used first."""
+        return list(self._data.keys())
+
+    def get(self, key, default=None):
+        """Returns the cached value for key (marking it recently used) or default."""
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key, value):
+        """Stores value under key, evicting the least recently used entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Removes key and returns its value, or default when missing."""
+        return self._data.pop(key, default)
+
+    def clear(self):
+        """Drops every entry."""
+        self._data.clear()
+
+# ============================
+# Structured Logging
+# ============================
+LOG_WARNING = 0   # Warnings only
+LOG_SUMMARY = 1   # Warnings + one summary per operation (default)
+LOG_VERBOSE = 2   # Summary + the buffered per-placement trace
+
+class _NullTimer:
+    """Context manager returned by PlacerLogger.timed() while profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _PhaseTimer:
+    """Adds the time spent inside a `with` block to one PlacerLogger timing."""
+
+    __slots__ = ("logger", "key", "start")
+
+    def __init__(self, logger, key: str):
+        self.logger = logger
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.logger.add_call(self.key, time.perf_counter() - self.start)
+        return False
+
+class PlacerLogger:
+    """
+    Level-gated logger that batches per-placement diagnostics.
+
+    Hot loops call count() and, when `verbose` is True, trace(); nothing is
+    written until summary(), which emits one line of counters and timings
+    per operation and (at LOG_VERBOSE) the buffered trace as one block.
+    Sinks default to print() and are swapped for unreal.log/log_warning
+    inside the editor.
+
+    Coarse phase timings (add_time()) are always kept. With `profile` set,
+    timed() blocks inside the hot loops also record per-call timings and
+    call counts; otherwise timed() costs one shared no-op context manager.
+    """
+
+    def __init__(self, level: int = LOG_SUMMARY, info_sink=print, warning_sink=print):
+        self.level = level
+        self.info_sink = info_sink
+        self.warning_sink = warning_sink
+        self.profile = False     # Per-call timings in hot loops (see timed())
+        self.counts = {}
+        self.timings = {}
+        self.calls = {}          # { timing key: timed() calls }
+        self.last_report = None  # report() of the last finished operation
+        self._trace = []
+        self._warnings = {}      # { message: occurrences }
+        self._start = time.perf_counter()
+
+    @property
+    def verbose(self) -> bool:
+        """True when per-placement trace lines are kept (check before formatting them)."""
+        return self.level >= LOG_VERBOSE
+
+    def begin(self):
+        """Resets counters, timings and buffers for a new operation."""
+        self.counts = {}
+        self.timings = {}
+        self.calls = {}
+        self._trace = []
+        self._warnings = {}
+        self._start = time.perf_counter()
+
+    def count(self, key: str, amount: int = 1):
+        """Adds to a named counter."""
+        self.counts[key] = self.counts.get(key, 0) + amount
+
+    def add_time(self, key: str, seconds: float):
+        """Adds to a named cumulative timing."""
+        self.timings[key] = self.timings.get(key, 0.0) + seconds
+
+    def add_call(self, key: str, seconds: float):
+        """Adds one timed call to a named timing."""
+        self.timings[key] = self.timings.get(key, 0.0) + seconds
+        self.calls[key] = self.calls.get(key, 0) + 1
+
+    def timed(self, key: str):
+        """
+        Returns a context manager timing its block under `key` while profiling.
+
+        Example:
+            with log.timed("spawn_actor_from_object"):
+                actor = actor_subsystem.spawn_actor_from_object(...)
+        """
+        if not self.profile:
+            return _NULL_TIMER
+        return _PhaseTimer(self, key)
+
+    def report(self) -> dict:
+        """
+        Snapshots the operation's instrumentation.
+
+        Returns:
+            dict: {"Total": seconds, "Timings": {key: seconds},
+            "Calls": {key: timed calls}, "Counts": {key: count}}.
+        """
+        return {
+            "Total": round(time.perf_counter() - self._start, 6),
+            "Timings": {k: round(v, 6) for k, v in self.timings.items()},
+            "Calls": dict(self.calls),
+            "Counts": dict(self.counts),
+        }
+
+    def trace(self, message: str):
+        """Buffers a per-placement diagnostic line (kept only at LOG_VERBOSE)."""
+        if self.level >= LOG_VERBOSE:
+            self._trace.append(message)
+
+    def info(self, message: str):
+        """Writes an informational line immediately (LOG_SUMMARY and above)."""
+        if self.level >= LOG_SUMMARY:
+            self.info_sink(message)
+
+    def warning(self, message: str, batch: bool = False):
+        """
+        Writes a warning immediately, or buffers it until summary() when batch is True.
+
+        Buffered warnings are collapsed into a count plus the first few distinct messages.
+        """
+        if batch:
+            self._warnings[message] = self._warnings.get(message, 0) + 1
+        else:
+            self.warning_sink(message)
+
+    def summary(self, title: str) -> str:
+        """
+        Emits one summary line for the operation and flushes the buffers.
+
+        Args:
+            title (str): Prefix such as "[Generate] Generation 3".
+
+        Returns:
+            str: The summary line.
+        """
+        self.last_report = self.report()
+        total = self.last_report["Total"]
+        parts = [f"{k}={v}" for k, v in self.counts.items()]
+        parts += [f"{k}={v:.3f}s" + (f"/{self.calls[k]}" if k in self.calls else "") for k, v in self.timings.items()]
+        parts.append(f"total={total:.3f}s")
+        line = f"{title}: " + ", ".join(parts)
+
+        if self._warnings:
+            distinct = list(self._warnings.items())
+            shown = "; ".join(f"{msg} (x{n})" if n > 1 else msg for msg, n in distinct[:5])
+            more = f" (+{len(distinct) - 5} more)" if len(distinct) > 5 else ""
+            self.warning_sink(f"{title}: {sum(self._warnings.values())} warnings: {shown}{more}")
+        if self._trace:
+            self.info_sink(f"{title} trace:\n" + "\n".join(self._trace))
+        self.info(line)
+
+        self._trace = []
+        self._warnings = {}
+        return line
+
+def format_report(title: str, report: dict, limit: int = 5) -> str:
+    """
+    Formats a PlacerLogger.report() as one short line, slowest phases first.
+
+    Args:
+        title (str): Operation name, e.g. "Generate".
+        report (dict): Output of PlacerLogger.report().
+        limit (int): Number of timings shown.
+
+    Returns:
+        str: e.g. "Generate 1.204s | spawn 0.912s, plan 0.201s (x1000 sample)".
+    """
+    if not report:
+        return ""
+    calls = report.get("Calls", {})
+    timings = sorted(report.get("Timings", {}).items(), key=lambda kv: kv[1], reverse=True)
+    parts = [f"{k} {v:.3f}s" + (f" x{calls[k]}" if k in calls else "") for k, v in timings[:limit]]
+    return f"{title} {report.get('Total', 0.0):.3f}s | " + ", ".join(parts)
+
+# ============================
+# Cubic Hermite Spline Evaluation
+# ============================
+def hermite_point(p0: tuple, p1: tuple, t0: tuple, t1: tuple, u: float) -> tuple:
+    """
+    Evaluates one cubic Hermite segment, matching UE's spline curve maths.
+
+    Args:
+        p0 (tuple): Segment start location.
+        p1 (tuple): Segment end location.
+        t0 (tuple): Tangent leaving p0.
+        t1 (tuple): Tangent arriving at p1.
+        u (float): Segment parameter between 0.0 and 1.0.
+
+    Returns:
+        tuple: The point on the curve.
+    """
+    u2 = u * u
+    u3 = u2 * u
+    h00 = 2*u3 - 3*u2 + 1
+    h10 = u3 - 2*u2 + u
+    h01 = -2*u3 + 3*u2
+    h11 = u3 - u2
+    return tuple(h00*p0[k] + h10*t0[k] + h01*p1[k] + h11*t1[k] for k in range(3))
+
+def hermite_derivative(p0: tuple, p1: tuple, t0: tuple, t1: tuple, u: float) -> tuple:
+    """
+    Evaluates the derivative of one cubic Hermite segment (see hermite_point()).
+
+    Returns:
+        tuple: The unnormalized curve tangent at u.
+    """
+    u2 = u * u
+    d00 = 6*u2 - 6*u
+    d10 = 3*u2 - 4*u + 1
+    d01 = -6*u2 + 6*u
+    d11 = 3*u2 - 2*u
+    return tuple(d00*p0[k] + d10*t0[k] + d01*p1[k] + d11*t1[k] for k in range(3))
+
+def _normalize(v: tuple) -> tuple:
+    length = math.sqrt(v[0]**2 + v[1]**2 + v[2]**2)
+    if length < 1e-12:
+        return (1.0, 0.0, 0.0)
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+def _hermite_segment_numpy(p0, p1, t0, t1, steps):
+    np = _numpy()
+    u = np.linspace(0.0, 1.0, steps + 1)[:, None]
+    u2 = u * u
+    u3 = u2 * u
+    P0, P1, T0, T1 = (np.asarray(v, dtype=float) for v in (p0, p1, t0, t1))
+    pos = (2*u3 - 3*u2 + 1)*P0 + (u3 - 2*u2 + u)*T0 + (-2*u3 + 3*u2)*P1 + (u3 - u2)*T1
+    der = (6*u2 - 6*u)*P0 + (3*u2 - 4*u + 1)*T0 + (-6*u2 + 6*u)*P1 + (3*u2 - 2*u)*T1
+    lengths = np.linalg.norm(der, axis=1, keepdims=True)
+    der = np.where(lengths > 1e-12, der / np.maximum(lengths, 1e-12), np.array([1.0, 0.0, 0.0]))
+    chord = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(pos, axis=0), axis=1))))
+    return chord.tolist(), [tuple(p) for p in pos.tolist()], [tuple(d) for d in der.tolist()]
+
+def _hermite_segment_python(p0, p1, t0, t1, steps):
+    positions = []
+    directions = []
+    chord = [0.0]
+    for k in range(steps + 1):
+        u = k / steps
+        pos = hermite_point(p0, p1, t0, t1, u)
+        if positions:
+            prev = positions[-1]
+            chord.append(chord[-1] + math.sqrt((pos[0]-prev[0])**2 + (pos[1]-prev[1])**2 + (pos[2]-prev[2])**2))
+        positions.append(pos)
+        directions.append(_normalize(hermite_derivative(p0, p1, t0, t1, u)))
+    return chord, positions, directions
+
+def hermite_arrays(point_data: list, steps: int = HERMITE_STEPS) -> tuple:
+    """
+    Rebuilds dense arc-length samples from captured spline points and tangents.
+
+    Each segment is evaluated as a cubic Hermite curve at `steps` parameter
+    values; the accumulated chord lengths are then rescaled so every segment
+    ends exactly at the "Distance Along Spline" UE reported for its end point.
+    The result reproduces the engine's curve without any per-sample engine
+    calls and can be fed straight into ArcLengthTable.
+
+    Args:
+        point_data (list[dict]): "Point Data" entries with "World Location",
+            "Tangent" and "Distance Along Spline".
+        steps (int): Samples per segment.
+
+    Returns:
+        tuple: (distances, positions, directions).
+    """
+    distances = []
+    positions = []
+    directions = []
+    evaluate = _hermite_segment_numpy if _numpy() is not None else _hermite_segment_python
+    steps = max(1, int(steps))
+
+    for i in range(len(point_data) - 1):
+        a, b = point_data[i], point_data[i + 1]
+        d0 = float(a["Distance Along Spline"])
+        d1 = float(b["Distance Along Spline"])
+        chord, seg_pos, seg_dir = evaluate(tuple(a["World Location"]), tuple(b["World Location"]),
+                                           tuple(a["Tangent"]), tuple(b["Tangent"]), steps)
+
+        # Arc-length normalization: stretch chord lengths onto UE's segment length
+        scale = (d1 - d0) / chord[-1] if chord[-1] > 1e-9 else 0.0
+        start = 0 if i == 0 else 1  # Segment start duplicates the previous segment's end
+        for k in range(start, len(chord)):
+            distances.append(d0 + chord[k] * scale)
+            positions.append(seg_pos[k])
+            directions.append(seg_dir[k])
+
+    return distances, positions, directions
+
+def adaptive_arrays(point_data: list, max_angle: float = ADAPTIVE_MAX_ANGLE,
+                    max_depth: int = ADAPTIVE_MAX_DEPTH) -> tuple:
+    """
+    Picks curvature-adaptive samples from the Hermite curve of captured points.
+
+    The curve is evaluated once at 2 ** max_depth steps per segment (see
+    hermite_arrays()); each segment is then bisected over those samples
+    until the direction changes by less than max_angle across every
+    sub-interval. Straight segments keep just their end points and tight
+    curves keep up to 2 ** max_depth samples, all without engine calls.
+
+    Args:
+        point_data (list[dict]): "Point Data" entries with "World Location",
+            "Tangent" and "Distance Along Spline".
+        max_angle (float): Allowed direction change between kept samples, in degrees.
+        max_depth (int): Maximum bisection depth per segment.
+
+    Returns:
+        tuple: (distances, positions, directions), ascending and including both ends.
+    """
+    steps = 2 ** max(0, int(max_depth))
+    distances, positions, directions = hermite_arrays(point_data, steps)
+    if not distances:
+        return [], [], []
+
+    keep = [0]
+
+    def refine(lo, hi):
+        mid = (lo + hi) // 2
+        bend = angle_between(directions[lo], directions[mid]) + angle_between(directions[mid], directions[hi])
+        if hi - lo <= 1 or bend <= max_angle:
+            if hi - lo > 1 and bend > max_angle * 0.5:
+                keep.append(mid)
+            keep.append(hi)
+            return
+        refine(lo, mid)
+        refine(mid, hi)
+
+    for i in range(len(point_data) - 1):
+        refine(i * steps, (i + 1) * steps)
+
+    return ([distances[k] for k in keep], [positions[k] for k in keep], [directions[k] for k in keep])
+
+# ============================
+# Spline Data Helpers
+# ============================
+def spline_arrays(spline_path: dict) -> tuple:
+    """
+    Unpacks the serialized spline dictionary built by GetSplinePath().
+
+    Prefers the curvature-adaptive samples ("Sampled Distances" /
+    "Sampled Locations" / "Sampled Directions", see adaptive_arrays()) so
+    placements follow the curve. Without them the curve is rebuilt from the
+    captured tangents (see hermite_arrays()); spline data without tangents
+    falls back to the control points.
+
+    Args:
+        spline_path (dict): Serialized spline data ("Point Data", "Total Spline Length", ...).
+
+    Returns:
+        tuple: (distances, positions, directions, total_length). The lists
+        are empty when the spline has no point data.
+    """
+    if not spline_path:
+        return [], [], [], 0.0
+
+    sampled = spline_path.get("Sampled Distances")
+    if sampled and len(sampled) > 1 and len(sampled) == len(spline_path.get("Sampled Locations", ())) == len(spline_path.get("Sampled Directions", ())):
+        distances = [float(d) for d in sampled]
+        positions = [tuple(p) for p in spline_path["Sampled Locations"]]
+        directions = [tuple(d) for d in spline_path["Sampled Directions"]]
+        total_length = float(spline_path.get("Total Spline Length", distances[-1]))
+        return distances, positions, directions, total_length
+
+    point_data = spline_path.get("Point Data", [])
+    if len(point_data) > 1 and all("Tangent" in p for p in point_data):
+        distances, positions, directions = hermite_arrays(point_data)
+        total_length = float(spline_path.get("Total Spline Length", distances[-1]))
+        return distances, positions, directions, total_length
+
+    distances = [float(p["Distance Along Spline"]) for p in point_data]
+    positions = [tuple(p["World Location"]) for p in point_data]
+    directions = [tuple(p["Direction"]) for p in point_data]
+    total_length = float(spline_path.get("Total Spline Length", distances[-1] if distances else 0.0))
+    return distances, positions, directions, total_length
+
+# ============================
+# Content-Addressed Spline Store
+# ============================
+def spline_key(spline_path: dict) -> str:
+    """
+    Returns a content hash identifying a spline's point data.
+
+    Two extractions of the same unchanged spline produce the same key.
+
+    Args:
+        spline_path (dict): Serialized spline data from GetSplinePath().
+
+    Returns:
+        str: Hex digest of the spline's points and length.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr(spline_path.get("Point Data", [])).encode("utf-8"))
+    digest.update(repr(spline_path.get("Total Spline Length")).encode("utf-8"))
+    return digest.hexdigest()
+
+class SplineStore:
+    """
+    Shared, reference-counted storage for spline data used by generations.
+
+    Generations hold a key instead of their own deep copy, so memory grows
+    with the number of unique splines rather than the number of
+    generations. Stored spline dicts are treated as immutable: callers
+    build a new dict (as GetSplinePath() does) rather than editing one.
+    """
+
+    def __init__(self):
+        self._splines = {}   # { key: spline_path }
+        self._refs = {}      # { key: number of generations referencing it }
+
+    def __len__(self) -> int:
+        return len(self._splines)
+
+    def intern(self, spline_path: dict) -> str:
+        """
+        Stores a spline (once per unique content) and adds a reference to it.
+
+        Args:
+            spline_path (dict): Serialized spline data.
+
+        Returns:
+            str: The spline's key.
+        """
+        key = spline_key(spline_path)
+        if key not in self._splines:
+            self._splines[key] = spline_path
+        self._refs[key] = self._refs.get(key, 0) + 1
+        return key
+
+    def get(self, key: str) -> dict:
+        """Returns the spline stored under key, or None."""
+        return self._splines.get(key)
+
+    def release(self, key: str):
+        """Drops one reference to key, forgetting the spline when none remain."""
+        if key not in self._refs:
+            return
+        self._refs[key] -= 1
+        if self._refs[key] <= 0:
+            del self._refs[key]
+            self._splines.pop(key, None)
+
+# ============================
+# Seeded Random Streams
+# ============================
+RNG_STREAMS = ("quantity", "order", "spacing", "scale", "rotation", "scatter")
+
+class GenerationRandom:
+    """
+    One seed per generation, split into an independent random.Random per kind.
+
+    Keeping a stream per parameter kind means, for example, enabling a scale
+    range does not shift the scatter draws of every later placement, so a
+    generation can be reproduced exactly from its seed.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else random.randrange(1, 2 ** 31)
+        self.streams = {kind: random.Random(f"{self.seed}:{kind}") for kind in RNG_STREAMS}
+
+    def __getitem__(self, kind: str) -> random.Random:
+        return self.streams[kind]
+
+    def draw_samples(self) -> dict:
+        """
+        Draws the unit samples ([0, 1) values) for one placement.
+
+        Returns:
+            dict: {"spacing": u, "scale": [u, u, u], "rotation": [u, u, u], "scatter": u}.
+        """
+        return {
+            "spacing": self.streams["spacing"].random(),
+            "scale": [self.streams["scale"].random() for _ in range(3)],
+            "rotation": [self.streams["rotation"].random() for _ in range(3)],
+            "scatter": self.streams["scatter"].random(),
+        }
+
+def placement_random(seed, label: str) -> GenerationRandom:
+    """
+    Returns the deterministic streams used to fill in samples for one placement.
+
+    Apply uses these for placements recorded without samples.
+
+    Args:
+        seed (int): The generation's seed.
+        label (str): The placement's actor label.
+
+    Returns:
+        GenerationRandom: Streams seeded from the generation seed and label.
+    """
+    return GenerationRandom(f"{seed}:{label}")
+
+# ============================
+# Parameter Sampling
+# ============================
+# Samples are unit values in [0, 1) drawn once per placement and stored with
+# the generation; the functions below map them onto the current parameter
+# ranges, so unchanged parameters reproduce the same values on every Apply.
+def sample_quantity(params: dict, rng=random) -> int:
+    """
+    Resolves the number of placements for one asset, honouring its quantity range.
+
+    Args:
+        params (dict): The asset's parameter dictionary.
+        rng: Random source exposing randint().
+
+    Returns:
+        int: Quantity to place (0 or more).
+    """
+    qty = int(params.get("quantity", 0))
+    if params.get("quantity_range"):
+        qty_max = int(params.get("quantity_max", qty))
+        if qty_max > qty:
+            qty = rng.randint(qty, qty_max)
+    return qty
+
+def sample_spacing(params: dict, u: float) -> float:
+    """
+    Resolves the user spacing for one placement, honouring the spacing range.
+
+    Args:
+        params (dict): The asset's parameter dictionary.
+        u (float): Unit sample in [0, 1).
+
+    Returns:
+        float: Spacing in cm.
+    """
+    spacing = float(params.get("spacing", 0.0))
+    spacing_max = params.get("spacing_max")
+    if params.get("spacing_range") and spacing_max is not None and float(spacing_max) > spacing:
+        spacing = lerp(spacing, float(spacing_max), u)
+    return spacing
+
+def sample_vector_param(params: dict, key: str, default: tuple, u: tuple) -> tuple:
+    """
+    Resolves an XYZ parameter ("scale" or "rotation"), honouring its range.
+
+    Args:
+        params (dict): The asset's parameter dictionary.
+        key (str): Parameter name; "<key>_max" and "<key>_range" are read alongside it.
+        default (tuple): Value used when the parameter is missing.
+        u (tuple): Three unit samples in [0, 1).
+
+    Returns:
+        tuple: Sampled (x, y, z) values, or None when the parameter is explicitly None.
+    """
+    base = params.get(key, default)
+    if base is None:
+        return None
+    vmax = params.get(f"{key}_max")
+    if params.get(f"{key}_range") and vmax:
+        return tuple(lerp(float(base[i]), float(vmax[i]), u[i]) for i in range(3))
+    return (float(base[0]), float(base[1]), float(base[2]))
+
+def sample_scatter(params: dict, u: float) -> float:
+    """
+    Resolves the sideways scatter offset for one placement.
+
+    Args:
+        params (dict): The asset's parameter dictionary.
+        u (float): Unit sample in [0, 1).
+
+    Returns:
+        float: Offset in cm along the spline's right vector, within ±scatter.
+    """
+    scatter = float(params.get("scatter", 0.0))
+    return lerp(-scatter, scatter, u) if scatter != 0.0 else 0.0
+
+# ============================
+# Parameter Diffing
+# ============================
+PARAM_GROUPS = {
+    "spacing": ("spacing", "spacing_max", "spacing_range"),
+    "scale": ("scale", "scale_max", "scale_range"),
+    "rotation": ("rotation", "rotation_max", "rotation_range"),
+    "scatter": ("scatter",),
+}
+
+def _param_equal(a, b) -> bool:
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_param_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        return abs(float(a) - float(b)) <= 0.001
+    return a == b
+
+def diff_parameters(old_params: dict, new_params: dict) -> dict:
+    """
+    Compares two Asset_Parameters dictionaries per asset and per field group.
+
+    Quantity is ignored because Apply never changes how many assets exist.
+
+    Args:
+        old_params (dict): Parameters stored with the generation.
+        new_params (dict): Parameters about to be applied.
+
+    Returns:
+        dict: { asset_name: {"spacing", "scale", "rotation", "scatter"} subset } for
+        every asset with at least one changed group.
+    """
+    changes = {}
+    for asset_name, new_p in new_params.items():
+        old_p = old_params.get(asset_name, {})
+        changed = {group for group, keys in PARAM_GROUPS.items()
+                   if not all(_param_equal(old_p.get(k), new_p.get(k)) for k in keys)}
+        if changed:
+            changes[asset_name] = changed
+    return changes
+
+# ============================
+# Asset Ordering
+# ============================
+def build_asset_entries(asset_order: list, asset_parameters: dict, rng=random) -> list:
+    """
+    Builds the working list of assets that will be placed.
+
+    Args:
+        asset_order (list[str]): Asset names in Asset List order.
+        asset_parameters (dict): { asset_name: {param: value, ...} }.
+        rng: Random source used for quantity ranges.
+
+    Returns:
+        list[dict]: [{"name", "index", "qty", "params"}] for assets with qty > 0.
+    """
+    entries = []
+    for index, name in enumerate(asset_order):
+        params = asset_parameters.get(name)
+        if not params:
+            continue
+        qty = sample_quantity(params, rng)
+        if qty <= 0:
+            continue
+        entries.append({"name": name, "index": index, "qty": qty, "params": params})
+    return entries
+
+def asset_sequence(entries: list, random_mode: bool = False, in_sequence: bool = False, rng=random):
+    """
+    Yields asset entries in the order they should be placed.
+
+    - Sequence mode alternates assets in Asset List order.
+    - Random mode picks any asset that still has quantity left.
+    - Standard mode places one asset type at a time.
+
+    Args:
+        entries (list[dict]): Output of build_asset_entries().
+        random_mode (bool): Randomised order.
+        in_sequence (bool): Alternating order.
+        rng: Random source used for random mode.
+
+    Yields:
+        dict: The next asset entry.
+    """
+    remaining = {id(e): e["qty"] for e in entries}
+
+    if in_sequence:
+        max_quantity = max((e["qty"] for e in entries), default=0)
+        for i in range(max_quantity):
+            for e in entries:
+                if e["qty"] > i:
+                    yield e
+        return
+
+    while True:
+        if random_mode:
+            choices = [e for e in entries if remaining[id(e)] > 0]
+            if not choices:
+                return
+            chosen = rng.choice(choices)
+        else:
+            chosen = next((e for e in entries if remaining[id(e)] > 0), None)
+            if not chosen:
+                return
+        remaining[id(chosen)] -= 1
+        yield chosen
+
+# ============================
+# Headless Placement Planner
+# ============================
+def plan_placements(spline_path: dict, asset_parameters: dict, asset_file_paths: dict,
+                    asset_order: list = None, asset_extents: dict = None, asset_origins: dict = None,
+                    random_mode: bool = False, in_sequence: bool = False,
+                    avoid_overlap: bool = True, seed: int = None, logger: PlacerLogger = None) -> list:
+    """
+    Computes every placement of a generation without touching the engine.
+
+    Reproduces the placement rules of AssetPlacerToolWindow.Generate():
+    edge-to-edge advance from bounding extents plus spacing, scatter
+    perpendicular to the spline, scale/rotation ranges, and overlap
+    avoidance by stepping forward along the spline. Each candidate's bounds
+    are predicted from its asset's cached extent, sampled scale and
+    rotation (see predict_bounds()), so nothing is spawned until a free
+    spot has been found.
+
+    Args:
+        spline_path (dict): Serialized spline data from GetSplinePath().
+        asset_parameters (dict): { asset_name: {param: value, ...} }.
+        asset_file_paths (dict): { asset_name: asset_path }.
+        asset_order (list[str]): Asset names in placement order. Defaults to asset_parameters order.
+        asset_extents (dict): { asset_name: (x, y, z) } half extents of each asset's bounds.
+        asset_origins (dict): { asset_name: (x, y, z) } bounds origin relative to the asset pivot.
+        random_mode (bool): Randomised asset order.
+        in_sequence (bool): Alternating asset order.
+        avoid_overlap (bool): Step forward along the spline until the predicted bounds are free.
+        seed (int): Generation seed. A random seed is picked when None.
+        logger (PlacerLogger): Receives placement/rejection counters and, when verbose, a trace.
+
+    Returns:
+        list[dict]: One dict per placement with keys
+            "asset", "asset_index", "asset_path", "location", "rotation", "scale",
+            "distance", "center" and "radius" (predicted bounds sphere), and
+            "samples" (the unit draws behind spacing/scale/rotation/scatter).
+        "rotation" is (roll, pitch, yaw), matching unreal.Rotator's argument order.
+    """
+    distances, positions, directions, total_length = spline_arrays(spline_path)
+    if not distances:
+        return []
+
+    asset_extents = asset_extents or {}
+    asset_origins = asset_origins or {}
+    if asset_order is None:
+        asset_order = list(asset_parameters.keys())
+
+    rng = GenerationRandom(seed)
+
+    entries = build_asset_entries(asset_order, asset_parameters, rng["quantity"])
+    total_remaining = sum(e["qty"] for e in entries)
+    if total_remaining <= 0:
+        return []
+
+    cursor = SplineCursor(distances, positions, directions)
+    placements = []
+    current_distance = 0.0
+    previous_half = 0.0
+
+    # Cells start roughly one unscaled asset across and grow with the
+    # largest predicted (scaled) radius the grid has stored
+    largest_half = max((max(e) for e in asset_extents.values() if e), default=FALLBACK_RADIUS)
+    grid = SpatialHash(2.0 * (max(largest_half, 1.0) + OVERLAP_PADDING), OVERLAP_PADDING, planar=True)
+
+    timed = logger.timed if logger else (lambda key: _NULL_TIMER)
+
+    for chosen in asset_sequence(entries, random_mode, in_sequence, rng["order"]):
+        name = chosen["name"]
+        params = chosen["params"]
+        asset_path = asset_file_paths.get(name)
+        if not asset_path:
+            if logger:
+                logger.warning(f"Missing path for asset '{name}'.", batch=True)
+            continue
+
+        # --- Parameter sampling ---
+        with timed("draw_samples"):
+            samples = rng.draw_samples()
+            spacing = sample_spacing(params, samples["spacing"])
+            scale = sample_vector_param(params, "scale", (1.0, 1.0, 1.0), samples["scale"])
+            user_rotation = sample_vector_param(params, "rotation", None, samples["rotation"])
+        scatter = float(params.get("scatter", 0.0))
+
+        extent = asset_extents.get(name)
+        origin = asset_origins.get(name)
+        curr_half = max(extent) if extent else 0.0
+
+        # --- Unified advance (edge-to-edge when spacing==0) ---
+        advance = previous_half + curr_half + spacing + EPS
+        current_distance += advance
+        if logger and logger.verbose:
+            logger.trace(f"[Advance] {name} +{advance:.1f} (prev_half={previous_half:.1f}, curr_half≈{curr_half:.1f}, spacing={spacing:.1f})")
+
+        # --- Overlap avoidance on predicted bounds ---
+        placed = None
+        for _ in range(MAX_TRIALS):
+            with timed("sample_at_distance"):
+                pos, dir_vec = cursor.sample(current_distance)
+            location = pos
+            if scatter != 0.0:
+                right = right_vector(dir_vec)
+                samples["scatter"] = rng["scatter"].random()
+                off_r = sample_scatter(params, samples["scatter"])
+                location = (pos[0] + right[0] * off_r, pos[1] + right[1] * off_r, pos[2])
+
+            if user_rotation is not None:
+                rotation = user_rotation
+            else:
+                pitch, yaw = pitch_yaw_from_direction(dir_vec)
+                rotation = (0.0, pitch, yaw)
+
+            with timed("overlap_check"):
+                if extent:
+                    center, world_extent = predict_bounds(location, rotation, scale, extent, origin)
+                    radius = max(world_extent)
+                else:
+                    center, radius = location, FALLBACK_RADIUS
+                blocked = avoid_overlap and grid.overlaps(center, radius, OVERLAP_PADDING)
+
+            if not blocked:
+                placed = {
+                    "asset": name,
+                    "asset_index": chosen["index"],
+                    "asset_path": asset_path,
+                    "location": location,
+                    "rotation": rotation,
+                    "scale": scale,
+                    "distance": float(current_distance),
+                    "center": center,
+                    "radius": radius,
+                    "samples": samples,
+                }
+                break
+
+            if logger:
+                logger.count("rejections")
+            current_distance += max(spacing * 0.5, 10.0)
+            if current_distance > total_length:
+                break
+
+        if placed:
+            placements.append(placed)
+            grid.insert(placed["center"], placed["radius"])
+            previous_half = radius
+        elif logger:
+            logger.count("skipped")
+            if logger.verbose:
+                logger.trace(f"[Overlap] No free spot for {name} near {current_distance:.1f}")
+
+        if current_distance > total_length:
+            break
+
+    if logger:
+        logger.count("planned", len(placements))
+    return placements
@@ -3,26 +3,6 @@ import unreal
 menu_owner = "New Menu"
 tool_menus = unreal.ToolMenus.get()
 
-@unreal.uclass()
-class MyScriptObject(unreal.ToolMenuEntryScript):
-    @unreal.ufunction(override=True)
-    def execute(self, context):
-        print("SCRIPT EXECUTED")
-        menuList = set()
-        for i in range(1000):
-            obj = unreal.find_object(None, "/Engine/Transient.ToolMenus_0:RegisteredMenu_%s" % i)
-            if not obj:
-                obj = unreal.find_object(None, f"/Engine/Transient.ToolsMenus_0:ToolMenu_{i}") # for legacy support
-                if not obj:
-                    continue
-            menuName = str(obj.menu_name)
-            if menuName == "None":
-                continue
-
-            menuList.add(menuName)
-            print(menuName)
-
-
 def create_main_menu_section():
     # Get a reference to the main menu bar
     main_menu = tool_menus.extend_menu("LevelEditor.MainMenu")
@@ -50,6 +30,7 @@ def create_main_menu_section():
         tool_tip="Launch the Asset Placer Tool",
         command_type=unreal.ToolMenuStringCommandType.PYTHON,
         custom_command_type="",
+        # UE_PlacerTool (and PySide6 with it) is only imported when the entry is clicked
         command_string="from UE_PlacerTool import launchWindow; launchWindow()"  # command to run
     )
 
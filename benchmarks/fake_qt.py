@@ -0,0 +1,157 @@
+# ============================
+# Stand-in PySide6 Modules for Benchmarks
+# ============================
+# Lets UE_PlacerTool import without Qt. Widgets keep the little state the
+# tool's operations read back (values, check states, list items) and accept
+# any other call as a no-op. QTimer.singleShot() queues its callback in
+# PENDING; drain() runs them the way the Qt event loop would.
+import sys
+import types
+
+PENDING = []   # Callbacks queued by QTimer.singleShot()
+
+def drain():
+    """Runs queued timer callbacks until none are left."""
+    while PENDING:
+        PENDING.pop(0)()
+
+def install():
+    """Registers PySide6, PySide6.QtCore/QtGui/QtWidgets in sys.modules."""
+    package = types.ModuleType("PySide6")
+    core = types.ModuleType("PySide6.QtCore")
+    gui = types.ModuleType("PySide6.QtGui")
+    widgets = types.ModuleType("PySide6.QtWidgets")
+
+    core.Qt = _Anything()
+    core.QTimer = QTimer
+    gui.QPalette = _Widget
+    gui.QColor = _Widget
+    widgets.QWidget = QWidget
+    for name in ("QApplication", "QDockWidget", "QMainWindow", "QPushButton",
+                 "QVBoxLayout", "QLabel", "QFormLayout", "QHBoxLayout", "QProgressBar"):
+        setattr(widgets, name, _Widget)
+    widgets.QListWidget = QListWidget
+    widgets.QSpinBox = QSpinBox
+    widgets.QDoubleSpinBox = QSpinBox
+    widgets.QCheckBox = QCheckBox
+    widgets.QComboBox = QComboBox
+
+    package.QtCore, package.QtGui, package.QtWidgets = core, gui, widgets
+    sys.modules.update({
+        "PySide6": package,
+        "PySide6.QtCore": core,
+        "PySide6.QtGui": gui,
+        "PySide6.QtWidgets": widgets,
+    })
+
+class _Anything:
+    """Any attribute access or call returns another _Anything."""
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+class _Widget:
+    def __init__(self, *args, **kwargs):
+        self._visible = True
+        self._enabled = True
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def setVisible(self, visible):
+        self._visible = visible
+
+    def isVisible(self):
+        return self._visible
+
+    def setEnabled(self, enabled):
+        self._enabled = enabled
+
+    def isEnabled(self):
+        return self._enabled
+
+class QWidget:
+    """Base class of the tool window; unlike _Widget it has no catch-all attributes."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+class QTimer:
+    @staticmethod
+    def singleShot(msec, callback):
+        PENDING.append(callback)
+
+class QCheckBox(_Widget):
+    def __init__(self, text="", checked=False):
+        super().__init__()
+        self._checked = checked
+
+    def isChecked(self):
+        return self._checked
+
+    def setChecked(self, checked):
+        self._checked = checked
+
+class QSpinBox(_Widget):
+    def __init__(self, value=0):
+        super().__init__()
+        self._value = value
+
+    def value(self):
+        return self._value
+
+    def setValue(self, value):
+        self._value = value
+
+class QComboBox(_Widget):
+    def __init__(self, items=(), current=0):
+        super().__init__()
+        self._items = list(items)
+        self._current = current
+
+    def addItems(self, items):
+        self._items.extend(items)
+
+    def currentText(self):
+        return self._items[self._current] if self._items else ""
+
+    def setCurrentText(self, text):
+        self._current = self._items.index(text)
+
+class _ListItem:
+    def __init__(self, text):
+        self._text = text
+
+    def text(self):
+        return self._text
+
+class QListWidget(_Widget):
+    def __init__(self, *args):
+        super().__init__()
+        self._items = []
+        self._selected = None
+
+    def addItem(self, text):
+        self._items.append(_ListItem(text))
+
+    def clear(self):
+        self._items = []
+        self._selected = None
+
+    def count(self):
+        return len(self._items)
+
+    def item(self, i):
+        return self._items[i]
+
+    def setCurrentRow(self, i):
+        self._selected = i
+
+    def currentItem(self):
+        return self._items[self._selected] if self._selected is not None else None
+
+    def selectedItems(self):
+        return [self._items[self._selected]] if self._selected is not None and self._selected < len(self._items) else []
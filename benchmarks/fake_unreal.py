@@ -0,0 +1,489 @@
+# ============================
+# Stand-in `unreal` Module for Benchmarks
+# ============================
+# Implements just enough of the Unreal Python API for the Asset Placer
+# modules to run outside the editor. Every engine entry point records a
+# call in CALLS so benchmarks can report engine-call counts next to wall
+# time. Install with install() before importing the tool modules.
+import math
+import sys
+from collections import Counter
+
+CALLS = Counter()   # { "Class.method": calls }
+
+def _count(name: str):
+    CALLS[name] += 1
+
+def reset_calls():
+    """Clears the call counters and the level."""
+    CALLS.clear()
+    _WORLD.actors.clear()
+    _WORLD.foliage.clear()
+
+def install():
+    """Registers this module as `unreal` in sys.modules."""
+    sys.modules["unreal"] = sys.modules[__name__]
+
+# ============================
+# Logging
+# ============================
+def log(message):
+    _count("log")
+
+def log_warning(message):
+    _count("log_warning")
+
+def log_error(message):
+    _count("log_error")
+
+# ============================
+# Math Types
+# ============================
+class Vector:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = float(x), float(y), float(z)
+
+class Rotator:
+    def __init__(self, roll=0.0, pitch=0.0, yaw=0.0):
+        self.roll, self.pitch, self.yaw = float(roll), float(pitch), float(yaw)
+
+    def quaternion(self):
+        return Quat(self)
+
+class Quat:
+    """Keeps the source rotator; only rotator() round-trips are needed."""
+
+    def __init__(self, rotator=None):
+        self._rotator = rotator or Rotator()
+        self.x = self.y = self.z = 0.0
+        self.w = 1.0
+
+    def rotator(self):
+        return Rotator(self._rotator.roll, self._rotator.pitch, self._rotator.yaw)
+
+class Transform:
+    def __init__(self, location=None, rotation=None, scale=None):
+        self.translation = location or Vector()
+        self.rotation = rotation.quaternion() if isinstance(rotation, Rotator) else (rotation or Quat())
+        self.scale3d = scale or Vector(1.0, 1.0, 1.0)
+
+class Text(str):
+    def is_empty(self):
+        return not self
+
+class _Bounds:
+    def __init__(self, origin, extent):
+        self.origin = origin
+        self.box_extent = extent
+
+class SplineCoordinateSpace:
+    LOCAL = 0
+    WORLD = 1
+
+# ============================
+# Objects / Assets
+# ============================
+class Object:
+    def __init__(self, path=""):
+        self._path = path
+        self._valid = True
+
+    def get_path_name(self):
+        _count(f"{type(self).__name__}.get_path_name")
+        return self._path
+
+    def get_name(self):
+        return self._path.rsplit(".", 1)[-1]
+
+    def set_editor_property(self, name, value):
+        _count(f"{type(self).__name__}.set_editor_property")
+        setattr(self, name, value)
+
+    @staticmethod
+    def is_valid(obj):
+        return obj is not None and getattr(obj, "_valid", False)
+
+class StaticMesh(Object):
+    def __init__(self, path, extent=(50.0, 50.0, 50.0)):
+        super().__init__(path)
+        self._bounds = _Bounds(Vector(0.0, 0.0, extent[2]), Vector(*extent))
+
+    def get_bounds(self):
+        _count("StaticMesh.get_bounds")
+        return self._bounds
+
+class FoliageType_InstancedStaticMesh(Object):
+    pass
+
+_ASSETS = {}   # { asset path: Object }
+
+def register_asset(path: str, extent=(50.0, 50.0, 50.0)) -> StaticMesh:
+    """Creates a loadable StaticMesh at `path`."""
+    _ASSETS[path] = StaticMesh(path, extent)
+    return _ASSETS[path]
+
+def load_asset(path):
+    _count("load_asset")
+    return _ASSETS.get(path)
+
+def find_object(outer, path):
+    _count("find_object")
+    return None
+
+# ============================
+# Components
+# ============================
+class ActorComponent(Object):
+    def __init__(self, name="Component", owner=None):
+        super().__init__(name)
+        self.owner = owner
+
+    def get_name(self):
+        return self._path
+
+class SplineComponent(ActorComponent):
+    """
+    A polyline spline: a gentle sine wave through `num_points` points,
+    `spacing` units apart, so direction queries see real curvature.
+    """
+
+    def __init__(self, num_points=16, spacing=1000.0, amplitude=400.0, owner=None):
+        super().__init__("SplineComponent0", owner)
+        self.points = [(i * spacing, math.sin(i * 0.7) * amplitude, 0.0) for i in range(num_points)]
+        self.distances = [0.0]
+        for a, b in zip(self.points, self.points[1:]):
+            self.distances.append(self.distances[-1] + math.dist(a, b))
+
+    def _segment(self, d):
+        d = max(0.0, min(self.distances[-1], d))
+        i = 0
+        lo, hi = 0, len(self.distances) - 2
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if self.distances[mid] <= d:
+                i = mid
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        seg = self.distances[i + 1] - self.distances[i]
+        t = (d - self.distances[i]) / seg if seg > 0 else 0.0
+        return i, t
+
+    def _direction(self, i):
+        a, b = self.points[i], self.points[min(i + 1, len(self.points) - 1)]
+        if a == b:
+            a, b = self.points[i - 1], self.points[i]
+        length = math.dist(a, b) or 1.0
+        return Vector((b[0] - a[0]) / length, (b[1] - a[1]) / length, (b[2] - a[2]) / length)
+
+    def get_number_of_spline_points(self):
+        _count("SplineComponent.get_number_of_spline_points")
+        return len(self.points)
+
+    def get_spline_length(self):
+        _count("SplineComponent.get_spline_length")
+        return self.distances[-1]
+
+    def get_location_at_spline_point(self, i, space):
+        _count("SplineComponent.get_location_at_spline_point")
+        return Vector(*self.points[i])
+
+    def get_rotation_at_spline_point(self, i, space):
+        _count("SplineComponent.get_rotation_at_spline_point")
+        d = self._direction(i)
+        return Rotator(0.0, 0.0, math.degrees(math.atan2(d.y, d.x)))
+
+    def get_tangent_at_spline_point(self, i, space):
+        _count("SplineComponent.get_tangent_at_spline_point")
+        d = self._direction(i)
+        return Vector(d.x * 1000.0, d.y * 1000.0, d.z * 1000.0)
+
+    def get_direction_at_spline_point(self, i, space):
+        _count("SplineComponent.get_direction_at_spline_point")
+        return self._direction(i)
+
+    def get_distance_along_spline_at_spline_point(self, i):
+        _count("SplineComponent.get_distance_along_spline_at_spline_point")
+        return self.distances[i]
+
+    def get_location_at_distance_along_spline(self, d, space):
+        _count("SplineComponent.get_location_at_distance_along_spline")
+        i, t = self._segment(d)
+        a, b = self.points[i], self.points[i + 1]
+        return Vector(*(a[k] + (b[k] - a[k]) * t for k in range(3)))
+
+    def get_direction_at_distance_along_spline(self, d, space):
+        _count("SplineComponent.get_direction_at_distance_along_spline")
+        return self._direction(self._segment(d)[0])
+
+    def get_rotation_at_distance_along_spline(self, d, space):
+        _count("SplineComponent.get_rotation_at_distance_along_spline")
+        dv = self._direction(self._segment(d)[0])
+        return Rotator(0.0, 0.0, math.degrees(math.atan2(dv.y, dv.x)))
+
+    def get_world_transform(self):
+        _count("SplineComponent.get_world_transform")
+        return Transform()
+
+class InstancedStaticMeshComponent(ActorComponent):
+    def __init__(self, name="InstancedStaticMeshComponent0", owner=None):
+        super().__init__(name, owner)
+        self.static_mesh = None
+        self.instances = []
+
+    def set_static_mesh(self, mesh):
+        _count("InstancedStaticMeshComponent.set_static_mesh")
+        self.static_mesh = mesh
+
+    def add_instances(self, transforms, should_return_indices, world_space=False):
+        _count("InstancedStaticMeshComponent.add_instances")
+        start = len(self.instances)
+        self.instances.extend(transforms)
+        return list(range(start, len(self.instances))) if should_return_indices else []
+
+    def get_instance_count(self):
+        _count("InstancedStaticMeshComponent.get_instance_count")
+        return len(self.instances)
+
+    def get_instance_transform(self, index, world_space):
+        _count("InstancedStaticMeshComponent.get_instance_transform")
+        return self.instances[index]
+
+    def batch_update_instances_transforms(self, start, transforms, world_space, mark_dirty, teleport):
+        _count("InstancedStaticMeshComponent.batch_update_instances_transforms")
+        self.instances[start:start + len(transforms)] = transforms
+        return True
+
+class HierarchicalInstancedStaticMeshComponent(InstancedStaticMeshComponent):
+    pass
+
+# ============================
+# Actors / Level
+# ============================
+class Actor(Object):
+    _next_id = 0
+
+    def __init__(self, label="Actor", location=None, rotation=None, mesh=None):
+        Actor._next_id += 1
+        super().__init__(f"/Game/Bench.Bench:PersistentLevel.{label}_{Actor._next_id}")
+        self.label = f"{label}_{Actor._next_id}"
+        self.location = location or Vector()
+        self.rotation = rotation or Rotator()
+        self.scale = Vector(1.0, 1.0, 1.0)
+        self.folder = ""
+        self.mesh = mesh
+        self.components = []
+
+    def get_actor_label(self):
+        _count("Actor.get_actor_label")
+        return self.label
+
+    def set_actor_label(self, label):
+        _count("Actor.set_actor_label")
+        self.label = label
+
+    def get_name(self):
+        return self.label
+
+    def get_actor_location(self):
+        _count("Actor.get_actor_location")
+        return self.location
+
+    def set_actor_location(self, location, sweep=False, teleport=False):
+        _count("Actor.set_actor_location")
+        self.location = location
+
+    def set_actor_rotation(self, rotation, teleport=False):
+        _count("Actor.set_actor_rotation")
+        self.rotation = rotation
+
+    def set_actor_scale3d(self, scale):
+        _count("Actor.set_actor_scale3d")
+        self.scale = scale
+
+    def get_actor_bounds(self, only_colliding):
+        _count("Actor.get_actor_bounds")
+        extent = self.mesh._bounds.box_extent if self.mesh else Vector()
+        return self.location, Vector(extent.x * self.scale.x, extent.y * self.scale.y, extent.z * self.scale.z)
+
+    def set_folder_path(self, folder):
+        _count("Actor.set_folder_path")
+        self.folder = folder
+
+    def get_folder_path(self):
+        _count("Actor.get_folder_path")
+        return self.folder
+
+    def get_components_by_class(self, cls):
+        _count("Actor.get_components_by_class")
+        return [c for c in self.components if isinstance(c, cls)]
+
+class _World:
+    def __init__(self):
+        self.actors = []
+        self.foliage = {}   # { foliage type: [Transform] }
+
+_WORLD = _World()
+
+def spawn_spline_actor(num_points: int, spacing: float = 1000.0) -> Actor:
+    """Adds an actor with a SplineComponent of `num_points` points to the level."""
+    actor = Actor("Spline")
+    actor.components.append(SplineComponent(num_points, spacing, owner=actor))
+    _WORLD.actors.append(actor)
+    return actor
+
+# ============================
+# Subsystems
+# ============================
+class EditorActorSubsystem:
+    def spawn_actor_from_object(self, obj, location, rotation=None):
+        _count("EditorActorSubsystem.spawn_actor_from_object")
+        actor = Actor(obj.get_name() if obj else "Actor", location, rotation, mesh=obj)
+        _WORLD.actors.append(actor)
+        return actor
+
+    def spawn_actor_from_class(self, cls, location, rotation=None):
+        _count("EditorActorSubsystem.spawn_actor_from_class")
+        actor = Actor(cls.__name__, location, rotation)
+        _WORLD.actors.append(actor)
+        return actor
+
+    def destroy_actors(self, actors):
+        _count("EditorActorSubsystem.destroy_actors")
+        doomed = {id(a) for a in actors}
+        for a in actors:
+            a._valid = False
+        _WORLD.actors = [a for a in _WORLD.actors if id(a) not in doomed]
+        return True
+
+    def destroy_actor(self, actor):
+        _count("EditorActorSubsystem.destroy_actor")
+        return self.destroy_actors([actor])
+
+    def get_all_level_actors(self):
+        _count("EditorActorSubsystem.get_all_level_actors")
+        return list(_WORLD.actors)
+
+    def get_selected_level_actors(self):
+        _count("EditorActorSubsystem.get_selected_level_actors")
+        return [a for a in _WORLD.actors if a.get_components_by_class(SplineComponent)]
+
+class _Delegate:
+    def add_callable(self, fn):
+        pass
+
+class ImportSubsystem:
+    def __init__(self):
+        self.on_asset_reimport = _Delegate()
+        self.on_asset_post_import = _Delegate()
+
+class UnrealEditorSubsystem:
+    def get_editor_world(self):
+        return _WORLD
+
+class LevelEditorSubsystem:
+    def save_current_level(self):
+        _count("LevelEditorSubsystem.save_current_level")
+        return True
+
+class AddNewSubobjectParams:
+    def __init__(self, parent_handle=None, new_class=None, blueprint_context=None):
+        self.parent_handle = parent_handle
+        self.new_class = new_class
+
+class SubobjectDataSubsystem:
+    def k2_gather_subobject_data_for_instance(self, actor):
+        _count("SubobjectDataSubsystem.k2_gather_subobject_data_for_instance")
+        return [actor]
+
+    def add_new_subobject(self, params):
+        _count("SubobjectDataSubsystem.add_new_subobject")
+        actor = params.parent_handle
+        component = params.new_class(f"{params.new_class.__name__}{len(actor.components)}", actor)
+        actor.components.append(component)
+        return component, Text("")
+
+    def rename_subobject(self, handle, name):
+        _count("SubobjectDataSubsystem.rename_subobject")
+        handle._path = str(name)
+        return True
+
+class SubobjectDataBlueprintFunctionLibrary:
+    @staticmethod
+    def get_data(handle):
+        return handle
+
+    @staticmethod
+    def get_object(data):
+        return data
+
+_SUBSYSTEMS = {}
+
+def get_editor_subsystem(cls):
+    _count("get_editor_subsystem")
+    if cls not in _SUBSYSTEMS:
+        _SUBSYSTEMS[cls] = cls()
+    return _SUBSYSTEMS[cls]
+
+get_engine_subsystem = get_editor_subsystem
+
+class ScopedEditorTransaction:
+    def __init__(self, description=""):
+        _count("ScopedEditorTransaction")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+# ============================
+# Foliage / Asset Tools
+# ============================
+class InstancedFoliageActor:
+    @staticmethod
+    def add_instances(world, foliage_type, transforms):
+        _count("InstancedFoliageActor.add_instances")
+        world.foliage.setdefault(foliage_type, []).extend(transforms)
+
+    @staticmethod
+    def remove_all_instances(world, foliage_type):
+        _count("InstancedFoliageActor.remove_all_instances")
+        world.foliage.pop(foliage_type, None)
+
+class _AssetTools:
+    def create_asset(self, name, package_path, cls, factory):
+        _count("AssetTools.create_asset")
+        path = f"{package_path}/{name}.{name}"
+        if path in _ASSETS:   # UE refuses to overwrite an existing asset
+            return None
+        _ASSETS[path] = cls(path)
+        return _ASSETS[path]
+
+    def create_unique_asset_name(self, base_package_name, suffix):
+        _count("AssetTools.create_unique_asset_name")
+        folder, base = base_package_name.rsplit("/", 1)
+        name, n = base + suffix, 0
+        while f"{folder}/{name}.{name}" in _ASSETS:
+            n += 1
+            name = f"{base}{suffix}_{n}"
+        return f"{folder}/{name}", name
+
+class AssetToolsHelpers:
+    @staticmethod
+    def get_asset_tools():
+        return _AssetTools()
+
+class EditorAssetLibrary:
+    @staticmethod
+    def delete_asset(path):
+        _count("EditorAssetLibrary.delete_asset")
+        return _ASSETS.pop(path, None) is not None
+
+class EditorUtilityLibrary:
+    @staticmethod
+    def get_selected_assets():
+        return []
+
+def parent_external_window_to_slate(window_id):
+    pass
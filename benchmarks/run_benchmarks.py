@@ -0,0 +1,190 @@
+# ============================
+# Asset Placer Benchmarks
+# ============================
+# Times the tool's operations against stand-in `unreal` and PySide6 modules
+# and reports wall time plus engine-call counts per placement count:
+#
+#     python benchmarks/run_benchmarks.py
+#     python benchmarks/run_benchmarks.py --sizes 100 1000 --modes Actors Instances
+#     python benchmarks/run_benchmarks.py --json results.json
+#
+# Engine calls are whatever the fake `unreal` module counted, so a jump in
+# calls per placement between sizes points at an O(n^2) regression even
+# when wall time is noisy.
+
+# ============================
+# Standard Library Imports
+# ============================
+import argparse
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import fake_qt
+import fake_unreal
+
+fake_unreal.install()
+fake_qt.install()
+
+import UE_PlacerTool as tool
+import UE_PlacerTool_Planner as planner
+
+# ============================
+# Benchmark Constants
+# ============================
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+DEFAULT_MODES = ("Actors", "Instances", "Foliage")
+ASSET_PATH = "/Game/Bench/SM_Bench.SM_Bench"
+ASSET_EXTENT = (20.0, 20.0, 20.0)
+SPACING = 10.0
+SPLINE_POINT_SPACING = 1000.0
+
+# ============================
+# Harness
+# ============================
+def measure(results: list, size: int, mode: str, scenario: str, fn):
+    """Runs fn once and records its wall time and the engine calls it made."""
+    before = sum(n for name, n in fake_unreal.CALLS.items() if not name.startswith("log"))
+    start = time.perf_counter()
+    fn()
+    fake_qt.drain()
+    elapsed = time.perf_counter() - start
+    calls = sum(n for name, n in fake_unreal.CALLS.items() if not name.startswith("log")) - before
+    results.append({"Size": size, "Mode": mode, "Scenario": scenario, "Seconds": elapsed, "Engine Calls": calls})
+    print(f"{size:>8} {mode:<10} {scenario:<16} {elapsed * 1000:>10.1f} ms {calls:>10} calls ({calls / max(size, 1):.2f}/placement)")
+
+def spline_points_for(size: int) -> int:
+    """Spline points needed to fit `size` placements of the bench asset end to end."""
+    length = size * (2 * max(ASSET_EXTENT) + SPACING + planner.EPS) * 1.05
+    return int(length / SPLINE_POINT_SPACING) + 2
+
+def make_window(mode: str, profile: bool = False):
+    """Builds an AssetPlacerToolWindow with fake widgets, skipping the Qt layout code."""
+    win = object.__new__(tool.AssetPlacerToolWindow)
+    win._init_session(tool.engine.PlacerSession())
+    win._init_generation_data()
+    win.Logger.level = planner.LOG_WARNING
+    win.Logger.profile = profile
+
+    win.AssetList_Widget = fake_qt.QListWidget()
+    win.GenerationLogList = fake_qt.QListWidget()
+    win.Random_Checkbox = fake_qt.QCheckBox()
+    win.InSequence_Checkbox = fake_qt.QCheckBox()
+    win.AvoidOverlap_Checkbox = fake_qt.QCheckBox(checked=True)
+    win.VerboseLog_Checkbox = fake_qt.QCheckBox()
+    win.Seed_spin = fake_qt.QSpinBox(1234)
+    win.Output_Combo = fake_qt.QComboBox(DEFAULT_MODES, DEFAULT_MODES.index(mode))
+    for name in ("GenerationLogHeader", "DeleteGeneration", "ApplyButton", "GenerateButton",
+                 "CancelButton", "Generate_Progress", "SplineButton", "Profile_Label",
+                 "AddFileButton", "RemoveFileButton"):
+        setattr(win, name, fake_qt._Widget())
+    return win
+
+def set_quantity(win, size: int):
+    win.Asset_File_Paths = {"SM_Bench": ASSET_PATH}
+    win.Asset_Parameters = {"SM_Bench": {
+        "quantity": size, "quantity_max": size, "quantity_range": False,
+        "spacing": SPACING, "spacing_max": SPACING, "spacing_range": False,
+        "scale": [1.0, 1.0, 1.0], "scale_max": [1.0, 1.0, 1.0], "scale_range": False,
+        "rotation": [0.0, 0.0, 0.0], "rotation_max": [0.0, 0.0, 0.0], "rotation_range": False,
+        "scatter": 0.0,
+    }}
+    win.AssetList_Widget.clear()
+    win.AssetList_Widget.addItem("SM_Bench")
+
+# ============================
+# Scenarios
+# ============================
+def bench_sampling(results: list, size: int):
+    """sample_at_distance() against the cursor and arc-length table lookups."""
+    spline = fake_unreal.SplineComponent(spline_points_for(size), SPLINE_POINT_SPACING)
+    distances = list(spline.distances)
+    positions = list(spline.points)
+    directions = [(1.0, 0.0, 0.0)] * len(positions)
+    total = distances[-1]
+    queries = [total * i / size for i in range(size)]
+
+    def by_bisect():
+        for d in queries:
+            planner.sample_at_distance(d, distances, positions, directions)
+
+    def by_cursor():
+        cursor = planner.SplineCursor(distances, positions, directions)
+        for d in queries:
+            cursor.sample(d)
+
+    def by_table():
+        table = planner.ArcLengthTable(distances, positions, directions)
+        for d in queries:
+            table.sample(d)
+
+    measure(results, size, "-", "sample_bisect", by_bisect)
+    measure(results, size, "-", "sample_cursor", by_cursor)
+    measure(results, size, "-", "sample_table", by_table)
+    measure(results, size, "-", "sample_many", lambda: planner.sample_many(queries, distances, positions, directions))
+
+def bench_operations(results: list, size: int, mode: str, include_spline: bool, profile: bool = False):
+    """GetSplinePath, Generate, Apply (scale, then spacing) and Delete for one output mode."""
+    fake_unreal.reset_calls()
+    fake_unreal.register_asset(ASSET_PATH, ASSET_EXTENT)
+    spline_actor = fake_unreal.spawn_spline_actor(spline_points_for(size), SPLINE_POINT_SPACING)
+
+    win = make_window(mode, profile)
+    win.Selected_Spline = spline_actor
+    win.Selected_Splines = [spline_actor]
+    set_quantity(win, size)
+
+    if include_spline:
+        measure(results, size, "-", "GetSplinePath", win.GetSplinePath)
+    else:
+        win.GetSplinePath()
+
+    measure(results, size, mode, "Generate", win.Generate)
+    win.GenerationLogList.setCurrentRow(0)
+    if profile:
+        print(" " * 9 + planner.format_report("Generate", win.Logger.last_report, limit=8))
+
+    def apply_scale():
+        win.Asset_Parameters["SM_Bench"]["scale"] = [1.5, 1.5, 1.5]
+        win.Apply()
+
+    def apply_spacing():
+        win.Asset_Parameters["SM_Bench"]["spacing"] = SPACING * 2
+        win.Apply()
+
+    measure(results, size, mode, "Apply (scale)", apply_scale)
+    measure(results, size, mode, "Apply (spacing)", apply_spacing)
+    if profile:
+        print(" " * 9 + planner.format_report("Apply", win.Logger.last_report, limit=8))
+    measure(results, size, mode, "Delete", win.Delete)
+
+# ============================
+# Entry Point
+# ============================
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Asset Placer against a fake unreal module.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Placement counts")
+    parser.add_argument("--modes", nargs="+", default=list(DEFAULT_MODES), choices=DEFAULT_MODES, help="Output modes")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--profile", action="store_true", help="Print the per-phase profile of Generate/Apply")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'size':>8} {'mode':<10} {'scenario':<16} {'wall':>13} {'engine':>16}")
+    for size in args.sizes:
+        bench_sampling(results, size)
+        for i, mode in enumerate(args.modes):
+            bench_operations(results, size, mode, include_spline=(i == 0), profile=args.profile)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())